@@ -0,0 +1,92 @@
+"""
+File: S4O_Adaptive.py
+Description:
+Adaptive control of the number of concurrent SIMLA runs from the measured CPU load, free memory and I/O wait.
+The number of runs starts at the lower bound and is raised by one at a time while the computer has spare CPU
+capacity and memory, and lowered by one when it is saturated, also by other users, always within the bounds.
+Running analyses are never stopped; a lowered number only delays the start of the next run.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import time
+import psutil
+
+#	CPU load [%] that a new run must keep the computer below, leaving capacity for interactive work, and the
+#	CPU load [%] above which the number of runs is lowered
+S4O_ADAPTIVE_CPU_TARGET = 85.0
+S4O_ADAPTIVE_CPU_HIGH = 95.0
+
+#	I/O wait [%] below which a new run may be started, and above which the number of runs is lowered
+S4O_ADAPTIVE_IOWAIT_LOW = 10.0
+S4O_ADAPTIVE_IOWAIT_HIGH = 20.0
+
+#	Fraction of the total memory that is kept free
+S4O_ADAPTIVE_MEMORY_RESERVE = 0.10
+
+#	Time between the measurements [s], and number of measurements to wait after a change before raising again
+S4O_ADAPTIVE_INTERVAL = 5.0
+S4O_ADAPTIVE_SETTLE = 2
+
+class S4O_Adaptive_Concurrency:
+
+	#	Number of concurrent runs between minruns and maxruns, updated from the load measured every interval seconds
+	def __init__(self, minruns, maxruns):
+		self.minruns = max(minruns, 1)
+		self.maxruns = max(maxruns, self.minruns)
+		self.nslots = self.minruns
+		self.ncpus = psutil.cpu_count()
+		self.rssperrun = 0.0
+		self.lastsample = time.perf_counter()
+		self.lastchange = self.lastsample
+
+		#	Start the CPU time measurement
+		psutil.cpu_times_percent(interval=None)
+
+	def update(self, pids, waiting):
+		#	Return the number of concurrent runs, given the process ids of the runs in progress and whether
+		#	there are runs waiting to be started
+		now = time.perf_counter()
+		if now - self.lastsample < S4O_ADAPTIVE_INTERVAL: return self.nslots
+		self.lastsample = now
+
+		#	Measure CPU load and I/O wait (Linux only) since the last measurement, and available memory
+		cpu = psutil.cpu_times_percent(interval=None)
+		iowait = getattr(cpu, 'iowait', 0.0)
+		busy = 100.0 - cpu.idle - iowait
+		mem = psutil.virtual_memory()
+		reserve = S4O_ADAPTIVE_MEMORY_RESERVE*mem.total
+
+		#	Estimate the memory needed by a run from the largest average resident memory of the runs in progress
+		rss = 0
+		nruns = 0
+		for pid in pids:
+			try:
+				rss += psutil.Process(pid).memory_info().rss
+				nruns += 1
+			except (psutil.NoSuchProcess, psutil.AccessDenied):
+				pass
+		if nruns > 0: self.rssperrun = max(self.rssperrun, rss/nruns)
+
+		if mem.available < reserve or iowait > S4O_ADAPTIVE_IOWAIT_HIGH or busy > S4O_ADAPTIVE_CPU_HIGH:
+			#	Saturated, lower the number of runs
+			if self.nslots > self.minruns:
+				self.nslots -= 1
+				self.lastchange = now
+		elif (waiting and len(pids) >= self.nslots and now - self.lastchange >= S4O_ADAPTIVE_SETTLE*S4O_ADAPTIVE_INTERVAL and
+			  busy + 100.0/self.ncpus <= S4O_ADAPTIVE_CPU_TARGET and mem.available - self.rssperrun > reserve and
+			  iowait < S4O_ADAPTIVE_IOWAIT_LOW):
+			#	All slots are busy and there is room for one more run (using one CPU), raise the number of runs
+			if self.nslots < self.maxruns:
+				self.nslots += 1
+				self.lastchange = now
+
+		return self.nslots
+#
+#
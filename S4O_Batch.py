@@ -0,0 +1,288 @@
+"""
+File: S4O_Batch.py
+Description:
+Command line batch runner for SIMLA4OBS, which runs a model without the Streamlit dashboard:
+it reads a model file (.s4o), generates the SIMLA input files, executes the SIMLA runs, postprocesses
+them and writes the Results table (df_Results) to a CSV file.
+
+Usage:
+python S4O_Batch.py model.s4o [--simla-home DIR] [--max-concurrent N] [--adaptive MIN] [--pin] [--nice N]
+                              [--ionice {Normal,Low,Idle}] [--memory-max-gb GB] [--simulate] [--resume]
+                              [--synthetic SECONDS [--synthetic-cpu]]
+                              [--cache DIR] [--cache-max-gb GB] [--kill-on-convergence]
+                              [--run-timeout MIN] [--stall-timeout MIN] [--retries N]
+                              [--workers PORT [--key KEY] [--local-workers N]]
+                              [--no-generate] [--results FILE] [--verbose]
+
+The exit status is 0 if all runs were successful, 1 if one or more runs failed and 2 if the model
+could not be read.
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Batch; Added --synthetic and --synthetic-cpu, running the synthetic SIMLA (S4O_Synthetic) instead of SIMLA.
+2026-10-18: S4O_Batch; Prints the summary of the resource use of the runs from the run manifest (S4O_Telemetry).
+2026-10-18: S4O_Batch; Added --no-mpf. DYNPOST MPF is run after each successful SIMLA run by default.
+2026-10-18: S4O_Batch; Added --prune and --prune-min-mb, applying the retention policy (S4O_Retention) to the output files.
+2026-10-18: S4O_Batch; Added --scratch, running SIMLA in local scratch directories (S4O_Scratch).
+2026-10-18: S4O_Batch; With --no-generate, the number of DYNRES steps is assigned from the model without writing the input files, and the model is not run if it is 0.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import argparse
+import multiprocessing as mp
+import os
+import secrets
+import socket
+import sys
+import time
+from S4O_Product import S4O_Product_Defaults
+from S4O_Seabed import S4O_Seabed_Defaults
+from S4O_Environment import S4O_Environment_Defaults
+from S4O_Execution import S4O_Execution_Defaults
+from S4O_ModelFile import S4O_Parse_Model_File
+from S4O_Launcher import S4O_IONICE_OPTIONS, S4O_Executable_Path, S4O_Set_SIMLA_Environment
+from S4O_Scratch import S4O_SCRATCH_DIR
+from S4O_Telemetry import S4O_Read_Manifest, S4O_Manifest_Summary
+from S4O_SIMLA import S4O_Write_Input_Files, S4O_Assign_Run_Steps, S4O_Assign_Run_Config, S4O_Schedule_Runs, S4O_Store_Run_Status, S4O_Progress_Text
+
+class S4O_Batch_State(dict):
+
+	#	Model and application parameters, with the same attribute and "in" access as st.session_state
+	def __getattr__(self, name):
+		try:
+			return self[name]
+		except KeyError:
+			raise AttributeError(name)
+
+	def __setattr__(self, name, value):
+		self[name] = value
+#
+#
+
+def S4O_Batch_Initial_State(simla_home):
+
+	#	Assign the parameters set by SIMLA4OBS.main when the dashboard is started
+	state = S4O_Batch_State()
+	state.S4O_versionID = 'SIMLA4OBS version 1.2 / 2025'
+	state.modelMainTitle = ''
+	state.SIMLA_HOME = simla_home
+	state.SIMLA_EXE = S4O_Executable_Path(simla_home, 'simla')
+	state.DYNPOST_EXE = S4O_Executable_Path(simla_home, 'dynpost')
+	state.SIMLA_nstep_dynres = 0
+	state.CPU_count = mp.cpu_count()
+	state.maxRunsPB = max(int(state.CPU_count/2), 1)
+	state.AdaptiveRuns = False
+	state.minRunsPB = 1
+	state.PinRuns = False
+	state.RunNice = 0
+	state.RunIONice = 0
+	state.RunMemoryMaxGB = 0.0
+	state.noRunsExecuted = 0
+	state.noRunsPostprocessed = 0
+	state.stdtolRunNumber = 0
+	state.listOfSeedNumbers = []
+	state.SimulateRuns = False
+	state.SyntheticRuns = False
+	state.SyntheticRunTime = 20.0
+	state.SyntheticLoad = 'Sleep'
+	state.RunDYNPOSTMPF = True
+	state.ExtendedPrint = False
+	state.ResumeRuns = False
+	state.UseResultCache = False
+	state.ResultCacheDir = os.path.expanduser('~') + '/.simla4obs/cache'
+	state.ResultCacheMaxGB = 20.0
+	state.ScratchRuns = False
+	state.ScratchDir = S4O_SCRATCH_DIR
+	state.RetentionPolicy = 'Keep all'
+	state.RetentionMinMB = 1.0
+	state.KillOnConvergence = False
+	state.RunTimeoutMin = 0.0
+	state.StallTimeoutMin = 0.0
+	state.RunRetries = 1
+	state.DistributedRuns = False
+	state.DistributedPort = 50505
+	state.DistributedKey = secrets.token_hex(8)
+	state.LocalWorkers = 0
+	state.ResultsCalculated = False
+
+	#	Values of the options in the selectboxes, as in SIMLA4OBS.main
+	state.SeabedValues = [1, 2, 3, 4, 5, 6]
+	state.PenetrationValues = [1, 2]
+	state.WaveSpectraValues = [1, 2]
+	state.WaveSpreadingValues = ['long', 'short']
+
+	#	Assign default values
+	S4O_Product_Defaults(state)
+	S4O_Seabed_Defaults(state)
+	S4O_Environment_Defaults(state)
+	S4O_Execution_Defaults(state)
+
+	return state
+#
+#
+
+def S4O_Batch_Report(status, level, text):
+
+	#	Print messages from S4O_Schedule_Runs, and the progress when a run has finished or every minute
+	if level == 'status':
+		if status['ndone'] != status.get('ndoneReported', -1) or time.perf_counter() - status.get('timeReported', 0.0) >= 60.0:
+			status['ndoneReported'] = status['ndone']
+			status['timeReported'] = time.perf_counter()
+			print('Progress : ' + S4O_Progress_Text(status), flush=True)
+	elif level == 'error':
+		print('ERROR : ' + text, file=sys.stderr, flush=True)
+	elif level == 'warning':
+		print('WARNING : ' + text, file=sys.stderr, flush=True)
+	else:
+		print(text, flush=True)
+
+	return
+#
+#
+
+def S4O_Batch(argv=None):
+
+	#	Parse the command line arguments
+	parser = argparse.ArgumentParser(prog='S4O_Batch', description='Run a SIMLA4OBS model (.s4o) without the Streamlit dashboard.')
+	parser.add_argument('model', help='SIMLA4OBS model file (.s4o)')
+	parser.add_argument('--simla-home', default=os.environ.get('SIMLA_HOME', 'C:/SINTEFOcean/SIMLA/SIMLA-3.25.0-win64'),
+						help='SIMLA installation directory (default: $SIMLA_HOME)')
+	parser.add_argument('--max-concurrent', type=int, default=0,
+						help='maximum number of concurrent runs (default: the value in the model file)')
+	parser.add_argument('--adaptive', type=int, default=0, metavar='MIN',
+						help='adapt the number of concurrent runs to the load on the computer, between MIN and the maximum')
+	parser.add_argument('--pin', action='store_true', help='pin each run to its own physical core')
+	parser.add_argument('--nice', type=int, default=0, choices=range(0, 20), metavar='0-19', help='CPU priority (nice level) of the runs')
+	parser.add_argument('--ionice', default='Normal', choices=S4O_IONICE_OPTIONS, help='disk priority of the runs')
+	parser.add_argument('--memory-max-gb', type=float, default=0.0, metavar='GB', help='memory limit per run (Linux with systemd)')
+	parser.add_argument('--simulate', action='store_true', help='simulate the SIMLA runs with the sleep command')
+	parser.add_argument('--synthetic', type=float, default=0.0, metavar='SECONDS',
+						help='run the synthetic SIMLA (S4O_Synthetic.py) for about SECONDS per run instead of SIMLA, writing synthetic results')
+	parser.add_argument('--synthetic-cpu', action='store_true', help='keep one CPU busy in each synthetic run instead of sleeping')
+	parser.add_argument('--no-mpf', action='store_true', help='do not run DYNPOST MPF after each SIMLA run')
+	parser.add_argument('--resume', action='store_true', help='skip runs already completed with the current input')
+	parser.add_argument('--cache', default='', metavar='DIR', help='use the result cache in DIR')
+	parser.add_argument('--cache-max-gb', type=float, default=20.0, help='maximum size of the result cache [GB]')
+	parser.add_argument('--scratch', default='', metavar='DIR',
+						help='run SIMLA in scratch directories under DIR on a local disk, copying the results back to the model directory')
+	parser.add_argument('--prune', default='', choices=['compress', 'delete'],
+						help='compress or delete the output files of successful runs not needed by SIMLA4OBS (default: keep all)')
+	parser.add_argument('--prune-min-mb', type=float, default=1.0, metavar='MB', help='only prune output files of at least this size [MB] (default: 1)')
+	parser.add_argument('--kill-on-convergence', action='store_true',
+						help='stop running analyses when the standard deviation tolerance is reached')
+	parser.add_argument('--run-timeout', type=float, default=0.0, metavar='MIN', help='maximum wall-clock time per run [min] (default: no limit)')
+	parser.add_argument('--stall-timeout', type=float, default=0.0, metavar='MIN', help='maximum time without progress per run [min] (default: no limit)')
+	parser.add_argument('--retries', type=int, default=1, metavar='N', help='number of retries of a failed run (default: 1)')
+	parser.add_argument('--workers', type=int, default=0, metavar='PORT',
+						help='distribute the runs to the workers connecting to PORT (see S4O_Distributed.py)')
+	parser.add_argument('--key', default='', help='key shared with the workers (default: a random key, which is printed)')
+	parser.add_argument('--local-workers', type=int, default=0, metavar='N', help='number of worker slots started on this machine')
+	parser.add_argument('--no-generate', action='store_true', help='use the existing input files')
+	parser.add_argument('--results', default='', metavar='FILE',
+						help='CSV file for the Results table (default: results.csv in the model directory)')
+	parser.add_argument('--verbose', action='store_true', help='extended print')
+	args = parser.parse_args(argv)
+
+	#	Assign the model path, directory and name as when opening the model in the dashboard
+	file_path = os.path.abspath(args.model)
+	if not os.path.exists(file_path):
+		print('ERROR : Model file does not exist : ' + file_path, file=sys.stderr)
+		return 2
+
+	S4O_Set_SIMLA_Environment(args.simla_home)
+	state = S4O_Batch_Initial_State(args.simla_home)
+	state.modelFilePath = file_path
+	state.modelFileDir = os.path.dirname(file_path)
+	state.modelFileName = os.path.splitext(os.path.basename(file_path))[0]
+
+	#	Read the model file
+	errors = S4O_Parse_Model_File(file_path, state)
+	if len(errors) > 0:
+		for error in errors:
+			print('ERROR : ' + error, file=sys.stderr)
+		return 2
+
+	#	Assign the execution options
+	if args.max_concurrent > 0: state.maxRunsPB = args.max_concurrent
+	if args.adaptive > 0:
+		state.AdaptiveRuns = True
+		state.minRunsPB = min(args.adaptive, state.maxRunsPB)
+	state.PinRuns = args.pin
+	state.RunNice = args.nice
+	state.RunIONice = S4O_IONICE_OPTIONS.index(args.ionice)
+	state.RunMemoryMaxGB = args.memory_max_gb
+	state.SimulateRuns = args.simulate
+	state.SyntheticRuns = args.synthetic > 0.0
+	state.SyntheticRunTime = args.synthetic
+	if args.synthetic_cpu: state.SyntheticLoad = 'CPU'
+	state.RunDYNPOSTMPF = not args.no_mpf
+	state.ResumeRuns = args.resume
+	state.UseResultCache = args.cache != ''
+	if state.UseResultCache: state.ResultCacheDir = os.path.abspath(args.cache)
+	state.ResultCacheMaxGB = args.cache_max_gb
+	if args.scratch != '':
+		state.ScratchRuns = True
+		state.ScratchDir = os.path.abspath(args.scratch)
+	if args.prune != '': state.RetentionPolicy = args.prune.capitalize()
+	state.RetentionMinMB = args.prune_min_mb
+	state.KillOnConvergence = args.kill_on_convergence
+	state.RunTimeoutMin = args.run_timeout
+	state.StallTimeoutMin = args.stall_timeout
+	state.RunRetries = args.retries
+	state.ExtendedPrint = args.verbose
+	if args.workers > 0:
+		state.DistributedRuns = True
+		state.DistributedPort = args.workers
+		if args.key != '': state.DistributedKey = args.key
+		state.LocalWorkers = args.local_workers
+		print('Workers connect with : python S4O_Distributed.py ' + socket.gethostname() + ':' + str(args.workers) + ' --key ' + state.DistributedKey)
+
+	nrunsmax = int(state.df_Execution.iloc[3,1])
+	mod_path = state.modelFileDir + "/" + state.modelFileName
+	print(state.S4O_versionID + ' : ' + state.modelMainTitle)
+
+	#	Generate the input files
+	if not args.no_generate:
+		print('Generating SIMLA input files for runs 1 to ' + str(nrunsmax) + ' in : ' + mod_path)
+		S4O_Write_Input_Files(state, mod_path, 1, nrunsmax)
+	else:
+		S4O_Assign_Run_Steps(state)
+	if state.SIMLA_nstep_dynres <= 0 and not state.SimulateRuns:
+		print('ERROR : The number of DYNRES steps of the model is 0. Check the duration and time step size.', file=sys.stderr)
+		return 2
+
+	#	Execute and postprocess the SIMLA runs
+	if state.SimulateRuns and not state.DistributedRuns:
+		print('Simulating SIMLA runs 1 to ' + str(nrunsmax) + ' with the sleep command, ' + str(min(state.maxRunsPB, nrunsmax)) + ' at a time!')
+	elif state.SyntheticRuns and not state.DistributedRuns:
+		print('Running the synthetic SIMLA for runs 1 to ' + str(nrunsmax) + ', ' + str(min(state.maxRunsPB, nrunsmax)) + ' at a time!')
+	elif not state.DistributedRuns:
+		print('Executing SIMLA runs 1 to ' + str(nrunsmax) + ', ' + str(min(state.maxRunsPB, nrunsmax)) + ' at a time.')
+	status = S4O_Schedule_Runs(S4O_Assign_Run_Config(state), 1, nrunsmax, S4O_Batch_Report)
+	S4O_Store_Run_Status(state, status)
+	print('All SIMLA runs 1 to ' + str(nrunsmax) + ' have finished. Total elapsed wall-clock time : ' + str(int(status['elapsed'])) + ' seconds.')
+	for description, value in S4O_Manifest_Summary(S4O_Read_Manifest(mod_path)):
+		print('   ' + description + ' ' + value)
+
+	#	Write the Results table
+	results_path = args.results
+	if results_path == '': results_path = mod_path + '/results.csv'
+	state.df_Results.to_csv(results_path, index=False)
+	print('Results written to : ' + results_path)
+	if state.df_Results.empty:
+		print('WARNING : No results, the Results table is empty.', file=sys.stderr)
+	elif not state.ResultsCalculated:
+		print('WARNING : The Results table does not include all runs.', file=sys.stderr)
+
+	if len(status['failed']) > 0: return 1
+
+	return 0
+#
+#
+
+if __name__ == '__main__':
+	sys.exit(S4O_Batch())
@@ -0,0 +1,103 @@
+"""
+File: S4O_Cache.py
+Description:
+These functions maintain a content-addressed cache of SIMLA results, shared across models. Each entry is a directory
+named by the input hash of the run (S4O_RunHash) holding the result files, and the least recently used entries are
+evicted when the cache grows beyond its size limit.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import shutil
+import tempfile
+
+#	Result files stored in the cache for each run
+S4O_CACHE_FILES = ['s.dyn', 's.slf']
+
+def S4O_Cache_Fetch(cache_dir, runhash, run_path):
+
+	#	Hard-link (or copy, if linking is not possible) the cached result files for runhash into the run
+	#	directory. Return True if the results were found in the cache.
+	entry = cache_dir + '/' + runhash
+	for name in S4O_CACHE_FILES:
+		if not os.path.exists(entry + '/' + name): return False
+
+	S4O_Cache_Unlink(run_path)
+	for name in S4O_CACHE_FILES:
+		try:
+			os.link(entry + '/' + name, run_path + '/' + name)
+		except OSError:
+			shutil.copy2(entry + '/' + name, run_path + '/' + name)
+
+	#	Mark the entry as recently used
+	os.utime(entry)
+
+	return True
+#
+#
+
+def S4O_Cache_Store(cache_dir, runhash, run_path, maxbytes):
+
+	#	Store the result files of a successful run in the cache under runhash, and evict the least recently
+	#	used entries if the cache has grown beyond maxbytes
+	entry = cache_dir + '/' + runhash
+	if os.path.exists(entry): return
+
+	#	Copy the files to a temporary directory first and rename it, so that a partly stored entry is never seen
+	os.makedirs(cache_dir, exist_ok=True)
+	tmp_path = tempfile.mkdtemp(prefix='tmp-', dir=cache_dir)
+	for name in S4O_CACHE_FILES:
+		shutil.copy2(run_path + '/' + name, tmp_path + '/' + name)
+	try:
+		os.rename(tmp_path, entry)
+	except OSError:
+		#	Another process stored the same entry in the meantime
+		shutil.rmtree(tmp_path, ignore_errors=True)
+
+	S4O_Cache_Evict(cache_dir, maxbytes)
+
+	return
+#
+#
+
+def S4O_Cache_Evict(cache_dir, maxbytes):
+
+	#	Delete the least recently used entries until the total size of the cache is at most maxbytes
+	entries = []
+	totbytes = 0
+	for name in os.listdir(cache_dir):
+		entry = cache_dir + '/' + name
+		if name.startswith('tmp-') or not os.path.isdir(entry): continue
+		nbytes = 0
+		for fname in os.listdir(entry):
+			nbytes += os.path.getsize(entry + '/' + fname)
+		entries.append((os.path.getmtime(entry), nbytes, entry))
+		totbytes += nbytes
+
+	entries.sort()
+	for mtime, nbytes, entry in entries:
+		if totbytes <= maxbytes: break
+		shutil.rmtree(entry, ignore_errors=True)
+		totbytes -= nbytes
+
+	return
+#
+#
+
+def S4O_Cache_Unlink(run_path):
+
+	#	Remove the result files from the run directory before a new run is started or results are fetched, so
+	#	that SIMLA never writes into a file that is hard-linked to a cache entry
+	for name in S4O_CACHE_FILES:
+		if os.path.exists(run_path + '/' + name): os.remove(run_path + '/' + name)
+
+	return
+#
+#
@@ -0,0 +1,332 @@
+"""
+File: S4O_Distributed.py
+Description:
+Coordinator and worker for running the SIMLA analyses of a model on several machines.
+
+The coordinator is started by S4O_Schedule_Runs and listens on a TCP port. Workers connect to it with one
+connection per slot (concurrent run), fetch the input files of a realisation, run SIMLA in a temporary
+directory and send the result files (s.dyn, s.slf, simla_print.out) back. Workers may connect and disconnect
+at any time during the execution; the run of a worker that disconnects is given to the next free slot.
+All messages are authenticated with a shared key (multiprocessing.connection).
+
+Start a worker on another machine with:
+python S4O_Distributed.py HOST:PORT --key KEY --simla-home DIR [--slots N]
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Worker_Run; Stops a cancelled run with all its child processes.
+2026-10-18: S4O_Remote_Process, S4O_Coordinator; Added host, returning the host name of the worker of a run.
+2026-10-18: S4O_Worker_Run; Runs the synthetic SIMLA (S4O_Synthetic) when selected by the coordinator.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import argparse
+import multiprocessing as mp
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Listener, Client
+from S4O_Launcher import S4O_Executable_Path, S4O_Kill_Process_Tree, S4O_Launch_Process, S4O_Set_SIMLA_Environment, S4O_Sleep_Args
+from S4O_Cache import S4O_CACHE_FILES
+from S4O_Synthetic import S4O_Synthetic_Args
+
+#	Files sent back from the workers, in addition to the files stored in the result cache
+S4O_REMOTE_RESULT_FILES = S4O_CACHE_FILES + ['simla_print.out']
+
+class S4O_Remote_Process:
+
+	#	Handle for a run submitted to the coordinator, with the poll, wait and kill methods of the
+	#	subprocess.Popen objects used for local runs
+	def __init__(self, coordinator, jobid, args):
+		self.coordinator = coordinator
+		self.jobid = jobid
+		self.args = args
+		self.returncode = None
+
+	def poll(self):
+		if self.returncode is None: self.returncode = self.coordinator.returncode(self.jobid)
+		return self.returncode
+
+	def wait(self):
+		while self.poll() is None: time.sleep(0.5)
+		return self.returncode
+
+	def kill(self):
+		self.coordinator.cancel(self.jobid)
+		return
+
+	def host(self):
+		return self.coordinator.host(self.jobid)
+#
+#
+
+class S4O_Coordinator:
+
+	#	Listen for workers on port and hand out the submitted runs to them
+	def __init__(self, port, key):
+		self.port = port
+		self.key = key.encode()
+		self.listener = Listener(('', port), authkey=self.key)
+		self.cond = threading.Condition()
+		self.jobs = {}
+		self.pending = []
+		self.nextid = 1
+		self.nslots = 0
+		self.closed = False
+		threading.Thread(target=self.accept_workers, daemon=True).start()
+
+	def accept_workers(self):
+		#	Accept worker connections until the coordinator is closed, serving each in a separate thread
+		while True:
+			try:
+				conn = self.listener.accept()
+			except (OSError, EOFError, mp.AuthenticationError):
+				if self.closed: return
+				continue
+			if self.closed:
+				conn.close()
+				return
+			threading.Thread(target=self.serve_worker, args=(conn,), daemon=True).start()
+
+	def serve_worker(self, conn):
+		#	Give the pending runs to the worker slot on conn one at a time, until the coordinator is closed or the
+		#	worker disconnects. The run in progress on a disconnected worker is put back first in the queue.
+		jobid = None
+		counted = False
+		try:
+			msg = conn.recv()
+			if msg[0] != 'hello': return
+			host = msg[1]
+			with self.cond:
+				self.nslots += 1
+				counted = True
+
+			while True:
+				msg = conn.recv()
+				if msg[0] != 'ready': return
+				jobid = self.next_job(host)
+				if jobid is None:
+					conn.send(('stop',))
+					return
+				job = self.jobs[jobid]
+				conn.send(('job', jobid, job['files'], job['spec']))
+
+				#	Wait for the result, and tell the worker if the run is cancelled in the meantime
+				cancelsent = False
+				while True:
+					if conn.poll(0.5):
+						msg = conn.recv()
+						if msg[0] == 'result':
+							self.finish(jobid, msg[2], msg[3])
+							jobid = None
+							break
+					elif job['cancelled'] and not cancelsent:
+						conn.send(('cancel', jobid))
+						cancelsent = True
+		except (OSError, EOFError):
+			pass
+		finally:
+			with self.cond:
+				if counted: self.nslots -= 1
+				if jobid is not None: self.requeue(jobid)
+			conn.close()
+
+	def next_job(self, host):
+		#	Wait for a pending run and return its id, or None if the coordinator is closed
+		with self.cond:
+			while len(self.pending) == 0 and not self.closed: self.cond.wait(0.5)
+			if self.closed: return None
+			jobid = self.pending.pop(0)
+			self.jobs[jobid]['host'] = host
+			return jobid
+
+	def requeue(self, jobid):
+		#	Put a run that was lost with its worker back first in the queue (called with self.cond held)
+		job = self.jobs[jobid]
+		if not job['cancelled'] and job['returncode'] is None:
+			job['host'] = ''
+			self.pending.insert(0, jobid)
+			self.cond.notify_all()
+
+	def finish(self, jobid, returncode, files):
+		#	Store the result files in the run directory and the return code of a finished run
+		job = self.jobs[jobid]
+		if job['cancelled']: return
+		for name in files:
+			with open(os.path.join(job['run_path'], name), 'wb') as f:
+				f.write(files[name])
+		with self.cond:
+			job['returncode'] = returncode
+
+	def submit(self, run_path, input_files, spec, args):
+		#	Queue a run with the given input files from run_path. spec is passed on to S4O_Worker_Run.
+		files = {}
+		for name in input_files:
+			fname = os.path.join(run_path, name)
+			if os.path.exists(fname):
+				with open(fname, 'rb') as f:
+					files[name] = f.read()
+		with self.cond:
+			jobid = self.nextid
+			self.nextid += 1
+			self.jobs[jobid] = {'run_path': run_path, 'files': files, 'spec': spec, 'host': '', 'cancelled': False, 'returncode': None}
+			self.pending.append(jobid)
+			self.cond.notify_all()
+
+		return S4O_Remote_Process(self, jobid, args)
+
+	def returncode(self, jobid):
+		with self.cond:
+			return self.jobs[jobid]['returncode']
+
+	def host(self, jobid):
+		#	Return the host name of the worker running (or that ran) the run, '' if not started
+		with self.cond:
+			return self.jobs[jobid]['host']
+
+	def cancel(self, jobid):
+		#	Cancel a queued run, or stop it on the worker if it has started
+		with self.cond:
+			job = self.jobs[jobid]
+			job['cancelled'] = True
+			if jobid in self.pending: self.pending.remove(jobid)
+			if job['returncode'] is None: job['returncode'] = -9
+
+	def slots(self):
+		#	Return the number of worker slots connected
+		with self.cond:
+			return self.nslots
+
+	def close(self):
+		#	Tell the connected workers to stop, and stop listening
+		with self.cond:
+			self.closed = True
+			self.cond.notify_all()
+		try:
+			Client(('localhost', self.port), authkey=self.key).close()
+		except (OSError, EOFError, mp.AuthenticationError):
+			pass
+		self.listener.close()
+#
+#
+
+def S4O_Start_Local_Workers(port, key, simla_home, nslots):
+
+	#	Start a worker process on this machine with nslots slots, connecting to the coordinator on port. The
+	#	worker stops when the coordinator is closed. Return the subprocess, or None if nslots is 0.
+	if nslots <= 0: return None
+	args = [sys.executable, os.path.abspath(__file__), 'localhost:' + str(port), '--key', key,
+			'--simla-home', simla_home, '--slots', str(nslots), '--once']
+	p = S4O_Launch_Process(args, os.path.dirname(os.path.abspath(__file__)), '')
+
+	return p
+#
+#
+
+def S4O_Worker_Run(conn, files, spec, simla_exe):
+
+	#	Run SIMLA in a temporary directory with the input files received from the coordinator, and return the
+	#	return code and the result files. The run is stopped if the coordinator cancels it.
+	run_path = tempfile.mkdtemp(prefix='s4o-')
+	try:
+		for name in files:
+			with open(os.path.join(run_path, name), 'wb') as f:
+				f.write(files[name])
+
+		if spec['SimulateRuns']:
+			p = S4O_Launch_Process(S4O_Sleep_Args(spec['sleep']), run_path, '')
+		elif spec.get('synthetic') is not None:
+			p = S4O_Launch_Process(S4O_Synthetic_Args('simla', *spec['synthetic']) + spec['args'], run_path, 'simla_print.out')
+		else:
+			p = S4O_Launch_Process([simla_exe] + spec['args'], run_path, 'simla_print.out')
+
+		while p.poll() is None:
+			if conn.poll(0.5):
+				msg = conn.recv()
+				if msg[0] == 'cancel': S4O_Kill_Process_Tree(p)
+
+		results = {}
+		for name in S4O_REMOTE_RESULT_FILES:
+			fname = os.path.join(run_path, name)
+			if os.path.exists(fname):
+				with open(fname, 'rb') as f:
+					results[name] = f.read()
+	finally:
+		shutil.rmtree(run_path, ignore_errors=True)
+
+	return p.returncode, results
+#
+#
+
+def S4O_Worker_Slot(address, key, simla_exe, once):
+
+	#	Connect to the coordinator and run the SIMLA runs it hands out, one at a time. Unless once is True, the
+	#	slot connects again when the coordinator stops, so the worker can serve the next execution as well.
+	while True:
+		try:
+			conn = Client(address, authkey=key)
+		except (OSError, EOFError, mp.AuthenticationError):
+			if once: return
+			time.sleep(5.0)
+			continue
+
+		try:
+			conn.send(('hello', socket.gethostname()))
+			while True:
+				conn.send(('ready',))
+				msg = conn.recv()
+				if msg[0] != 'job': break
+				returncode, results = S4O_Worker_Run(conn, msg[2], msg[3], simla_exe)
+				conn.send(('result', msg[1], returncode, results))
+		except (OSError, EOFError):
+			pass
+		conn.close()
+
+		if once: return
+		time.sleep(5.0)
+#
+#
+
+def S4O_Worker(argv=None):
+
+	#	Parse the command line arguments
+	parser = argparse.ArgumentParser(prog='S4O_Distributed', description='Run SIMLA analyses for a SIMLA4OBS coordinator.')
+	parser.add_argument('coordinator', metavar='HOST:PORT', help='host name and port of the coordinator')
+	parser.add_argument('--key', required=True, help='key shared with the coordinator')
+	parser.add_argument('--simla-home', default=os.environ.get('SIMLA_HOME', 'C:/SINTEFOcean/SIMLA/SIMLA-3.25.0-win64'),
+						help='SIMLA installation directory (default: $SIMLA_HOME)')
+	parser.add_argument('--slots', type=int, default=max(int(mp.cpu_count()/2), 1), help='number of concurrent runs (default: half the number of CPUs)')
+	parser.add_argument('--once', action='store_true', help='stop when the coordinator stops, instead of waiting for the next execution')
+	args = parser.parse_args(argv)
+
+	host, port = args.coordinator.rsplit(':', 1)
+	address = (host, int(port))
+	S4O_Set_SIMLA_Environment(args.simla_home)
+	simla_exe = S4O_Executable_Path(args.simla_home, 'simla')
+
+	#	Run each slot in a separate thread
+	slots = []
+	for islot in range(args.slots):
+		slot = threading.Thread(target=S4O_Worker_Slot, args=(address, args.key.encode(), simla_exe, args.once), daemon=True)
+		slot.start()
+		slots.append(slot)
+
+	try:
+		for slot in slots: slot.join()
+	except KeyboardInterrupt:
+		pass
+
+	return 0
+#
+#
+
+if __name__ == '__main__':
+	sys.exit(S4O_Worker())
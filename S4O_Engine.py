@@ -0,0 +1,126 @@
+"""
+File: S4O_Engine.py
+Description:
+Background execution engine. An execution (e.g. S4O_Schedule_Runs for all realisations of a model) runs in a thread
+of the SIMLA4OBS server process instead of the Streamlit script thread, so the dashboard stays responsive and the
+execution continues when the page is rerun or the browser is refreshed. The executions are kept in a registry keyed
+by the model directory, where any session (also a new one) finds them again to show the progress or cancel them.
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Engine_Job; Added label describing the execution, and keeps a copy of the state of each run reported in the status.
+2026-10-18: S4O_Engine_Job; Keeps a copy of the statistics of each group of runs reported in the status.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import atexit
+import threading
+import time
+
+#	Executions submitted in this process, keyed by model directory, and the lock protecting the registry
+S4O_ENGINE_JOBS = {}
+S4O_ENGINE_LOCK = threading.Lock()
+
+#	Time to wait for the executions to stop their runs when the process exits [s]
+S4O_ENGINE_EXIT_TIMEOUT = 30.0
+
+class S4O_Engine_Job:
+
+	#	Execution of target(*args, report, cancel) in a background thread. target reports through
+	#	report(status, level, text) as S4O_Schedule_Runs, and stops its runs when the event cancel is set.
+	#	The messages and a copy of the last status are kept, so they can be shown by any session.
+	#	label describes the execution in messages, e.g. 'the model C:/Models/case'.
+	nextid = 1
+
+	def __init__(self, target, args, label):
+		self.jobid = S4O_Engine_Job.nextid
+		S4O_Engine_Job.nextid += 1
+		self.target = target
+		self.args = args
+		self.label = label
+		self.lock = threading.Lock()
+		self.messages = []
+		self.status = None
+		self.result = None
+		self.cancelevent = threading.Event()
+		self.started = time.time()
+		self.thread = threading.Thread(target=self.run, daemon=True)
+
+	def run(self):
+		try:
+			self.result = self.target(*self.args, self.report, self.cancelevent)
+		except Exception as e:
+			self.report(None, 'error', 'The execution stopped unexpectedly : ' + str(e))
+
+	def report(self, status, level, text):
+		#	Store a message, or a copy of the status, as reported by the execution
+		with self.lock:
+			if level == 'status':
+				self.status = dict(status)
+				self.status['stats'] = {key: list(status['stats'][key]) for key in status['stats']}
+				if 'runs' in status: self.status['runs'] = {irun: dict(status['runs'][irun]) for irun in status['runs']}
+				if 'groupstats' in status: self.status['groupstats'] = [dict(stats) for stats in status['groupstats']]
+			else:
+				self.messages.append((level, text))
+		return
+
+	def snapshot(self):
+		#	Return the last status reported (None if none yet) and the list of messages
+		with self.lock:
+			return self.status, list(self.messages)
+
+	def running(self):
+		return self.thread.is_alive()
+
+	def cancel(self):
+		self.cancelevent.set()
+		return
+#
+#
+
+def S4O_Engine_Submit(key, job):
+
+	#	Register job under key (the model directory) and start it. Return False, without starting job, if an
+	#	execution is already running under key.
+	with S4O_ENGINE_LOCK:
+		if key in S4O_ENGINE_JOBS and S4O_ENGINE_JOBS[key].running(): return False
+		S4O_ENGINE_JOBS[key] = job
+		job.thread.start()
+
+	return True
+#
+#
+
+def S4O_Engine_Job_For(key):
+
+	#	Return the last execution submitted under key, or None
+	with S4O_ENGINE_LOCK:
+		return S4O_ENGINE_JOBS.get(key)
+#
+#
+
+def S4O_Engine_Running():
+
+	#	Return a dictionary of the executions in progress, keyed by model directory
+	with S4O_ENGINE_LOCK:
+		return {key: S4O_ENGINE_JOBS[key] for key in S4O_ENGINE_JOBS if S4O_ENGINE_JOBS[key].running()}
+#
+#
+
+def S4O_Engine_Shutdown():
+
+	#	Cancel the executions in progress and wait for them to stop their runs, so no SIMLA processes are left
+	#	running when the SIMLA4OBS server stops
+	jobs = S4O_Engine_Running()
+	for key in jobs: jobs[key].cancel()
+	for key in jobs: jobs[key].thread.join(S4O_ENGINE_EXIT_TIMEOUT)
+
+	return
+#
+#
+
+atexit.register(S4O_Engine_Shutdown)
@@ -3,12 +3,12 @@ File: S4O_Environment.py
 Description:
 These functions initiates and updates the df_Environment pandas dataframe.
 Revisions:
-YYYY-MM-DD:
+2026-10-18: S4O_Environment_Defaults; Takes the state to assign the defaults in as argument (st.session_state by default), for use without Streamlit.
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-03-14"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -103,10 +103,10 @@ def S4O_Environment():
 # ENVIRONMENT set defaults function
 #
 
-def S4O_Environment_Defaults():
+def S4O_Environment_Defaults(state=st.session_state):
 
 	#	Assign default environmental parameters
-	if 'df_Environment' not in st.session_state:
+	if 'df_Environment' not in state:
 		WD = 50.0
 		Hs = 12.0
 		Tp = 14.0
@@ -130,11 +130,11 @@ def S4O_Environment_Defaults():
 		     ['Number of directions [-] :', Ndir], ['Spreading function exponent [-] :', Sexp],
 		     ['Current velocity [m/s] :', Cvel], ['Current direction [deg] :', Cdir],
 		     ['Reference point [m] :', Crefp], ['Seabed roughness [m] :', Csrou], ['Median grain size [m] :', Cmgsz]]
-	st.session_state.df_Environment = pd.DataFrame(Edata, columns=['Environmental parameter','Value'])
+	state.df_Environment = pd.DataFrame(Edata, columns=['Environmental parameter','Value'])
 
-	st.session_state.Environment_OK = True
+	state.Environment_OK = True
 
-	return st.session_state.df_Environment,st.session_state.Environment_OK
+	return state.df_Environment,state.Environment_OK
 #
 #
 
@@ -3,19 +3,46 @@ File: S4O_Execution.py
 Description:
 These functions initiates and updates the df_Execution pandas dataframe, runs SIMLA executions and reads and processes results.
 Revisions:
-YYYY-MM-DD:
+2026-10-18: S4O_Execution; Renamed "Maximum number of runs per block" to "Maximum number of concurrent runs" and removed the block count.
+2026-10-18: S4O_Execution; Added check box for stopping running analyses when the standard deviation tolerance is reached.
+2026-10-18: S4O_Execution; Added "Resume" check box.
+2026-10-18: S4O_Execution; Added "Use result cache" check box with cache directory and size limit.
+2026-10-18: S4O_Execution; Added "Distribute runs to workers" check box with coordinator port, worker key and number of local worker slots.
+2026-10-18: S4O_Execution; Added check box for adapting the number of concurrent runs to the load, with a minimum number of concurrent runs.
+2026-10-18: S4O_Execution; Added pinning of the runs to physical cores, CPU and disk priority, and memory limit per run.
+2026-10-18: S4O_Execution; Added wall-clock and no-progress time limits per run, and number of retries of failed runs.
+2026-10-18: S4O_Execution; Shows the progress of the runs in the background execution engine, which continue when the page is changed or refreshed.
+2026-10-18: S4O_Show_Queue; New function adding models to the job queue (S4O_Queue), showing the queue and the state of the runs, and reordering or cancelling the queued models.
+2026-10-18: S4O_Execution; Added "Synthetic SIMLA" check box with run time and load of the synthetic runs.
+2026-10-18: S4O_Show_Sweep; New function defining and running a parametric sweep (S4O_Sweep) of the current model, and showing the consolidated results of the cases.
+2026-10-18: S4O_Show_Mass_Search; New function searching for the minimum stable submerged mass (S4O_Mass_Search) of the current model, and showing the candidate masses of each round.
+2026-10-18: S4O_Execution_Defaults; Takes the state to assign the defaults in as argument (st.session_state by default), for use without Streamlit.
+2026-10-18: S4O_Show_Telemetry; New function showing the resource use and throughput of the runs of the last execution, from the run manifest (S4O_Telemetry).
+2026-10-18: S4O_Execution; Added "Run DYNPOST MPF after each run" check box.
+2026-10-18: S4O_Execution; Added the retention policy of the output files of successful runs, with the minimum size of the pruned files.
+2026-10-18: S4O_Execution; Added "Run in local scratch directory" check box with the scratch directory.
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-06-02"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
 import pandas as pd
 import streamlit as st
 import os
+import time
 from S4O_SIMLA import *
+from S4O_Queue import S4O_QUEUE_OPTIONS, S4O_QUEUE_ENGINE_KEY, S4O_Queue_Add, S4O_Queue_Models, S4O_Queue_Runs, S4O_Queue_Move, S4O_Queue_Cancel, S4O_Queue_Clear, S4O_Queue_Start
+from S4O_Engine import S4O_Engine_Job, S4O_Engine_Job_For, S4O_Engine_Submit
+from S4O_Mass_Search import S4O_Design_Value, S4O_Mass_Search_Table, S4O_Run_Mass_Search
+from S4O_Sweep import S4O_SWEEP_MODES, S4O_Sweep_Parameters, S4O_Sweep_Parameter, S4O_Sweep_Cases, S4O_Sweep_Table, S4O_Write_Sweep_Input_Files, S4O_Run_Sweep
+from S4O_Adaptive import S4O_ADAPTIVE_CPU_TARGET
+from S4O_Launcher import S4O_IONICE_OPTIONS
+from S4O_Synthetic import S4O_SYNTHETIC_LOADS
+from S4O_Retention import S4O_RETENTION_POLICIES
+from S4O_Telemetry import S4O_Read_Manifest, S4O_Manifest_Summary, S4O_Manifest_Table
 
 #
 #	EXECUTION input function
@@ -69,32 +96,106 @@ def S4O_Execution():
 	st.write("---")
 	st.subheader('Run parameters')
 	st.info('Maximum number of CPUs available on computer : ' + str(st.session_state.CPU_count))
-	help_text = 'Specify a value between 1 and maximum number of CPUs available (' + str(st.session_state.CPU_count) + '). The value should preferably add up to total number of sea state realisations (' + str(maxRel) + '), hence to limit number of run blocks to a minimum. This said, it should be noted that the closer the value is to total number of CPUs (' + str(st.session_state.CPU_count) + ') the more the computer will be busy running analyses, hence with the inherent risk of not being able to do other work as the analyses are progressing.'
+	help_text = 'Specify a value between 1 and maximum number of CPUs available (' + str(st.session_state.CPU_count) + '). A new run is started as soon as one of the running analyses has finished, so the value does not need to add up to the total number of sea state realisations (' + str(maxRel) + '). This said, it should be noted that the closer the value is to total number of CPUs (' + str(st.session_state.CPU_count) + ') the more the computer will be busy running analyses, hence with the inherent risk of not being able to do other work as the analyses are progressing.'
 	maxrpb = st.session_state.maxRunsPB
-	st.session_state.maxRunsPB = st.number_input("Maximum number of runs per block [-] :", help=help_text,
+	st.session_state.maxRunsPB = st.number_input("Maximum number of concurrent runs [-] :", help=help_text,
 												  min_value=1, max_value=st.session_state.CPU_count, value=maxrpb, format="%i")
+	st.session_state.AdaptiveRuns = st.checkbox('Adapt the number of concurrent runs to the load on the computer', value=st.session_state.AdaptiveRuns,
+												help='The number of concurrent runs starts at the minimum and is raised towards the maximum while the computer has spare CPU capacity (leaving ' + str(int(100-S4O_ADAPTIVE_CPU_TARGET)) + '% for other work), memory and disk capacity. It is lowered again when the computer is saturated, also by other users. Running analyses are never stopped.')
+	if st.session_state.AdaptiveRuns:
+		st.session_state.minRunsPB = st.number_input("Minimum number of concurrent runs [-] :", min_value=1, max_value=st.session_state.maxRunsPB,
+													 value=min(st.session_state.minRunsPB, st.session_state.maxRunsPB), format="%i")
+	st.session_state.PinRuns = st.checkbox('Pin each run to its own physical core', value=st.session_state.PinRuns,
+										   help='Each run is bound to a separate physical core, avoiding hyper-threading siblings and spreading the runs over the processor sockets. This reduces the wall-clock time per run when several runs compete for the cores and caches.')
+	st.session_state.RunNice = st.number_input("CPU priority of the runs (nice level) [-] :", min_value=0, max_value=19, value=st.session_state.RunNice, format="%i",
+											   help='0 is normal priority and 19 the lowest. A higher value keeps the computer responsive for other work while the analyses are running (on Windows, 1-9 gives "below normal" and 10-19 "idle" priority).')
+	st.session_state.RunIONice = S4O_IONICE_OPTIONS.index(st.selectbox('Disk priority of the runs :', S4O_IONICE_OPTIONS, index=st.session_state.RunIONice))
+	st.session_state.RunMemoryMaxGB = st.number_input('Memory limit per run [GB] :', min_value=0.0, value=st.session_state.RunMemoryMaxGB, format="%.1f",
+													  help='A run using more memory is stopped and reported as failed. Set value to zero (0.0) for no limit. Requires Linux with systemd.')
 	st.session_state.GenerateInputs = st.checkbox('Generate input files', value=st.session_state.GenerateInputs)
 	st.session_state.RunAnalyses = st.checkbox('Run analyses', value=st.session_state.RunAnalyses)
 	st.session_state.ExtendedPrint = st.checkbox('Extended print', value=st.session_state.ExtendedPrint)
 	st.session_state.SimulateRuns = st.checkbox('Simulate runs', value=st.session_state.SimulateRuns)
+	st.session_state.SyntheticRuns = st.checkbox('Synthetic SIMLA', value=st.session_state.SyntheticRuns,
+												 help='Run a synthetic stand-in for SIMLA and DYNPOST (S4O_Synthetic.py), which needs no SIMLA installation or licence. It writes list files and synthetic time series, so the execution, results and plots can be tested and benchmarked. The results are not physical!')
+	if st.session_state.SyntheticRuns:
+		st.session_state.SyntheticRunTime = st.number_input('Synthetic run time [s] :', min_value=0.0, value=st.session_state.SyntheticRunTime, format="%.1f",
+															help='Mean run time of the synthetic SIMLA runs, which varies by +-25 % between the realisations.')
+		st.session_state.SyntheticLoad = st.selectbox('Synthetic run load :', S4O_SYNTHETIC_LOADS, index=S4O_SYNTHETIC_LOADS.index(st.session_state.SyntheticLoad),
+													  help='Sleep, or keep one CPU busy, during the synthetic runs.')
+	st.session_state.RunDYNPOSTMPF = st.checkbox('Run DYNPOST MPF after each run', value=st.session_state.RunDYNPOSTMPF,
+												 help='DYNPOST MPF generates the plot files (.mpf) of a realisation as soon as its SIMLA run has finished, sharing the concurrent run slots with the SIMLA runs.')
+	st.session_state.ResumeRuns = st.checkbox('Resume (skip runs already completed with the current input)', value=st.session_state.ResumeRuns,
+											  help='Runs that finished successfully with exactly the same input files and SIMLA version are not run again. Missing, failed or changed runs are rerun.')
+	st.session_state.UseResultCache = st.checkbox('Use result cache', value=st.session_state.UseResultCache,
+												  help='Reuse the results of earlier runs with identical input files and SIMLA version, also from other models, instead of running SIMLA again.')
+	if st.session_state.UseResultCache:
+		st.session_state.ResultCacheDir = st.text_input('Result cache directory :', value=st.session_state.ResultCacheDir)
+		st.session_state.ResultCacheMaxGB = st.number_input('Maximum size of result cache [GB] :', help='The least recently used results are deleted when the cache grows beyond this size.',
+															min_value=0.0, value=st.session_state.ResultCacheMaxGB, format="%.1f")
+	st.session_state.ScratchRuns = st.checkbox('Run in local scratch directory', value=st.session_state.ScratchRuns,
+											   help='Each run is run in a directory on a local disk of this computer, and the result files are copied back to the model directory when it has finished successfully. Use this when the model directory is on a network share, so the concurrent runs do not write their output over the network.')
+	if st.session_state.ScratchRuns:
+		st.session_state.ScratchDir = st.text_input('Scratch directory :', value=st.session_state.ScratchDir,
+													help='Local directory, e.g. on a local SSD or a RAM disk (tmpfs, /dev/shm on Linux), with room for the output of the concurrent runs.')
+	st.session_state.RetentionPolicy = st.selectbox('Output files of successful runs :', S4O_RETENTION_POLICIES, index=S4O_RETENTION_POLICIES.index(st.session_state.RetentionPolicy),
+													help='Output files not needed by SIMLA4OBS, e.g. the visualisation results and print files, can be compressed or deleted as soon as each run has finished. The input files, s.slf, s.dyn and the DYNPOST MPF files are always kept. Failed runs are never pruned.')
+	if st.session_state.RetentionPolicy != 'Keep all':
+		st.session_state.RetentionMinMB = st.number_input('Minimum size of pruned files [MB] :', min_value=0.0, value=st.session_state.RetentionMinMB, format="%.1f",
+														  help='Smaller output files are kept as they are.')
+	st.session_state.RunTimeoutMin = st.number_input('Maximum wall-clock time per run [min] :', min_value=0.0, value=st.session_state.RunTimeoutMin, format="%.1f",
+													 help='A run still running after this time is stopped and reported as failed. Set value to zero (0.0) for no limit.')
+	st.session_state.StallTimeoutMin = st.number_input('Maximum time without progress per run [min] :', min_value=0.0, value=st.session_state.StallTimeoutMin, format="%.1f",
+													   help='A run that has not written any output for this time is considered hung, stopped and reported as failed. Set value to zero (0.0) for no limit.')
+	st.session_state.RunRetries = st.number_input('Number of retries of failed runs [-] :', min_value=0, max_value=10, value=st.session_state.RunRetries, format="%i",
+												  help='A failed or stopped run is started again this number of times before it is reported as failed. The other runs continue meanwhile.')
+	st.session_state.DistributedRuns = st.checkbox('Distribute runs to workers', value=st.session_state.DistributedRuns,
+												   help='The runs are handed out to worker processes connecting to this computer, also from other machines, instead of being run here. Start a worker with "python S4O_Distributed.py HOST:PORT --key KEY --simla-home DIR --slots N". Workers can connect and disconnect while the analyses are running.')
+	if st.session_state.DistributedRuns:
+		st.session_state.DistributedPort = st.number_input('Coordinator port [-] :', min_value=1024, max_value=65535, value=st.session_state.DistributedPort, format="%i")
+		st.session_state.DistributedKey = st.text_input('Worker key :', value=st.session_state.DistributedKey, help='Key shared with the workers. Only workers started with the same key can connect.')
+		st.session_state.LocalWorkers = st.number_input('Number of local worker slots [-] :', help='Number of concurrent runs on this computer, in a worker process started with the analyses.',
+														min_value=0, max_value=st.session_state.CPU_count, value=st.session_state.LocalWorkers, format="%i")
+	st.session_state.KillOnConvergence = st.checkbox('Stop running analyses when the standard deviation tolerance is reached', value=st.session_state.KillOnConvergence,
+													 help='Queued runs are always cancelled when the maximum change in standard deviation is reached. Tick this box to also stop the runs in progress.')
 
 	# Update df_Execution dataframe
 	Exdata = [['Time step size in dynamic analysis [s] :', tsSize], ['Sea state duration [h] :', seaDur], ['Wave load ramping time [s] :', wlRamp],
 			  ['Maximum number of realisations [-] :', maxRel], ['Maximum change in standard deviation [%] :', sdTol],
-			  ['Design curve value as factor of outer diameter [-] :', odFac], ['Maximum number of runs per block [-] :', st.session_state.maxRunsPB]]
+			  ['Design curve value as factor of outer diameter [-] :', odFac], ['Maximum number of concurrent runs [-] :', st.session_state.maxRunsPB]]
 	st.session_state.df_Execution = pd.DataFrame(Exdata, columns=['Execution parameters','Value'])
 
 	#	Start SIMLA button
 	st.write("")
 	run = st.button("Run SIMLA", key=None, help="Run SIMLA in batch mode")
 
-	#	Assign total number of blocks to run
-	st.session_state.noBlocksToRun = int(maxRel/st.session_state.maxRunsPB)
-	if (maxRel % st.session_state.maxRunsPB) > 0: st.session_state.noBlocksToRun += 1
-
-	#	Run SIMLA
+	#	Start SIMLA, and show the progress of the runs of the model, also if started from an earlier session.
+	#	The model must not be running in the job queue at the same time, as the input files would be overwritten.
 	if run:
-		S4O_Run_SIMLA()
+		if st.session_state.modelFilePath != '' and any(model['state'] == 'running' and model['path'] == os.path.abspath(st.session_state.modelFilePath)
+														for model in S4O_Queue_Models(st.session_state.QueueDB)):
+			st.error("The model is running in the job queue! Cancel it in the queue before you run it here.", icon="🚨")
+		else:
+			S4O_Run_SIMLA()
+	S4O_Show_Execution()
+
+	#	Resource use of the runs of the last execution of the model
+	S4O_Show_Telemetry(S4O_Execution_Key())
+
+	#	Job queue
+	st.write("---")
+	st.subheader('Job queue')
+	S4O_Show_Queue()
+
+	#	Parametric sweep
+	st.write("---")
+	st.subheader('Parametric sweep')
+	S4O_Show_Sweep()
+
+	#	Minimum stable submerged mass
+	st.write("---")
+	st.subheader('Minimum stable submerged mass')
+	S4O_Show_Mass_Search()
 
 	#	Echo df_Execution dataframe
 	if Echo_Inputs:
@@ -109,36 +210,237 @@ def S4O_Execution():
 #
 #
 
+def S4O_Show_Telemetry(model_path):
+
+	#	Show the summary of the resource use of the runs of the last execution in model_path, from the run
+	#	manifest (S4O_Telemetry), and the record of each run in an expander
+	if model_path == '': return
+	records = S4O_Read_Manifest(model_path)
+	if len(records) == 0: return
+
+	st.write("---")
+	st.subheader('Run telemetry')
+	st.dataframe(pd.DataFrame(S4O_Manifest_Summary(records), columns=['Last execution', 'Value']), hide_index=True)
+	with st.expander('Resource use of each run'):
+		st.dataframe(S4O_Manifest_Table(records), hide_index=True)
+
+	return
+#
+#
+
+def S4O_Show_Queue():
+
+	#	Add models to the job queue (S4O_Queue), which is worked through in the background, show the state of the
+	#	queued models and their runs, and reorder or cancel the queued models
+	db = st.session_state.QueueDB
+	addPath = st.text_input('Model file (.s4o) to add to the queue :', value=st.session_state.modelFilePath,
+							help='The model is run with the run parameters above, after the models already in the queue. The Results table is written to results.csv in the model directory.')
+	if st.button('Add to queue'):
+		if addPath == '' or not os.path.exists(addPath):
+			st.error('Model file does not exist : ' + addPath, icon="🚨")
+		else:
+			S4O_Queue_Add(db, os.path.abspath(addPath), {key: st.session_state[key] for key in S4O_QUEUE_OPTIONS})
+			S4O_Queue_Start(db, st.session_state.SIMLA_HOME)
+
+	job = S4O_Engine_Job_For(S4O_QUEUE_ENGINE_KEY)
+	refresh = None
+	if job is not None and job.running(): refresh = S4O_PROGRESS_INTERVAL
+
+	@st.fragment(run_every=refresh)
+	def show_queue():
+		models = S4O_Queue_Models(db)
+		if len(models) == 0:
+			st.write('The job queue is empty.')
+		else:
+			timetext = lambda t: time.strftime('%Y-%m-%d %H:%M', time.localtime(t)) if t > 0.0 else ''
+			st.dataframe(pd.DataFrame({'Model': [model['path'] for model in models],
+									   'State': [model['state'] for model in models],
+									   'Runs done': [str(model['ndone']) + ' of ' + str(model['nruns']) for model in models],
+									   'Runs failed': [model['nfailed'] for model in models],
+									   'Runs in progress': [model['nrunning'] for model in models],
+									   'Submitted': [timetext(model['submitted']) for model in models],
+									   'Started': [timetext(model['started']) for model in models],
+									   'Finished': [timetext(model['finished']) for model in models],
+									   'Message': [model['message'] for model in models]}), hide_index=True)
+
+			#	Reorder or cancel the selected model, and show the state of its runs
+			ids = [model['id'] for model in models]
+			paths = [model['path'] for model in models]
+			selected = st.selectbox('Queued model :', ids, format_func=lambda id: paths[ids.index(id)])
+			columns = st.columns(4)
+			if columns[0].button('Move up', help='Run the model before the previous model waiting in the queue.'):
+				S4O_Queue_Move(db, selected, -1)
+				st.rerun()
+			if columns[1].button('Move down', help='Run the model after the next model waiting in the queue.'):
+				S4O_Queue_Move(db, selected, 1)
+				st.rerun()
+			if columns[2].button('Cancel', help='Remove the model from the queue, or stop its runs if it is running.'):
+				S4O_Queue_Cancel(db, selected)
+				st.rerun()
+			if columns[3].button('Remove finished', help='Remove the models that are done, failed or cancelled from the queue.'):
+				S4O_Queue_Clear(db)
+				st.rerun()
+
+			runs = S4O_Queue_Runs(db, selected)
+			if len(runs) > 0:
+				st.dataframe(pd.DataFrame({'Run': [run['irun'] for run in runs],
+										   'State': [run['state'] for run in runs],
+										   'Started': [timetext(run['started']) for run in runs],
+										   'Finished': [timetext(run['finished']) for run in runs],
+										   'Host': [run['host'] for run in runs],
+										   'Attempts': [run['attempts'] for run in runs],
+										   'Message': [run['message'] for run in runs]}), hide_index=True)
+
+		#	Refresh the whole page when the queue has stopped, to stop the refreshing
+		if refresh is not None and not job.running(): st.rerun()
+		return
+
+	show_queue()
+
+	return
+#
+#
+
+#
+# EXECUTION parametric sweep functions
+#
+
+def S4O_Show_Sweep():
+
+	#	Define a parametric sweep of the current model, i.e. values of Product, Seabed and Environment parameters
+	#	combined into cases, run all realisations of all cases in the background execution engine and show the
+	#	consolidated results of the cases. The cases are run in the directory sweep of the model.
+	parameters = S4O_Sweep_Parameters(st.session_state)
+	st.session_state.SweepParameters = st.multiselect('Parameters to vary :', list(parameters.keys()),
+													   default=[key for key in st.session_state.SweepParameters if key in parameters],
+													   format_func=lambda key: parameters[key], key='SweepParametersSelect')
+	values = {}
+	for key in st.session_state.SweepParameters:
+		attr, row = S4O_Sweep_Parameter(key)
+		text = st.session_state.SweepValues.get(key, str(getattr(st.session_state, attr).iloc[row,1]))
+		st.session_state.SweepValues[key] = st.text_input(parameters[key] + ' values :', value=text, key='SweepValues' + key,
+															  help='Comma separated list of values.')
+		values[key] = [value for value in st.session_state.SweepValues[key].split(',') if value.strip() != '']
+	st.session_state.SweepMode = st.radio('Combination of the values :', S4O_SWEEP_MODES, index=S4O_SWEEP_MODES.index(st.session_state.SweepMode), horizontal=True, key='SweepModeRadio',
+										  help='Grid: All combinations of the values. List: The first values of all parameters together, then the second values and so on.')
+
+	#	Expand the values into cases
+	cases = []
+	if len(values) > 0:
+		try:
+			cases = S4O_Sweep_Cases(st.session_state, values, st.session_state.SweepMode)
+		except ValueError as e:
+			st.error('Invalid sweep values : ' + str(e), icon="🚨")
+	nrel = int(st.session_state.df_Execution.iloc[3,1])
+	if len(cases) > 0:
+		st.write(str(len(cases)) + ' cases of ' + str(nrel) + ' realisations, i.e. ' + str(len(cases)*nrel) + ' SIMLA runs.')
+
+	mod_path = S4O_Execution_Key()
+	sweep_path = mod_path + '/sweep'
+	if st.button('Run sweep', help='Generate the input files of all cases and run all realisations of all cases with the run parameters above.'):
+		job = S4O_Engine_Job_For(sweep_path)
+		if mod_path == '' or not os.path.exists(st.session_state.modelFilePath):
+			st.error("You have to save your model before you can run a sweep!", icon="🚨")
+		elif len(cases) == 0:
+			st.error("Select the parameters to vary and their values!", icon="🚨")
+		elif job is not None and job.running():
+			st.error("The sweep of this model is already running! Cancel it before you start a new one.", icon="🚨")
+		else:
+			with st.spinner('Generating SIMLA input files for ' + str(len(cases)) + ' cases ...'):
+				nsteps = S4O_Write_Sweep_Input_Files(st.session_state, sweep_path, cases)
+			runcfg = S4O_Assign_Run_Config(st.session_state)
+			job = S4O_Engine_Job(S4O_Run_Sweep, (runcfg, sweep_path, cases, parameters, nrel, nsteps), 'the parametric sweep of the model ' + mod_path)
+			if runcfg['SimulateRuns'] and not runcfg['DistributedRuns']:
+				job.report(None, 'warning', 'Simulating the SIMLA runs with the sleep command!')
+			S4O_Engine_Submit(sweep_path, job)
+
+	#	Progress and consolidated results of the sweep, also if started from an earlier session
+	job = S4O_Engine_Job_For(sweep_path)
+	if mod_path == '' or job is None: return
+
+	S4O_Show_Job(job, 'Sweep execution', table=lambda status: S4O_Sweep_Table(status, job.args[2], job.args[3]))
+
+	return
+#
+#
+
+def S4O_Show_Mass_Search():
+
+	#	Search for the lowest submerged mass for which Mean+1StdDev is below the design value, by running several
+	#	candidate masses concurrently in each round and narrowing the bracket of masses until it is narrower than
+	#	the tolerance. The search runs in the background execution engine, in the directory masssearch of the model.
+	st.write('Design value (odFac x outer diameter) : ' + '%.4f' % S4O_Design_Value(st.session_state) + ' m.')
+	st.session_state.MassSearchMin = st.number_input('Lowest submerged mass [kg/m] :', min_value=0.0, value=st.session_state.MassSearchMin, format="%.2f")
+	st.session_state.MassSearchMax = st.number_input('Highest submerged mass [kg/m] :', min_value=0.0, value=st.session_state.MassSearchMax, format="%.2f",
+													 help='The product must be stable with this submerged mass.')
+	st.session_state.MassSearchTol = st.number_input('Submerged mass tolerance [kg/m] :', min_value=0.01, value=st.session_state.MassSearchTol, format="%.2f",
+													 help='The search stops when the minimum stable submerged mass is known within this tolerance.')
+	st.session_state.MassSearchCandidates = st.number_input('Number of candidate masses per round [-] :', min_value=2, max_value=50, value=st.session_state.MassSearchCandidates, format="%i",
+															help='The candidate masses of a round are run concurrently, each with the maximum number of realisations. More candidates give fewer rounds, and the bracket is narrowed by a factor of (candidates + 1) per round.')
+
+	mod_path = S4O_Execution_Key()
+	search_path = mod_path + '/masssearch'
+	if st.button('Search', help='Run the candidate masses of each round with the run parameters above, until the tolerance is reached.'):
+		job = S4O_Engine_Job_For(search_path)
+		if mod_path == '' or not os.path.exists(st.session_state.modelFilePath):
+			st.error("You have to save your model before you can run a search!", icon="🚨")
+		elif st.session_state.MassSearchMax <= st.session_state.MassSearchMin:
+			st.error("The highest submerged mass must be larger than the lowest!", icon="🚨")
+		elif job is not None and job.running():
+			st.error("The search of this model is already running! Cancel it before you start a new one.", icon="🚨")
+		else:
+			#	The input files of each round are generated in the background, from a copy of the model parameters.
+			#	S4O_Batch is imported here, as it imports this module.
+			from S4O_Batch import S4O_Batch_State
+			state = S4O_Batch_State({key: st.session_state[key] for key in st.session_state})
+			runcfg = S4O_Assign_Run_Config(state)
+			job = S4O_Engine_Job(S4O_Run_Mass_Search, (state, runcfg, search_path, st.session_state.MassSearchMin, st.session_state.MassSearchMax,
+													   st.session_state.MassSearchTol, st.session_state.MassSearchCandidates, int(state.df_Execution.iloc[3,1])),
+								 'the minimum stable submerged mass search of the model ' + mod_path)
+			if runcfg['SimulateRuns'] and not runcfg['DistributedRuns']:
+				job.report(None, 'warning', 'Simulating the SIMLA runs with the sleep command!')
+			S4O_Engine_Submit(search_path, job)
+
+	#	Progress and candidate masses of the search, also if started from an earlier session
+	job = S4O_Engine_Job_For(search_path)
+	if mod_path == '' or job is None: return
+
+	S4O_Show_Job(job, 'Search execution', table=S4O_Mass_Search_Table)
+
+	return
+#
+#
+
 #
 # EXECUTION set defaults function
 #
 
-def S4O_Execution_Defaults():
+def S4O_Execution_Defaults(state=st.session_state):
 	
 	#	Assign default execution parameters
-	if 'df_Execution' not in st.session_state:
+	if 'df_Execution' not in state:
 		tsSize = 0.02
 		seaDur = 0.15
 		wlRamp = 5.0
 		maxRel = 7
 		sdTol  = 0.0
 		odFac  = 10.0
-		maxRPB = st.session_state.maxRunsPB
+		maxRPB = state.maxRunsPB
 	else:
 		st.warning('S4O_Execution_Defaults : Should not be here (1)!', icon="⚠️")
 
-	if 'currentMaxRel' not in st.session_state:
-		st.session_state.currentMaxRel = maxRel
+	if 'currentMaxRel' not in state:
+		state.currentMaxRel = maxRel
 	else:
 		st.warning('S4O_Execution_Defaults : Should not be here (2)!', icon="⚠️")
 
 	Exdata = [['Time step size in dynamic analysis [s] :', tsSize], ['Sea state duration [h] :', seaDur], ['Wave load ramping time [s] :', wlRamp],
 			  ['Maximum number of realisations [-] :', maxRel], ['Maximum change in standard deviation [%] :', sdTol],
-			  ['Design curve value as factor of outer diameter [-] :', odFac], ['Maximum number of runs per block [-] :', maxRPB]]
-	st.session_state.df_Execution = pd.DataFrame(Exdata, columns=['Execution parameters','Value'])
+			  ['Design curve value as factor of outer diameter [-] :', odFac], ['Maximum number of concurrent runs [-] :', maxRPB]]
+	state.df_Execution = pd.DataFrame(Exdata, columns=['Execution parameters','Value'])
 
-	st.session_state.Execution_OK = True
+	state.Execution_OK = True
 
-	return st.session_state.df_Execution,st.session_state.Execution_OK
+	return state.df_Execution,state.Execution_OK
 #
 #
@@ -0,0 +1,202 @@
+"""
+File: S4O_Launcher.py
+Description:
+These functions start SIMLA and DYNPOST as subprocesses directly, with an explicit working directory and print file.
+They do not use st.session_state or os.chdir, and can therefore be called from worker threads.
+Revisions:
+2026-10-18: First version, replacing the PowerShell based run commands in S4O_SIMLA.
+2026-10-18: S4O_Set_SIMLA_Environment; Moved from S4O_Batch, to be shared with the S4O_Distributed workers.
+2026-10-18: S4O_Physical_Cores, S4O_Set_Process_Priority, S4O_Set_Process_Affinity, S4O_Memory_Cap_Args; Placement, priority and memory limits for the runs.
+2026-10-18: S4O_Kill_Process_Tree; New function stopping a run with all its child processes.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import subprocess
+import shutil
+import sys
+import os
+import psutil
+
+#	Disk (I/O) priority options of the runs
+S4O_IONICE_OPTIONS = ['Normal', 'Low', 'Idle']
+
+#	Result of the check whether memory capped scopes can be created with systemd-run (None if not checked yet)
+S4O_MEMORY_CAP_AVAILABLE = None
+
+def S4O_Executable_Path(simla_home, name):
+
+	#	Assign the path to a SIMLA program ("simla" or "dynpost") in the bin directory of the SIMLA installation
+	exepath = simla_home + '/bin/' + name
+	if os.name == 'nt': exepath += '.exe'
+
+	return exepath
+#
+#
+
+def S4O_Set_SIMLA_Environment(simla_home):
+
+	#	Set the SIMLA_HOME and HLALIB_PATH environment variables and add the SIMLA directories to the PATH variable,
+	#	as SIMLA4OBS.main does, for use when running without the dashboard (S4O_Batch, S4O_Distributed workers)
+	os.environ['SIMLA_HOME'] = simla_home
+	os.environ['HLALIB_PATH'] = simla_home + '/bin/HLALib.jar'
+	for newdir in [simla_home + '/bin', simla_home + '/jre/jre/bin', simla_home + '/jre/jre/bin/server']:
+		os.environ['PATH'] = newdir + os.pathsep + os.environ.get('PATH', '')
+
+	return
+#
+#
+
+def S4O_Launch_Process(args, cwd, outname):
+
+	#	Start the program given by the argument list in the working directory cwd, with standard output and
+	#	standard error redirected to the print file outname in the same directory (or discarded if outname is '')
+	if outname == '':
+		p = subprocess.Popen(args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+	else:
+		with open(os.path.join(cwd, outname), 'w') as outfile:
+			p = subprocess.Popen(args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=outfile, stderr=subprocess.STDOUT)
+
+	return p
+#
+#
+
+def S4O_Kill_Process_Tree(p):
+
+	#	Kill the started program p and all processes started by it, and wait for it to stop. p may also be a
+	#	handle for a run on a distributed worker, which is then cancelled.
+	pid = getattr(p, 'pid', None)
+	if pid is not None:
+		try:
+			children = psutil.Process(pid).children(recursive=True)
+		except psutil.NoSuchProcess:
+			children = []
+		for child in children:
+			try:
+				child.kill()
+			except psutil.NoSuchProcess:
+				pass
+	p.kill()
+	p.wait()
+
+	return
+#
+#
+
+def S4O_Sleep_Args(s2w):
+
+	#	Assign an argument list that simulates a run by sleeping for s2w seconds
+	args = [sys.executable, '-c', 'import time; time.sleep(' + str(s2w) + ')']
+
+	return args
+#
+#
+
+def S4O_Physical_Cores():
+
+	#	Return a list of logical CPUs with one CPU per physical core, so that runs pinned to different CPUs in the
+	#	list do not share a core through SMT (hyper-threading). The cores of different sockets are interleaved to
+	#	spread the runs over the sockets, and the core of CPU 0, which is busiest with other work, is put last.
+	packages = {}
+	try:
+		cpus = sorted(os.sched_getaffinity(0))
+		siblings = []
+		for cpu in cpus:
+			topology = '/sys/devices/system/cpu/cpu' + str(cpu) + '/topology/'
+			with open(topology + 'thread_siblings_list') as f: cpusiblings = f.read().strip()
+			with open(topology + 'physical_package_id') as f: package = int(f.read())
+			if cpusiblings in siblings: continue
+			siblings.append(cpusiblings)
+			packages.setdefault(package, []).append(cpu)
+	except (AttributeError, OSError, ValueError):
+		#	No topology information (Windows, macOS). Assume that the SMT siblings of a core are numbered consecutively.
+		nlogical = psutil.cpu_count()
+		nphysical = psutil.cpu_count(logical=False)
+		if nphysical is None or nphysical == 0: nphysical = nlogical
+		packages = {0: list(range(0, nlogical, max(int(nlogical/nphysical), 1)))}
+
+	#	Interleave the sockets
+	cores = []
+	ncores = max(len(packages[package]) for package in packages)
+	for ndx in range(ncores):
+		for package in sorted(packages):
+			if ndx < len(packages[package]): cores.append(packages[package][ndx])
+
+	#	Use the core of CPU 0 last
+	if len(cores) > 1 and cores[0] == 0: cores.append(cores.pop(0))
+
+	return cores
+#
+#
+
+def S4O_Set_Process_Priority(pid, nice, ionice):
+
+	#	Lower the CPU priority of process pid to the nice level (0-19, 0 is normal), mapped to the priority
+	#	classes on Windows, and the disk priority to ionice (index in S4O_IONICE_OPTIONS)
+	try:
+		p = psutil.Process(pid)
+		if nice > 0:
+			if os.name == 'nt':
+				if nice < 10:
+					p.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+				else:
+					p.nice(psutil.IDLE_PRIORITY_CLASS)
+			else:
+				p.nice(nice)
+		if ionice > 0 and hasattr(p, 'ionice'):
+			if os.name == 'nt':
+				if ionice == 1:
+					p.ionice(psutil.IOPRIO_LOW)
+				else:
+					p.ionice(psutil.IOPRIO_VERYLOW)
+			else:
+				if ionice == 1:
+					p.ionice(psutil.IOPRIO_CLASS_BE, 7)
+				else:
+					p.ionice(psutil.IOPRIO_CLASS_IDLE)
+	except (psutil.NoSuchProcess, psutil.AccessDenied):
+		pass
+
+	return
+#
+#
+
+def S4O_Set_Process_Affinity(pid, cpus):
+
+	#	Pin process pid to the logical CPUs in the list cpus (not supported on macOS)
+	try:
+		p = psutil.Process(pid)
+		if hasattr(p, 'cpu_affinity'): p.cpu_affinity(cpus)
+	except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError):
+		pass
+
+	return
+#
+#
+
+def S4O_Memory_Cap_Args(maxgb):
+
+	#	Return the arguments to put in front of a run command to start it in a cgroup limited to maxgb GB of memory,
+	#	using a systemd user scope (Linux with systemd). Return [] if maxgb is 0 or memory caps are not available.
+	global S4O_MEMORY_CAP_AVAILABLE
+	if maxgb <= 0: return []
+
+	if S4O_MEMORY_CAP_AVAILABLE is None:
+		S4O_MEMORY_CAP_AVAILABLE = False
+		if sys.platform.startswith('linux') and shutil.which('systemd-run') is not None:
+			try:
+				check = subprocess.run(['systemd-run', '--user', '--scope', '--quiet', '-p', 'MemoryMax=1G', 'true'],
+									   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+				S4O_MEMORY_CAP_AVAILABLE = check.returncode == 0
+			except (OSError, subprocess.TimeoutExpired):
+				pass
+
+	if not S4O_MEMORY_CAP_AVAILABLE: return []
+
+	return ['systemd-run', '--user', '--scope', '--quiet', '-p', 'MemoryMax=' + str(int(maxgb*1.0e9)), '-p', 'MemorySwapMax=0']
+#
+#
@@ -4,21 +4,17 @@ Description:
 The "seabed" function writes seabed data to the SIMLA input file (.sif).
 Revisions:
 YYYY-MM-DD: 
+2026-10-18: The seabed profile is written to the file object fileseabed instead of seabed.txt in the directory of the SIMLA input file.
 """
 __author__ = "Vegard Longva"
 __credits__ = [""]
 __license__ = "GPLv3"
-__version__ = "2024-10-31"
+__version__ = "2026-10-18"
 __maintainer__ = "Vegard Longva"
 __email__ = "Vegard.Longva@sintef.no"
 
-import os
-
 def seabed( file    ,  Lpipe  ,  zseabed  ,
-            siffile   ):
-
-    run_dir = os.path.dirname(siffile)
-    fileseabed = open(run_dir + '/seabed.txt',"w")
+            fileseabed   ):
 
     x1 = -Lpipe
     x2 = -x1
@@ -39,5 +35,3 @@ def seabed( file    ,  Lpipe  ,  zseabed  ,
     file.write("#        lineID   kp1       kp2       matname\n")
     file.write("COSUPR   100     -10000.0   10000.0   soilmat\n") 
     file.write("#\n")
-
-    fileseabed.close()
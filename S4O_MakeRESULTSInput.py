@@ -4,19 +4,19 @@ Description:
 The "results" function writes result data to the SIMLA input files.
 Revisions:
 YYYY-MM-DD: 
+2026-10-18: The DYNPOST input is written to the file object filedynpost instead of s.sdi in the directory of the SIMLA input file.
 """
 __author__ = "Vegard Longva"
 __credits__ = [""]
 __license__ = "GPLv3"
-__version__ = "2024-10-31"
+__version__ = "2026-10-18"
 __maintainer__ = "Vegard Longva"
 __email__ = "Vegard.Longva@sintef.no"
 
 import numpy as np
-import os
 
 def results( file           , ivisual       , nelpipe         , inod1pipe  ,
-             iel1seabedcont , iel1pipe      , sifname         ):
+             iel1seabedcont , iel1pipe      , filedynpost     ):
 
     file.write("#\n")
     file.write("#-----------------------------------------------------------------------------------------------------------------------------\n")
@@ -38,9 +38,6 @@ def results( file           , ivisual       , nelpipe         , inod1pipe  ,
         ielpipe_mid  = np.ceil((iel1pipe + iel1pipe + nelpipe-1)/2)
         ielseabedcont_mid = np.ceil((iel1seabedcont + iel1seabedcont + nelpipe)/2)
 
-    run_dir = os.path.dirname(sifname)
-    filedynpost = open(run_dir + '/s.sdi',"w")
-
     filedynpost.write("#         *.dyn   *.mpf         plotno   yscale\n")
 
     idynres = 0
@@ -74,8 +71,6 @@ def results( file           , ivisual       , nelpipe         , inod1pipe  ,
 
     file.write("#\n")
 
-    filedynpost.close()
-
     return
 #
 #
\ No newline at end of file
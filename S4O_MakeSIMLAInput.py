@@ -1,21 +1,32 @@
 """
 File: S4O_MakeSIMLAInput.py
 Description:
-This function creates a SIMLA input file for the SIMLA4OBS application.
+These functions create the SIMLA input files for the SIMLA4OBS application.
+The input files are rendered from the model specification (S4O_ModelSpec) and the wave seed only, without reading
+the state or writing to the disk (S4O_Render_SIMLA_Input), so they can be generated in worker processes.
+The input files of realisation irun are a function of the specification and irun only (S4O_Make_SIMLA_Input_Files),
+with the wave seed taken from the seeds of the specification. As the input files of the realisations of a model differ
+only in the wave seed, S4O_Make_SIMLA_Template renders the input once, with a placeholder for the seed, and the files
+of each realisation are made from the template by substituting its seed. This is the only way the input files are
+generated.
 Revisions:
 2025-06-24: Corrected error in wave and current directions by converting to radians.
+2026-10-18: Reads the model parameters from the state argument instead of st.session_state, so it can run without Streamlit.
+2026-10-18: S4O_Render_SIMLA_Input, S4O_Make_SIMLA_Template, S4O_Write_SIMLA_Input; Render the input once per model as a template, and write the input files of each realisation by substituting the wave seed.
+2026-10-18: S4O_Render_SIMLA_Input, S4O_Make_SIMLA_Input_Files, S4O_Write_SIMLA_Files; Renders the input files from the model specification (S4O_Model_Spec) and returns their texts.
+2026-10-18: S4O_MakeSIMLAInput, S4O_Make_SIMLA_Input_Files; Deleted, as the input files are only generated from the template (S4O_Make_SIMLA_Template, S4O_Write_SIMLA_Input).
+2026-10-18: S4O_Make_SIMLA_Input_Files; New function returning the input files of a realisation from the model specification and the realisation number, with the wave seed taken from the specification. Replaces S4O_Write_SIMLA_Input.
 """
 __author__ = "Vegard Longva"
 __credits__ = ["Egil Giertsen"]
 __license__ = "GPLv3"
-__version__ = "2025-06-24"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen, Vegard Longva"
 __email__ = "Egil.Giertsen@sintef.no"
 
 # Packages
-import streamlit as st
+import io
 import numpy as np
-import os
 
 # Functions
 from S4O_MSI_control import control
@@ -29,7 +40,60 @@ from S4O_MSI_materials import materials
 from S4O_MSI_tables import tables
 from S4O_MakeRESULTSInput import results
 
-def S4O_MakeSIMLAInput(sifname, irun):
+#   Wave seed written in the template of the SIMLA input file, and replaced by the seed of each realisation. It is
+#   outside the range of the seed numbers generated (S4O_Generate_Seed_Numbers).
+S4O_SEED_PLACEHOLDER = 1999999999
+
+#   Files written in the run directory together with the SIMLA input file, which are the same for all realisations
+S4O_TEMPLATE_FILES = ['seabed.txt', 's.sdi']
+
+def S4O_Make_SIMLA_Template(spec):
+
+    #   Render the SIMLA input file of the model specification spec (S4O_Model_Spec) once with the placeholder seed,
+    #   and return the template of the input files of the realisations: the text of the SIMLA input file before and
+    #   after the seed, the texts of the other files in S4O_TEMPLATE_FILES and the number of DYNRES steps
+    files, nstep_dynres = S4O_Render_SIMLA_Input(spec, S4O_SEED_PLACEHOLDER)
+    sifparts = files["s.sif"].split(" %i " % S4O_SEED_PLACEHOLDER)
+    if len(sifparts) != 2:
+        raise ValueError("The wave seed could not be located in the SIMLA input file template!")
+
+    template = {'sif': sifparts, 'files': {}, 'nstep_dynres': int(nstep_dynres)}
+    for name in S4O_TEMPLATE_FILES:
+        template['files'][name] = files[name]
+
+    return template
+#
+
+def S4O_Make_SIMLA_Input_Files(spec, irun, template=None):
+
+    #   Return the input files (s.sif, seabed.txt and s.sdi) of realisation irun of the model specification spec
+    #   (S4O_Model_Spec) as a dictionary of file names and texts, with the wave seed of the realisation
+    #   (spec.seeds[irun-1]). The files are made from the template of spec (S4O_Make_SIMLA_Template), which is rendered
+    #   here unless it is given, to render it once for all realisations. Nothing is read from or written to the state
+    #   or the disk, so the function can run in worker processes.
+    if template is None: template = S4O_Make_SIMLA_Template(spec)
+    files = {"s.sif": template['sif'][0] + " %i " % spec.seeds[irun-1] + template['sif'][1]}
+    files.update(template['files'])
+
+    return files
+#
+
+def S4O_Write_SIMLA_Files(files, run_dir):
+
+    #   Write the input files in the dictionary files (file names and texts) to run_dir
+    for name in files:
+        with open(run_dir + "/" + name, "w") as f:
+            f.write(files[name])
+
+    return
+#
+
+def S4O_Render_SIMLA_Input(spec, iwaveseed):
+
+    #   Render the SIMLA input of the model specification spec (S4O_Model_Spec) with wave seed iwaveseed. Return the
+    #   input files (s.sif, seabed.txt and s.sdi) as a dictionary of file names and texts, and the number of DYNRES
+    #   steps (nstep_dynres). Nothing is read from or written to the state or the disk, so the function can run in
+    #   worker processes.
 
     #   Assign physical constants
     rho_sea = 1025.0        #   Density of sea water [kg/m3]
@@ -40,73 +104,67 @@ def S4O_MakeSIMLAInput(sifname, irun):
     nelpipe = 1     #   Number of elements
 
     #   Assign PRODUCT parameters
-    diam = float(st.session_state.df_Product.iloc[0,1])             #   Outer diameter (without marine growth) [m]
-    submass = float(st.session_state.df_Product.iloc[1,1])          #   Submerged mass [kg/m]
+    diam = spec.diam                                                #   Outer diameter (without marine growth) [m]
+    submass = spec.submass                                          #   Submerged mass [kg/m]
     mass = submass + np.pi*(diam**2/4)*rho_sea                      #   Structural mass [kg/m]
     EI_dum = 0.0                                                    #   Bending stiffness [Nm2] (dummy value)
     EA_dum = 1.0                                                    #   Axial stiffness [N] (dummy value)
     GJ_dum = 0.0                                                    #   Torsion stiffness [Nm2] (dummy value)
-    th_margrow = float(st.session_state.df_Product.iloc[2,1])       #   Thickness of marine growth [m]
-    rho_margrow = float(st.session_state.df_Product.iloc[3,1])      #   Density of marine growth [kg/m3]
+    th_margrow = spec.th_margrow                                    #   Thickness of marine growth [m]
+    rho_margrow = spec.rho_margrow                                  #   Density of marine growth [kg/m3]
 
     #   Assign SEABED parameters
     #   Y-direction PSI model (imody) - 1: 'V&S Sand', 2: 'V&L Clay', 3: 'NGI Drained', 4: 'NGI Undrained', 5: 'DNV Model 2 Undrained', 6: 'Rock / Coulomb friction']
-    ndx   = int(st.session_state.df_Seabed.iloc[0,1])
-    imody = st.session_state.SeabedValues[ndx]                      #   Y-direction PSI model
-    gamd_sand = float(st.session_state.df_Seabed.iloc[1,1])         #   Sand dry unit weight [N/m3]
-    su_clay = float(st.session_state.df_Seabed.iloc[2,1])           #   Undrained shear strength [N/m2] 
-    gamd_clay = float(st.session_state.df_Seabed.iloc[3,1])         #   Clay dry unit weight [N/m3]
-    gams_drain = float(st.session_state.df_Seabed.iloc[4,1])        #   Drained submerged unit weight [N/m3]
-    su_y_undrain = float(st.session_state.df_Seabed.iloc[5,1])      #   Undrained shear strength [N/m2] 
-    gams_undrain = float(st.session_state.df_Seabed.iloc[6,1])      #   Undrained submerged unit weight [N/m3]
-    muy     = float(st.session_state.df_Seabed.iloc[7,1])           #   Coulomb friction factor [-]
-    kstick  = float(st.session_state.df_Seabed.iloc[8,1])           #   Elastic stick stiffness [N/m2]
+    imody = spec.imody                   #   Y-direction PSI model
+    gamd_sand = spec.gamd_sand           #   Sand dry unit weight [N/m3]
+    su_clay = spec.su_clay               #   Undrained shear strength [N/m2] 
+    gamd_clay = spec.gamd_clay           #   Clay dry unit weight [N/m3]
+    gams_drain = spec.gams_drain         #   Drained submerged unit weight [N/m3]
+    su_y_undrain = spec.su_y_undrain     #   Undrained shear strength [N/m2] 
+    gams_undrain = spec.gams_undrain     #   Undrained submerged unit weight [N/m3]
+    muy     = spec.muy                   #   Coulomb friction factor [-]
+    kstick  = spec.kstick                #   Elastic stick stiffness [N/m2]
 
     #   Z-direction PSI model (imodz) - 1: 'V&S Sand', 2: 'V&L Clay', 3: 'NGI Drained', 4: 'NGI Undrained', 5: 'DNV Model 2 Undrained', 6: 'Rock / Constant stiffness']
-    ndx   = int(st.session_state.df_Seabed.iloc[9,1])
-    imodz = st.session_state.SeabedValues[ndx]                      #   Z-direction PSI model
-    gams_z_drain = float(st.session_state.df_Seabed.iloc[10,1])     #   Drained submerged unit weight z-dir [N/m3] 
-    su_z_undrain = float(st.session_state.df_Seabed.iloc[11,1])     #   Undrained shear strength z-dir [N/m2] 
-    gams_z_undrain = float(st.session_state.df_Seabed.iloc[12,1])   #   Undrained submerged unit weight z-dir [N/m3] 
-    kz_const = float(st.session_state.df_Seabed.iloc[13,1])         #   Elastic stiffness z-dir [N/m2]
+    imodz = spec.imodz                   #   Z-direction PSI model
+    gams_z_drain = spec.gams_z_drain     #   Drained submerged unit weight z-dir [N/m3] 
+    su_z_undrain = spec.su_z_undrain     #   Undrained shear strength z-dir [N/m2] 
+    gams_z_undrain = spec.gams_z_undrain #   Undrained submerged unit weight z-dir [N/m3] 
+    kz_const = spec.kz_const             #   Elastic stiffness z-dir [N/m2]
 
     #   Initial penetration
-    ndx     = int(st.session_state.df_Seabed.iloc[14,1])
-    ipenmod = st.session_state.PenetrationValues[ndx]               #   Initial penetration mode : 1=Specify, 2=Calculate
-    uz_ini = float(st.session_state.df_Seabed.iloc[15,1])           #   Initial penetration, specified [m]
-    T0 = float(st.session_state.df_Seabed.iloc[16,1])               #   Horizontal lay tension, for klay-calculations [N]
-    submass_lay = float(st.session_state.df_Seabed.iloc[17,1])      #   Submerged mass during lay [kg/m]
-    EI = float(st.session_state.df_Seabed.iloc[18,1])               #   Bending stiffness, for klay-calculations [Nm2]
+    ipenmod = spec.ipenmod               #   Initial penetration mode : 1=Specify, 2=Calculate
+    uz_ini = spec.uz_ini                 #   Initial penetration, specified [m]
+    T0 = spec.T0                         #   Horizontal lay tension, for klay-calculations [N]
+    submass_lay = spec.submass_lay       #   Submerged mass during lay [kg/m]
+    EI = spec.EI                         #   Bending stiffness, for klay-calculations [Nm2]
 
     #   Assign ENVIRONMENT parameters
-    zseabed = -float(st.session_state.df_Environment.iloc[0,1])              #   Z-cordinate of seafloor [m] (-[Water depth])
-    Hs = float(st.session_state.df_Environment.iloc[1,1])                    #   Significant wave height [m]
-    Tp = float(st.session_state.df_Environment.iloc[2,1])                    #   Peak wave period [s]
-    wavang = float(st.session_state.df_Environment.iloc[3,1])/180.0*np.pi    #   Wave direction [deg]
-    ndx = int(st.session_state.df_Environment.iloc[4,1])
-    iwavespec = st.session_state.WaveSpectraValues[ndx]                      #   Wave spectrum : 1=PM, 2=JONSWAP
-    pkdness = float(st.session_state.df_Environment.iloc[5,1])               #   Peakedness parameter
-    ndx = int(st.session_state.df_Environment.iloc[6,1])
-    chspread = st.session_state.WaveSpreadingValues[ndx]                     #   Wave spreading type : "long", "short"
-    ndir = int(st.session_state.df_Environment.iloc[7,1])                    #   Number of directions
-    spreadpar = float(st.session_state.df_Environment.iloc[8,1])             #   Spreading function exponent
-    curvel = float(st.session_state.df_Environment.iloc[9,1])                #   Current velocity [m/s]
-    curang = float(st.session_state.df_Environment.iloc[10,1])/180.0*np.pi   #   Current direction [deg]
-    cuhref = float(st.session_state.df_Environment.iloc[11,1])               #   Current reference height [m]
-    curough = float(st.session_state.df_Environment.iloc[12,1])              #   Seabed roughness [m]
-    d50 = float(st.session_state.df_Environment.iloc[13,1])                  #   Median grain size [m]
+    zseabed = -spec.depth                         #   Z-cordinate of seafloor [m] (-[Water depth])
+    Hs = spec.Hs                                  #   Significant wave height [m]
+    Tp = spec.Tp                                  #   Peak wave period [s]
+    wavang = spec.wavdir/180.0*np.pi              #   Wave direction [deg]
+    iwavespec = spec.iwavespec                    #   Wave spectrum : 1=PM, 2=JONSWAP
+    pkdness = spec.pkdness                        #   Peakedness parameter
+    chspread = spec.chspread                      #   Wave spreading type : "long", "short"
+    ndir = spec.ndir                              #   Number of directions
+    spreadpar = spec.spreadpar                    #   Spreading function exponent
+    curvel = spec.curvel                          #   Current velocity [m/s]
+    curang = spec.curdir/180.0*np.pi              #   Current direction [deg]
+    cuhref = spec.cuhref                          #   Current reference height [m]
+    curough = spec.curough                        #   Seabed roughness [m]
+    d50 = spec.d50                                #   Median grain size [m]
 
     #   Assign EXECUTION parameters
 
     tstart_uzini = 0.0                                              #   Start time for ramping initial penetration.
     tend_static = 1.0                                               #   End of static analysis and ramping of initial penetration, also used as reference time for initial penetration [s].
-    dtdyn = float(st.session_state.df_Execution.iloc[0,1])          #   Time step size in dynamic analysis.
+    dtdyn = spec.dtdyn                                              #   Time step size in dynamic analysis.
 
     #   Total wave duration = (Sea state duration [h])*3600 + Wave load ramping time [s]  +  static load ramping time [s]
-    tendwaveramp = float(st.session_state.df_Execution.iloc[2,1])  +  tend_static
-    tdurwave = float(st.session_state.df_Execution.iloc[1,1])*3600.0 + float(st.session_state.df_Execution.iloc[2,1])
+    tendwaveramp = spec.tramp  +  tend_static
+    tdurwave = spec.duration*3600.0 + spec.tramp
     
-    iwaveseed = st.session_state.listOfSeedNumbers[irun-1]
     wavetype = "irregular"
     dtwave = 0.5                                #   Time increment for wave kinematics
     tstartwave = tend_static                    #   Start time DROPS LOAD
@@ -175,12 +233,14 @@ def S4O_MakeSIMLAInput(sifname, irun):
     lamda = 0.025                                        # Damping ratio [-]
     czdamp_seabed = lamda*2.0*np.sqrt(meff*kz_seabed)    # Nodal seabed damping constant [Ns/m2]
 
-    file = open(sifname,"w")
+    file = io.StringIO()
+    fileseabed = io.StringIO()
+    filedynpost = io.StringIO()
 
     file.write("#\n")
     file.write("#-----------------------------------------------------------------------------------------------------------------------------\n")
     file.write("HEAD\n")
-    file.write("HEAD %s\n" % (st.session_state.modelMainTitle))
+    file.write("HEAD %s\n" % (spec.title))
     file.write("HEAD\n")
     file.write("#-----------------------------------------------------------------------------------------------------------------------------\n")
     file.write("#\n")
@@ -209,7 +269,7 @@ def S4O_MakeSIMLAInput(sifname, irun):
               rho_sea        , uz_cont        )
 
     seabed(   file           , Lpipe          , zseabed        ,
-              sifname )
+              fileseabed )
 
     loading( file            , curvel         , curang         , 
              cuhref          , curough        , wavetype       ,
@@ -244,11 +304,8 @@ def S4O_MakeSIMLAInput(sifname, irun):
 
     results( file            , ivisual        , nelpipe        , 
              inod1pipe       , iel1seabedcont , iel1pipe       , 
-             sifname         )
+             filedynpost     )
 
-    file.close()
+    files = {"s.sif": file.getvalue(), "seabed.txt": fileseabed.getvalue(), "s.sdi": filedynpost.getvalue()}
 
-    #   Update global parameter nstep_dynres
-    st.session_state.SIMLA_nstep_dynres = int(nstep_dynres)
-
-    return
+    return files, nstep_dynres
@@ -0,0 +1,164 @@
+"""
+File: S4O_Mass_Search.py
+Description:
+Search for the minimum stable submerged mass of the product, i.e. the lowest submerged mass (df_Product row 1) for
+which the Mean+1StdDev of the absolute maximum lateral displacement stays below the design value (odFac times the
+outer diameter). The search starts with a bracket of submerged masses given by the user. In each round several
+candidate masses inside the bracket are run concurrently as the cases of a parametric sweep (S4O_Sweep), and the
+bracket is narrowed to the lowest stable and the highest unstable candidate below it. The search stops when the
+bracket is narrower than the tolerance, or with an error when a round does not narrow the bracket (no results for
+its candidates), and the results of all rounds are written to search.csv.
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Run_Mass_Search; Only stops when cancelled by the user, not when runs are cancelled as the statistics have converged.
+2026-10-18: S4O_Run_Mass_Search; Stops with an error when a round does not narrow the bracket, e.g. when all runs of the candidates failed, instead of running the same candidates again.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import math
+import numpy as np
+import pandas as pd
+from S4O_Sweep import S4O_Sweep_Table, S4O_Write_Sweep_Input_Files, S4O_Run_Sweep
+
+#	Sweep parameter of the submerged mass (S4O_Sweep_Parameter)
+S4O_MASS_PARAMETER = 'Product:1'
+
+#	Columns of the table of candidate masses
+S4O_MASS_COLUMNS = ['Round', 'Submerged mass [kg/m]', 'Realisations', 'Mean+1StdDev [m]', 'Stable']
+
+def S4O_Design_Value(state):
+
+	#	Return the design value of the lateral displacement, i.e. odFac times the outer diameter [m]
+	return float(state.df_Execution.iloc[5,1])*float(state.df_Product.iloc[0,1])
+#
+#
+
+def S4O_Mass_Candidates(low, high, ncand, first):
+
+	#	Return ncand candidate masses in the bracket low to high. In the first round the candidates are evenly
+	#	spaced from low to high, both included, to check the bracket. In the following rounds they are evenly
+	#	spaced inside the bracket, which is then narrowed by a factor ncand+1.
+	if first: return [float(mass) for mass in np.linspace(low, high, max(ncand, 2))]
+
+	return [low + (high - low)*icand/(ncand + 1) for icand in range(1, ncand+1)]
+#
+#
+
+def S4O_Update_Bracket(low, high, masses, values, design):
+
+	#	Return the bracket narrowed by the Mean+1StdDev values of the candidate masses: the upper bound is the
+	#	lowest stable mass (value not above design), and the lower bound the highest unstable mass below it.
+	#	Candidates without results (NaN) are not used.
+	stable = [mass for mass, value in zip(masses, values) if not math.isnan(value) and value <= design]
+	if len(stable) > 0: high = min(high, min(stable))
+	unstable = [mass for mass, value in zip(masses, values) if not math.isnan(value) and value > design and mass < high]
+	if len(unstable) > 0: low = max(low, max(unstable))
+
+	return low, high
+#
+#
+
+def S4O_Mass_Search_Table(status):
+
+	#	Return the table of the candidate masses of the finished rounds in status, followed by the candidates of
+	#	the round in progress
+	table = status.get('search', pd.DataFrame(columns=S4O_MASS_COLUMNS))
+	if 'searchcases' not in status or 'groupstats' not in status: return table
+
+	current = S4O_Sweep_Table(status, status['searchcases'], {S4O_MASS_PARAMETER: 'Submerged mass [kg/m]'})
+	current['Round'] = status['searchround']
+	current['Stable'] = ''
+	current = current[S4O_MASS_COLUMNS]
+	if len(table) == 0: return current
+
+	return pd.concat([table, current], ignore_index=True)
+#
+#
+
+def S4O_Run_Mass_Search(state, runcfg, search_path, low, high, tol, ncand, nrel, report, cancel=None):
+
+	#	Search for the minimum stable submerged mass in the bracket low to high [kg/m], running ncand candidate
+	#	masses with nrel realisations each per round, until the bracket is narrower than tol [kg/m]. Round n is
+	#	run in the directory search_path/roundn. state holds the model parameters (not st.session_state, as the
+	#	input files are generated in the background), report and cancel as for S4O_Schedule_Runs. Return the
+	#	status of the last round, with the candidates of all rounds in status['search'] and the minimum stable
+	#	mass in status['mass'] (None if not found).
+	design = S4O_Design_Value(state)
+	parameters = {S4O_MASS_PARAMETER: 'Submerged mass [kg/m]'}
+	rows = pd.DataFrame(columns=S4O_MASS_COLUMNS)
+	mass = None
+	status = {}
+	iround = 0
+	report(None, 'info', 'Searching for the minimum stable submerged mass from ' + '%.2f' % low + ' to ' + '%.2f' % high + ' kg/m, ' +
+		   str(ncand) + ' candidate masses per round. Design value : ' + '%.4f' % design + ' m.')
+
+	while True:
+		iround += 1
+		masses = S4O_Mass_Candidates(low, high, ncand, iround == 1)
+		cases = [{S4O_MASS_PARAMETER: candidate} for candidate in masses]
+		round_path = search_path + '/round' + str(iround)
+		nsteps = S4O_Write_Sweep_Input_Files(state, round_path, cases)
+
+		#	Keep the finished rounds and the candidates of this round in the status reported, for the table of
+		#	candidate masses (S4O_Mass_Search_Table)
+		def round_report(status, level, text):
+			if level == 'status':
+				status['search'] = rows
+				status['searchcases'] = cases
+				status['searchround'] = iround
+			report(status, level, text)
+
+		report(None, 'write', 'Round ' + str(iround) + ' : Submerged masses ' + ', '.join('%.2f' % candidate for candidate in masses) + ' kg/m.')
+		status = S4O_Run_Sweep(runcfg, round_path, cases, parameters, nrel, nsteps, round_report, cancel)
+		#	Stop if the search has been cancelled by the user. Runs cancelled because the statistics of a candidate
+		#	have converged (status['cancelled']) do not stop the search.
+		if cancel is not None and cancel.is_set(): break
+
+		values = list(status['sweep']['Mean+1StdDev [m]'])
+		current = status['sweep'][['Submerged mass [kg/m]', 'Realisations', 'Mean+1StdDev [m]']].copy()
+		current.insert(0, 'Round', iround)
+		current['Stable'] = ['' if math.isnan(value) else ('Yes' if value <= design else 'No') for value in values]
+		rows = pd.concat([rows, current], ignore_index=True) if len(rows) > 0 else current
+
+		#	Check the bracket in the first round: the highest mass must be stable, and if the lowest is stable
+		#	it is the result
+		if iround == 1:
+			if math.isnan(values[-1]) or values[-1] > design:
+				report(None, 'error', 'The product is not stable with the highest submerged mass (' + '%.2f' % high + ' kg/m). Increase the upper bound of the search.')
+				break
+			if not math.isnan(values[0]) and values[0] <= design:
+				mass = low
+				report(None, 'warning', 'The product is stable with the lowest submerged mass (' + '%.2f' % low + ' kg/m). Decrease the lower bound of the search.')
+				break
+
+		#	Stop if the bracket was not narrowed, as the next round would run the same candidate masses again. In the
+		#	first round the bracket is only narrowed by the candidates inside it.
+		newlow, newhigh = S4O_Update_Bracket(low, high, masses, values, design)
+		if iround > 1 and newlow == low and newhigh == high:
+			if all(math.isnan(value) for value in values):
+				report(None, 'error', 'Round ' + str(iround) + ' : No results for the candidate masses, as their runs failed. Stopping the search.')
+			else:
+				report(None, 'error', 'Round ' + str(iround) + ' : The bracket of submerged masses was not narrowed. Stopping the search.')
+			mass = None
+			break
+		low, high = newlow, newhigh
+		mass = high
+		report(None, 'info', 'Round ' + str(iround) + ' : Minimum stable submerged mass between ' + '%.2f' % low + ' and ' + '%.2f' % high + ' kg/m.')
+		if high - low <= tol: break
+
+	status['search'] = rows
+	status['mass'] = mass
+	status.pop('searchcases', None)
+	report(status, 'status', '')
+	rows.to_csv(search_path + '/search.csv', index=False)
+	if mass is not None and not (cancel is not None and cancel.is_set()):
+		report(status, 'info', 'Minimum stable submerged mass : ' + '%.2f' % mass + ' kg/m, after ' + str(iround) + ' rounds. Results written to : ' + search_path + '/search.csv')
+
+	return status
+#
+#
@@ -4,11 +4,13 @@ Description:
 These functions initiates and updates the df_Model pandas dataframe.
 Revisions:
 2025-09-05: S4O_Read_Model; Improved checking of version compability when opening an existing model file.
+2026-10-18: S4O_Model; Reset the number of executed runs when opening a model.
+2026-10-18: S4O_Read_Model; Reads the model file with S4O_ModelFile.S4O_Parse_Model_File, which is shared with S4O_Batch.
 """
 __author__ = "Egil Giertsen"
 __credits__ = [""]
 __license__ = "GPLv3"
-__version__ = "2025-09-05"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -19,6 +21,7 @@ from tkinter import filedialog
 import os
 import random
 from random import randint
+from S4O_ModelFile import S4O_Parse_Model_File
 
 #
 #	MODEL input function
@@ -54,6 +57,7 @@ def S4O_Model():
 		st.session_state.modelFileName = selected_file_name
 
 		if selected_file_path != '' and os.path.exists(selected_file_path):
+			st.session_state.noRunsExecuted = 0
 			S4O_Read_Model()
 		else:
 			st.error("File does not exist!", icon="🚨")
@@ -205,116 +209,12 @@ def S4O_Write_Model():
 
 def S4O_Read_Model():
 
-	#	Open file
-	f = open(st.session_state.modelFilePath, "r")
-
-	#	Read all lines
-	lines = f.readlines()
-
-	#	Close file
-	f.close()
-
-	#	Assign current SIMLA4OBS program version
-	currver = st.session_state.S4O_versionID.replace("SIMLA4OBS version ", "")
-
-	#	Loop through all lines in the file
-	nlines = len(lines)
-	for iline in range(nlines):
-
-		# Extract current line
-		cline = lines[iline]
-		cline = cline.strip()
-
-		if iline == 0 or iline == 2 or iline == 4 or iline == 6 or iline == 8 or iline == 10 or iline == 12:
-			#	Comment line, do nothing
-			continue
-		elif iline == 1:
-			#	Assign the SIMLA4OBS program version on file
-			filever = cline.replace("SIMLA4OBS version ", "")
-
-		elif iline == 3:
-			#	Store model title
-			st.session_state.modelMainTitle = cline
-
-		else:
-			#	STORE PARAMETERS READ FROM FILE
-
-			#	Split the current line into columns
-			columns = cline.split()
-			nvals = len(columns)
-
-			if iline == 5:
-				#	Check number of Product parameters on file
-				pvals = st.session_state.df_Product.shape[0]
-				if nvals != pvals:
-					st.error("Number of Product parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!", icon="🚨")
-					st.error("The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!", icon="🚨")
-					return
-				#	Store Product parameters
-				for ndx in range(nvals):
-					st.session_state.df_Product.iloc[ndx,1] = float(columns[ndx])
-
-			elif iline == 7:
-				#	Check number of Seabed parameters on file
-				pvals = st.session_state.df_Seabed.shape[0]
-				if nvals != pvals:
-					st.error("Number of Seabed parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!", icon="🚨")
-					st.error("The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!", icon="🚨")
-					return
-				#	Store Seabed parameters
-				for ndx in range(nvals):
-					if ndx == 0 or ndx == 9 or ndx == 14:
-						st.session_state.df_Seabed.iloc[ndx,1] = int(columns[ndx])
-					else:
-						st.session_state.df_Seabed.iloc[ndx,1] = float(columns[ndx])
-
-			elif iline == 9:
-				#	Check number of Environment parameters on file
-				pvals = st.session_state.df_Environment.shape[0]
-				if nvals != pvals:
-					st.error("Number of Environment parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!", icon="🚨")
-					st.error("The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!", icon="🚨")
-					return
-				#	Store Environment parameters
-				for ndx in range(nvals):
-					if ndx == 4 or ndx == 6 or ndx == 7:
-						st.session_state.df_Environment.iloc[ndx,1] = int(columns[ndx])
-					else:
-						st.session_state.df_Environment.iloc[ndx,1] = float(columns[ndx])
-
-			elif iline == 11:
-				#	Check number of Execution parameters on file
-				pvals = st.session_state.df_Execution.shape[0]
-				if nvals != pvals:
-					st.error("Number of Execution parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!", icon="🚨")
-					st.error("The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!", icon="🚨")
-					return
-				#	Store Execution parameters
-				for ndx in range(nvals):
-					if ndx == 3 :
-						st.session_state.df_Execution.iloc[ndx,1] = int(columns[ndx])
-						st.session_state.currentMaxRel = int(columns[ndx])
-					elif ndx == 6 :
-						st.session_state.df_Execution.iloc[ndx,1] = int(columns[ndx])
-						st.session_state.maxRunsPB = int(columns[ndx])
-					else:
-						st.session_state.df_Execution.iloc[ndx,1] = float(columns[ndx])
-
-			elif iline == 13:
-				#	Check number of Seed values on file
-				pvals = int(st.session_state.df_Execution.iloc[3,1])
-				if nvals != pvals:
-					st.error("Number of Seed values on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!", icon="🚨")
-					return
-				#	Store Seed values
-				st.session_state.listOfSeedNumbers = []
-				for ndx in range(nvals):
-					st.session_state.listOfSeedNumbers.append(int(columns[ndx]))
-
-			else:
-				st.error("Unexpected number of lines (" + str(nlines) + ") in model file!", icon="🚨")
-				st.error("The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!", icon="🚨")
-				return
+	#	Read the model file into st.session_state
+	errors = S4O_Parse_Model_File(st.session_state.modelFilePath, st.session_state)
+	if len(errors) > 0:
+		for error in errors:
+			st.error(error, icon="🚨")
+		return
 
 	st.rerun()
 
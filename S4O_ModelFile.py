@@ -0,0 +1,130 @@
+"""
+File: S4O_ModelFile.py
+Description:
+This function reads a SIMLA4OBS model file (.s4o) into the model parameters of a state object, which is
+st.session_state or an object with the same attributes when running without Streamlit (S4O_Batch).
+Revisions:
+2026-10-18: First version, moved from S4O_Model.S4O_Read_Model.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+def S4O_Parse_Model_File(file_path, state):
+
+	#	Read the model file file_path into the dataframes df_Product, df_Seabed, df_Environment and df_Execution
+	#	(which must hold the default values), the model title and the list of seed numbers in state.
+	#	Return a list of error messages, which is empty if the model file was read successfully.
+
+	#	Open file
+	f = open(file_path, "r")
+
+	#	Read all lines
+	lines = f.readlines()
+
+	#	Close file
+	f.close()
+
+	#	Assign current SIMLA4OBS program version
+	currver = state.S4O_versionID.replace("SIMLA4OBS version ", "")
+	filever = ''
+
+	#	Loop through all lines in the file
+	nlines = len(lines)
+	for iline in range(nlines):
+
+		# Extract current line
+		cline = lines[iline]
+		cline = cline.strip()
+
+		if iline == 0 or iline == 2 or iline == 4 or iline == 6 or iline == 8 or iline == 10 or iline == 12:
+			#	Comment line, do nothing
+			continue
+		elif iline == 1:
+			#	Assign the SIMLA4OBS program version on file
+			filever = cline.replace("SIMLA4OBS version ", "")
+
+		elif iline == 3:
+			#	Store model title
+			state.modelMainTitle = cline
+
+		else:
+			#	STORE PARAMETERS READ FROM FILE
+
+			#	Split the current line into columns
+			columns = cline.split()
+			nvals = len(columns)
+
+			if iline == 5:
+				#	Check number of Product parameters on file
+				pvals = state.df_Product.shape[0]
+				if nvals != pvals:
+					return ["Number of Product parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!",
+							"The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!"]
+				#	Store Product parameters
+				for ndx in range(nvals):
+					state.df_Product.iloc[ndx,1] = float(columns[ndx])
+
+			elif iline == 7:
+				#	Check number of Seabed parameters on file
+				pvals = state.df_Seabed.shape[0]
+				if nvals != pvals:
+					return ["Number of Seabed parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!",
+							"The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!"]
+				#	Store Seabed parameters
+				for ndx in range(nvals):
+					if ndx == 0 or ndx == 9 or ndx == 14:
+						state.df_Seabed.iloc[ndx,1] = int(columns[ndx])
+					else:
+						state.df_Seabed.iloc[ndx,1] = float(columns[ndx])
+
+			elif iline == 9:
+				#	Check number of Environment parameters on file
+				pvals = state.df_Environment.shape[0]
+				if nvals != pvals:
+					return ["Number of Environment parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!",
+							"The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!"]
+				#	Store Environment parameters
+				for ndx in range(nvals):
+					if ndx == 4 or ndx == 6 or ndx == 7:
+						state.df_Environment.iloc[ndx,1] = int(columns[ndx])
+					else:
+						state.df_Environment.iloc[ndx,1] = float(columns[ndx])
+
+			elif iline == 11:
+				#	Check number of Execution parameters on file
+				pvals = state.df_Execution.shape[0]
+				if nvals != pvals:
+					return ["Number of Execution parameters on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!",
+							"The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!"]
+				#	Store Execution parameters
+				for ndx in range(nvals):
+					if ndx == 3 :
+						state.df_Execution.iloc[ndx,1] = int(columns[ndx])
+						state.currentMaxRel = int(columns[ndx])
+					elif ndx == 6 :
+						state.df_Execution.iloc[ndx,1] = int(columns[ndx])
+						state.maxRunsPB = int(columns[ndx])
+					else:
+						state.df_Execution.iloc[ndx,1] = float(columns[ndx])
+
+			elif iline == 13:
+				#	Check number of Seed values on file
+				pvals = int(state.df_Execution.iloc[3,1])
+				if nvals != pvals:
+					return ["Number of Seed values on file (" + str(nvals) + ") is different from the expected number (" + str(pvals) + ")!"]
+				#	Store Seed values
+				state.listOfSeedNumbers = []
+				for ndx in range(nvals):
+					state.listOfSeedNumbers.append(int(columns[ndx]))
+
+			else:
+				return ["Unexpected number of lines (" + str(nlines) + ") in model file!",
+						"The current SIMLA4OBS program version (" + currver + ") is probably newer than the version you used when saving the model (" + filever + ")!"]
+
+	return []
+#
+#
@@ -0,0 +1,138 @@
+"""
+File: S4O_ModelSpec.py
+Description:
+Model specification of a SIMLA4OBS model: the parameters used to generate the SIMLA input files, read once from the
+parameter tables of the model state (st.session_state, or an object with the same attributes when running without
+Streamlit). The specification is immutable and contains only numbers and strings, so it can be pickled and sent to
+worker processes and remote nodes. The input files of a realisation are a function of the specification and the
+realisation number only (S4O_Make_SIMLA_Input_Files), as the wave seeds of the realisations are part of the
+specification.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class S4O_Model_Spec:
+
+	#	Model title
+	title: str
+
+	#	PRODUCT parameters
+	diam: float					#	Outer diameter (without marine growth) [m]
+	submass: float				#	Submerged mass [kg/m]
+	th_margrow: float			#	Thickness of marine growth [m]
+	rho_margrow: float			#	Density of marine growth [kg/m3]
+
+	#	SEABED parameters, y-direction
+	imody: int					#	Y-direction PSI model
+	gamd_sand: float			#	Sand dry unit weight [N/m3]
+	su_clay: float				#	Undrained shear strength [N/m2]
+	gamd_clay: float			#	Clay dry unit weight [N/m3]
+	gams_drain: float			#	Drained submerged unit weight [N/m3]
+	su_y_undrain: float			#	Undrained shear strength [N/m2]
+	gams_undrain: float			#	Undrained submerged unit weight [N/m3]
+	muy: float					#	Coulomb friction factor [-]
+	kstick: float				#	Elastic stick stiffness [N/m2]
+
+	#	SEABED parameters, z-direction
+	imodz: int					#	Z-direction PSI model
+	gams_z_drain: float			#	Drained submerged unit weight z-dir [N/m3]
+	su_z_undrain: float			#	Undrained shear strength z-dir [N/m2]
+	gams_z_undrain: float		#	Undrained submerged unit weight z-dir [N/m3]
+	kz_const: float				#	Elastic stiffness z-dir [N/m2]
+
+	#	SEABED parameters, initial penetration
+	ipenmod: int				#	Initial penetration mode : 1=Specify, 2=Calculate
+	uz_ini: float				#	Initial penetration, specified [m]
+	T0: float					#	Horizontal lay tension, for klay-calculations [N]
+	submass_lay: float			#	Submerged mass during lay [kg/m]
+	EI: float					#	Bending stiffness, for klay-calculations [Nm2]
+
+	#	ENVIRONMENT parameters
+	depth: float				#	Water depth [m]
+	Hs: float					#	Significant wave height [m]
+	Tp: float					#	Peak wave period [s]
+	wavdir: float				#	Wave direction [deg]
+	iwavespec: int				#	Wave spectrum : 1=PM, 2=JONSWAP
+	pkdness: float				#	Peakedness parameter
+	chspread: str				#	Wave spreading type : "long", "short"
+	ndir: int					#	Number of directions
+	spreadpar: float			#	Spreading function exponent
+	curvel: float				#	Current velocity [m/s]
+	curdir: float				#	Current direction [deg]
+	cuhref: float				#	Current reference height [m]
+	curough: float				#	Seabed roughness [m]
+	d50: float					#	Median grain size [m]
+
+	#	EXECUTION parameters
+	dtdyn: float				#	Time step size in dynamic analysis [s]
+	duration: float				#	Sea state duration [h]
+	tramp: float				#	Wave load ramping time [s]
+
+	#	Wave seeds of the realisations
+	seeds: tuple
+#
+#
+
+def S4O_Model_Spec_From_State(state):
+
+	#	Return the model specification with the parameters in the tables of state
+	product = state.df_Product.iloc[:,1]
+	seabed = state.df_Seabed.iloc[:,1]
+	environment = state.df_Environment.iloc[:,1]
+	execution = state.df_Execution.iloc[:,1]
+
+	spec = S4O_Model_Spec(title=str(state.modelMainTitle),
+						  diam=float(product.iloc[0]),
+						  submass=float(product.iloc[1]),
+						  th_margrow=float(product.iloc[2]),
+						  rho_margrow=float(product.iloc[3]),
+						  imody=int(state.SeabedValues[int(seabed.iloc[0])]),
+						  gamd_sand=float(seabed.iloc[1]),
+						  su_clay=float(seabed.iloc[2]),
+						  gamd_clay=float(seabed.iloc[3]),
+						  gams_drain=float(seabed.iloc[4]),
+						  su_y_undrain=float(seabed.iloc[5]),
+						  gams_undrain=float(seabed.iloc[6]),
+						  muy=float(seabed.iloc[7]),
+						  kstick=float(seabed.iloc[8]),
+						  imodz=int(state.SeabedValues[int(seabed.iloc[9])]),
+						  gams_z_drain=float(seabed.iloc[10]),
+						  su_z_undrain=float(seabed.iloc[11]),
+						  gams_z_undrain=float(seabed.iloc[12]),
+						  kz_const=float(seabed.iloc[13]),
+						  ipenmod=int(state.PenetrationValues[int(seabed.iloc[14])]),
+						  uz_ini=float(seabed.iloc[15]),
+						  T0=float(seabed.iloc[16]),
+						  submass_lay=float(seabed.iloc[17]),
+						  EI=float(seabed.iloc[18]),
+						  depth=float(environment.iloc[0]),
+						  Hs=float(environment.iloc[1]),
+						  Tp=float(environment.iloc[2]),
+						  wavdir=float(environment.iloc[3]),
+						  iwavespec=int(state.WaveSpectraValues[int(environment.iloc[4])]),
+						  pkdness=float(environment.iloc[5]),
+						  chspread=str(state.WaveSpreadingValues[int(environment.iloc[6])]),
+						  ndir=int(environment.iloc[7]),
+						  spreadpar=float(environment.iloc[8]),
+						  curvel=float(environment.iloc[9]),
+						  curdir=float(environment.iloc[10]),
+						  cuhref=float(environment.iloc[11]),
+						  curough=float(environment.iloc[12]),
+						  d50=float(environment.iloc[13]),
+						  dtdyn=float(execution.iloc[0]),
+						  duration=float(execution.iloc[1]),
+						  tramp=float(execution.iloc[2]),
+						  seeds=tuple(int(seed) for seed in state.listOfSeedNumbers))
+
+	return spec
+#
+#
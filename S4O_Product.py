@@ -3,12 +3,12 @@ File: S4O_Product.py
 Description:
 These functions initiates and updates the df_Product pandas dataframe.
 Revisions:
-YYYY-MM-DD:
+2026-10-18: S4O_Product_Defaults; Takes the state to assign the defaults in as argument (st.session_state by default), for use without Streamlit.
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-03-14"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -64,10 +64,10 @@ def S4O_Product():
 # PRODUCT set defaults function
 #
 
-def S4O_Product_Defaults ():
+def S4O_Product_Defaults (state=st.session_state):
 
 	#	Assign default product parameters
-	if 'df_Product' not in st.session_state:
+	if 'df_Product' not in state:
 		Od = 0.190
 		Sm = 36.0
 		MGt = 0.01
@@ -77,10 +77,10 @@ def S4O_Product_Defaults ():
 
 	Pdata = [['Outer diameter [m] :', Od], ['Submerged mass [kg/m] :', Sm],
 			 ['Thickness [m] :', MGt], ['Density [kg/m3] :', MGd]]
-	st.session_state.df_Product = pd.DataFrame(Pdata, columns=['Product parameter','Value'])
+	state.df_Product = pd.DataFrame(Pdata, columns=['Product parameter','Value'])
 	
-	st.session_state.Product_OK = True
+	state.Product_OK = True
 
-	return st.session_state.df_Product,st.session_state.Product_OK
+	return state.df_Product,state.Product_OK
 #
 #
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+File: S4O_Progress.py
+Description:
+These functions estimate the progress of running SIMLA analyses from the simulated time reported by SIMLA,
+relative to the end time of the analysis (tdurwave+tend_static, the last TIMECO card in the input file). When no
+simulated time is found in the output of a run, its progress is estimated from its elapsed wall-clock time relative
+to the mean duration of the runs finished (S4O_Elapsed_Fraction).
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Progress_Marker; New function used to detect runs that have stopped progressing.
+2026-10-18: S4O_Elapsed_Fraction; New function estimating the progress of a run from its elapsed wall-clock time, used when no simulated time is found in its output.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import re
+
+#	Pattern for the simulated time in the SIMLA print output and list file, e.g. "TIME = 1.234E+02" or "Time: 123.4".
+#	The pattern matches the output of the synthetic SIMLA (S4O_Synthetic), but has not been checked against the
+#	output of SIMLA, so the progress falls back on the elapsed wall-clock time if nothing matches.
+S4O_SIMLA_TIME_PATTERN = re.compile(r'\bTIME\s*[=:]\s*([-+]?\d+\.?\d*(?:[EeDd][-+]?\d+)?)', re.IGNORECASE)
+
+#	Files searched for the simulated time, in order, and the number of bytes read from the end of each file
+S4O_PROGRESS_FILES = ['simla_print.out', 's.slf']
+S4O_PROGRESS_TAIL = 65536
+
+#	Largest fraction of a run in progress estimated from its elapsed wall-clock time, as the run has not finished
+S4O_ELAPSED_FRACTION_MAX = 0.95
+
+def S4O_Read_End_Time(sifname):
+
+	#	Return the end time of the analysis, i.e. the time of the last TIMECO card in the SIMLA input file
+	#	(0.0 if not found)
+	tend = 0.0
+	if not os.path.exists(sifname): return tend
+
+	with open(sifname, 'r') as sif:
+		for line in sif:
+			columns = line.split()
+			if len(columns) > 1 and columns[0] == 'TIMECO':
+				try:
+					tend = max(tend, float(columns[1]))
+				except ValueError:
+					pass
+
+	return tend
+#
+#
+
+def S4O_Read_Simulated_Time(run_path):
+
+	#	Return the last simulated time reported by SIMLA in the run directory run_path (0.0 if none yet)
+	for name in S4O_PROGRESS_FILES:
+		fname = os.path.join(run_path, name)
+		if not os.path.exists(fname): continue
+
+		#	Read the end of the file only, as the file grows during the analysis
+		with open(fname, 'rb') as f:
+			f.seek(0, os.SEEK_END)
+			size = f.tell()
+			f.seek(max(size - S4O_PROGRESS_TAIL, 0))
+			tail = f.read().decode('latin-1')
+
+		matches = S4O_SIMLA_TIME_PATTERN.findall(tail)
+		if len(matches) > 0:
+			try:
+				return float(matches[-1].replace('D', 'E').replace('d', 'e'))
+			except ValueError:
+				pass
+
+	return 0.0
+#
+#
+
+def S4O_Progress_Marker(run_path):
+
+	#	Return the sizes of the files SIMLA writes to during the analysis in run_path, which change as long as
+	#	the analysis progresses
+	marker = []
+	for name in S4O_PROGRESS_FILES:
+		fname = os.path.join(run_path, name)
+		if os.path.exists(fname):
+			marker.append(os.path.getsize(fname))
+		else:
+			marker.append(-1)
+
+	return tuple(marker)
+#
+#
+
+def S4O_Run_Fraction(run_path, tend):
+
+	#	Return the fraction (0-1) of the analysis in run_path that has been simulated, given its end time tend
+	if tend <= 0.0: return 0.0
+	fraction = S4O_Read_Simulated_Time(run_path)/tend
+
+	return min(max(fraction, 0.0), 1.0)
+#
+#
+
+def S4O_Elapsed_Fraction(elapsed, durations):
+
+	#	Return the fraction (0-1) of a run in progress estimated from its elapsed wall-clock time [s] relative to the
+	#	mean duration [s] of the runs finished, at most S4O_ELAPSED_FRACTION_MAX (0.0 if no run has finished)
+	if len(durations) == 0: return 0.0
+	duration = sum(durations)/len(durations)
+	if duration <= 0.0: return S4O_ELAPSED_FRACTION_MAX
+
+	return min(max(elapsed/duration, 0.0), S4O_ELAPSED_FRACTION_MAX)
+#
+#
+
+def S4O_Estimate_Remaining(fraction, elapsed):
+
+	#	Return the estimated remaining wall-clock time [s] when the fraction (0-1) of the work is done after
+	#	elapsed seconds, or -1.0 if it can not be estimated yet
+	if fraction <= 0.0: return -1.0
+	if fraction >= 1.0: return 0.0
+
+	return elapsed*(1.0 - fraction)/fraction
+#
+#
+
+def S4O_Format_Duration(seconds):
+
+	#	Format a duration in seconds as h:mm:ss ('-' if negative, i.e. unknown)
+	if seconds < 0.0: return '-'
+	seconds = int(seconds + 0.5)
+
+	return '%d:%02d:%02d' % (seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+#
+#
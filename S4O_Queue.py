@@ -0,0 +1,427 @@
+"""
+File: S4O_Queue.py
+Description:
+Durable job queue of SIMLA4OBS models. The queued models (.s4o) are run one after the other, each with all its
+realisations, and the Results table of each model is written to results.csv in its model directory.
+The queue and the state of each realisation (queued, running, done, failed or cancelled, with the start and finish
+times and the host) are journaled in an SQLite database, so the queue survives a crash or restart: a model that was
+running is started again first, skipping the realisations already completed with the current input (as "Resume").
+
+The queue is worked through in the background execution engine (S4O_Engine) of the dashboard, or from the
+command line with:
+python S4O_Queue.py add model.s4o [model.s4o ...] [--db FILE] [--max-concurrent N] [--simulate]
+python S4O_Queue.py run [--db FILE] [--simla-home DIR]
+python S4O_Queue.py list [--db FILE]
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_QUEUE_OPTIONS; Added the options of the synthetic SIMLA runs.
+2026-10-18: S4O_QUEUE_OPTIONS; Added the option of running DYNPOST MPF after each SIMLA run.
+2026-10-18: S4O_QUEUE_OPTIONS; Added the retention policy of the output files.
+2026-10-18: S4O_QUEUE_OPTIONS; Added the options of running in local scratch directories.
+2026-10-18: S4O_Run_Queued_Model; Assigns the number of DYNRES steps from the model parameters when the input files are not generated.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+import psutil
+from S4O_Engine import S4O_Engine_Job, S4O_Engine_Submit, S4O_Engine_Job_For
+from S4O_ModelFile import S4O_Parse_Model_File
+from S4O_Launcher import S4O_Set_SIMLA_Environment
+from S4O_SIMLA import S4O_Write_Input_Files, S4O_Assign_Run_Steps, S4O_Assign_Run_Config, S4O_Schedule_Runs, S4O_Store_Run_Status
+
+#	Default queue database, and the key of the queue in the background execution engine
+S4O_QUEUE_DB = os.path.expanduser('~') + '/.simla4obs/queue.db'
+S4O_QUEUE_ENGINE_KEY = 'S4O_Queue'
+
+#	Execution options stored with each queued model, applied on top of the values in the model file
+S4O_QUEUE_OPTIONS = ['maxRunsPB', 'AdaptiveRuns', 'minRunsPB', 'PinRuns', 'RunNice', 'RunIONice', 'RunMemoryMaxGB',
+					 'SimulateRuns', 'SyntheticRuns', 'SyntheticRunTime', 'SyntheticLoad', 'RunDYNPOSTMPF', 'ExtendedPrint', 'GenerateInputs', 'UseResultCache', 'ResultCacheDir', 'ResultCacheMaxGB', 'RetentionPolicy', 'RetentionMinMB', 'ScratchRuns', 'ScratchDir',
+					 'KillOnConvergence', 'RunTimeoutMin', 'StallTimeoutMin', 'RunRetries',
+					 'DistributedRuns', 'DistributedPort', 'DistributedKey', 'LocalWorkers']
+
+#	Time without a journal entry after which a model running on another host is considered abandoned [s]
+S4O_QUEUE_STALE = 600.0
+
+S4O_QUEUE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS models (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	path TEXT NOT NULL,
+	position INTEGER NOT NULL,
+	state TEXT NOT NULL,
+	options TEXT NOT NULL,
+	owner TEXT NOT NULL DEFAULT '',
+	nruns INTEGER NOT NULL DEFAULT 0,
+	submitted REAL NOT NULL DEFAULT 0.0,
+	started REAL NOT NULL DEFAULT 0.0,
+	finished REAL NOT NULL DEFAULT 0.0,
+	heartbeat REAL NOT NULL DEFAULT 0.0,
+	message TEXT NOT NULL DEFAULT '');
+CREATE TABLE IF NOT EXISTS runs (
+	model INTEGER NOT NULL,
+	irun INTEGER NOT NULL,
+	state TEXT NOT NULL,
+	started REAL NOT NULL DEFAULT 0.0,
+	finished REAL NOT NULL DEFAULT 0.0,
+	host TEXT NOT NULL DEFAULT '',
+	attempts INTEGER NOT NULL DEFAULT 0,
+	message TEXT NOT NULL DEFAULT '',
+	PRIMARY KEY (model, irun));
+'''
+
+def S4O_Queue_Connect(db):
+
+	#	Open the queue database db, creating it if it does not exist. Transactions are started explicitly.
+	os.makedirs(os.path.dirname(os.path.abspath(db)), exist_ok=True)
+	conn = sqlite3.connect(db, timeout=30.0, isolation_level=None)
+	conn.row_factory = sqlite3.Row
+	conn.execute('PRAGMA journal_mode=WAL')
+	conn.executescript(S4O_QUEUE_SCHEMA)
+
+	return conn
+#
+#
+
+def S4O_Queue_Owner():
+
+	#	Return the owner of the models run by this process
+	return socket.gethostname() + ':' + str(os.getpid())
+#
+#
+
+def S4O_Queue_Owner_Alive(owner, heartbeat):
+
+	#	Return True if the process owner (host:pid) running a model is still alive. For other hosts, the model
+	#	is considered abandoned when it has not been journaled for S4O_QUEUE_STALE seconds.
+	host, pid = owner.rsplit(':', 1)
+	if host != socket.gethostname(): return time.time() - heartbeat < S4O_QUEUE_STALE
+
+	return psutil.pid_exists(int(pid))
+#
+#
+
+def S4O_Queue_Add(db, path, options):
+
+	#	Add the model file path last in the queue, with the execution options (see S4O_QUEUE_OPTIONS).
+	#	Return the id of the queued model.
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('BEGIN IMMEDIATE')
+		position = conn.execute('SELECT COALESCE(MAX(position), 0) + 1 FROM models').fetchone()[0]
+		cursor = conn.execute('INSERT INTO models (path, position, state, options, submitted) VALUES (?, ?, ?, ?, ?)',
+							  (path, position, 'queued', json.dumps(options), time.time()))
+		conn.execute('COMMIT')
+
+		return cursor.lastrowid
+#
+#
+
+def S4O_Queue_Models(db):
+
+	#	Return the models in the queue in the order they are run, as dictionaries with the columns of the models
+	#	table and the number of runs done, failed and running
+	with closing(S4O_Queue_Connect(db)) as conn:
+		rows = conn.execute('''SELECT models.*,
+							   (SELECT COUNT(*) FROM runs WHERE runs.model = models.id AND runs.state = 'done') AS ndone,
+							   (SELECT COUNT(*) FROM runs WHERE runs.model = models.id AND runs.state = 'failed') AS nfailed,
+							   (SELECT COUNT(*) FROM runs WHERE runs.model = models.id AND runs.state = 'running') AS nrunning
+							   FROM models ORDER BY position''').fetchall()
+
+		return [dict(row) for row in rows]
+#
+#
+
+def S4O_Queue_Runs(db, model):
+
+	#	Return the runs (realisations) of the queued model, as dictionaries with the columns of the runs table
+	with closing(S4O_Queue_Connect(db)) as conn:
+		rows = conn.execute('SELECT * FROM runs WHERE model = ? ORDER BY irun', (model,)).fetchall()
+
+		return [dict(row) for row in rows]
+#
+#
+
+def S4O_Queue_Pending(db):
+
+	#	Return True if there are models queued or running in the queue
+	with closing(S4O_Queue_Connect(db)) as conn:
+		return conn.execute("SELECT COUNT(*) FROM models WHERE state IN ('queued', 'running')").fetchone()[0] > 0
+#
+#
+
+def S4O_Queue_Move(db, model, offset):
+
+	#	Move a queued model offset places (-1 is up) among the models waiting in the queue
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('BEGIN IMMEDIATE')
+		rows = conn.execute("SELECT id, position FROM models WHERE state = 'queued' ORDER BY position").fetchall()
+		ids = [row['id'] for row in rows]
+		if model in ids:
+			i = ids.index(model)
+			j = min(max(i + offset, 0), len(ids) - 1)
+			if i != j:
+				conn.execute('UPDATE models SET position = ? WHERE id = ?', (rows[j]['position'], rows[i]['id']))
+				conn.execute('UPDATE models SET position = ? WHERE id = ?', (rows[i]['position'], rows[j]['id']))
+		conn.execute('COMMIT')
+
+	return
+#
+#
+
+def S4O_Queue_Cancel(db, model):
+
+	#	Cancel a queued model. A running model is stopped by the process running it at its next journal entry.
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute("UPDATE models SET state = 'cancelled', finished = ?, message = 'Cancelled.' WHERE id = ? AND state IN ('queued', 'running')",
+					 (time.time(), model))
+
+	return
+#
+#
+
+def S4O_Queue_Clear(db):
+
+	#	Remove the models that are done, failed or cancelled from the queue
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('BEGIN IMMEDIATE')
+		conn.execute("DELETE FROM runs WHERE model IN (SELECT id FROM models WHERE state IN ('done', 'failed', 'cancelled'))")
+		conn.execute("DELETE FROM models WHERE state IN ('done', 'failed', 'cancelled')")
+		conn.execute('COMMIT')
+
+	return
+#
+#
+
+def S4O_Queue_Claim(db):
+
+	#	Return the next model to run as a dictionary, and mark it as running by this process, or None if there
+	#	are no models to run. A model left running by a process that has stopped (crashed) is taken first.
+	owner = S4O_Queue_Owner()
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('BEGIN IMMEDIATE')
+		rows = conn.execute("SELECT * FROM models WHERE state IN ('queued', 'running') ORDER BY state = 'queued', position").fetchall()
+		for row in rows:
+			if row['state'] == 'running' and S4O_Queue_Owner_Alive(row['owner'], row['heartbeat']): continue
+			now = time.time()
+			started = row['started']
+			if started == 0.0: started = now
+			conn.execute("UPDATE models SET state = 'running', owner = ?, started = ?, heartbeat = ?, message = '' WHERE id = ?",
+						 (owner, started, now, row['id']))
+			conn.execute('COMMIT')
+			return dict(row)
+		conn.execute('COMMIT')
+
+	return None
+#
+#
+
+def S4O_Queue_Journal(db, model, runs, nruns=0):
+
+	#	Store the state of the runs (dictionary keyed by run number, as status['runs'] of S4O_Schedule_Runs) of a
+	#	running model. If nruns > 0, the runs journaled earlier are deleted and the number of runs is set first.
+	#	Return the state of the model, which is 'cancelled' if it has been cancelled.
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('BEGIN IMMEDIATE')
+		if nruns > 0:
+			conn.execute('DELETE FROM runs WHERE model = ?', (model,))
+			conn.execute('UPDATE models SET nruns = ? WHERE id = ?', (nruns, model))
+		conn.executemany('INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+						 [(model, irun, runs[irun]['state'], runs[irun]['started'], runs[irun]['finished'], runs[irun]['host'],
+						   runs[irun]['attempts'], runs[irun]['message']) for irun in runs])
+		conn.execute('UPDATE models SET heartbeat = ? WHERE id = ?', (time.time(), model))
+		state = conn.execute('SELECT state FROM models WHERE id = ?', (model,)).fetchone()[0]
+		conn.execute('COMMIT')
+
+		return state
+#
+#
+
+def S4O_Queue_Finish(db, model, state, message):
+
+	#	Set the state of a running model when it has finished ('queued' to run it again), unless it has been cancelled
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute("UPDATE models SET state = ?, owner = '', finished = ?, message = ? WHERE id = ? AND state = 'running'",
+					 (state, time.time(), message, model))
+
+	return
+#
+#
+
+def S4O_Run_Queued_Model(db, model, simla_home, report, cancel):
+
+	#	Run all realisations of the queued model (dictionary from S4O_Queue_Claim), journal the state of the runs
+	#	and write the Results table to results.csv in the model directory. report and cancel as S4O_Schedule_Runs.
+
+	#	S4O_Batch is imported here, as it imports S4O_Execution, which imports this module
+	from S4O_Batch import S4O_Batch_Initial_State
+
+	file_path = model['path']
+	report(None, 'info', 'Running queued model ' + file_path + '.')
+	if not os.path.exists(file_path):
+		report(None, 'error', 'Model file does not exist : ' + file_path)
+		S4O_Queue_Finish(db, model['id'], 'failed', 'Model file does not exist.')
+		return
+
+	#	Read the model file and apply the execution options of the queued model. Runs already completed with the
+	#	current input are always skipped, so a model interrupted by a crash continues where it stopped.
+	state = S4O_Batch_Initial_State(simla_home)
+	state.modelFilePath = file_path
+	state.modelFileDir = os.path.dirname(file_path)
+	state.modelFileName = os.path.splitext(os.path.basename(file_path))[0]
+	errors = S4O_Parse_Model_File(file_path, state)
+	if len(errors) > 0:
+		for error in errors:
+			report(None, 'error', error)
+		S4O_Queue_Finish(db, model['id'], 'failed', errors[0])
+		return
+	options = json.loads(model['options'])
+	for key in options:
+		state[key] = options[key]
+	state.ResumeRuns = True
+
+	nrunsmax = int(state.df_Execution.iloc[3,1])
+	mod_path = state.modelFileDir + "/" + state.modelFileName
+	job = S4O_Engine_Job_For(mod_path)
+	if job is not None and job.running():
+		report(None, 'error', 'The SIMLA analyses of the model ' + mod_path + ' are already running in the dashboard!')
+		S4O_Queue_Finish(db, model['id'], 'failed', 'Already running in the dashboard.')
+		return
+
+	#	Generate the input files
+	if options.get('GenerateInputs', True): S4O_Write_Input_Files(state, mod_path, 1, nrunsmax)
+	else: S4O_Assign_Run_Steps(state)
+
+	#	Execute the runs, journaling the state of the runs that have changed with each status report. The runs are
+	#	stopped if the model is cancelled in the queue, or the queue is stopped.
+	modelcancel = threading.Event()
+	runcfg = S4O_Assign_Run_Config(state)
+	journaled = {}
+	S4O_Queue_Journal(db, model['id'], {irun: {'state': 'queued', 'started': 0.0, 'finished': 0.0, 'host': '', 'attempts': 0, 'message': ''}
+										for irun in range(1, nrunsmax+1)}, nrunsmax)
+
+	def journal(status, level, text):
+		if level == 'status':
+			changed = {}
+			for irun in status['runs']:
+				if status['runs'][irun] != journaled.get(irun): changed[irun] = dict(status['runs'][irun])
+			try:
+				if S4O_Queue_Journal(db, model['id'], changed) == 'cancelled': modelcancel.set()
+				journaled.update(changed)
+			except sqlite3.Error as e:
+				report(status, 'warning', 'Failed to journal the runs in the queue database : ' + str(e))
+			if cancel.is_set(): modelcancel.set()
+		report(status, level, text)
+		return
+
+	status = S4O_Schedule_Runs(runcfg, 1, nrunsmax, journal, modelcancel)
+	S4O_Queue_Journal(db, model['id'], status['runs'])
+
+	#	Write the Results table
+	S4O_Store_Run_Status(state, status)
+	results_path = mod_path + '/results.csv'
+	state.df_Results.to_csv(results_path, index=False)
+	report(None, 'write', 'Results written to : ' + results_path)
+
+	if cancel.is_set():
+		S4O_Queue_Finish(db, model['id'], 'queued', 'Interrupted, continued when the queue is run again.')
+	elif len(status['failed']) > 0:
+		S4O_Queue_Finish(db, model['id'], 'failed', str(len(status['failed'])) + ' runs failed. Results written to ' + results_path + '.')
+	else:
+		S4O_Queue_Finish(db, model['id'], 'done', 'Results written to ' + results_path + '.')
+
+	return
+#
+#
+
+def S4O_Run_Queue(db, simla_home, report, cancel):
+
+	#	Run the models in the queue db one after the other until the queue is empty or cancel (threading.Event)
+	#	is set. Messages and status are passed to report(status, level, text) as by S4O_Schedule_Runs.
+	#	Return the number of models run.
+	nmodels = 0
+	while not cancel.is_set():
+		model = S4O_Queue_Claim(db)
+		if model is None: break
+		try:
+			S4O_Run_Queued_Model(db, model, simla_home, report, cancel)
+		except Exception as e:
+			report(None, 'error', 'Failed to run queued model ' + model['path'] + ' : ' + str(e))
+			S4O_Queue_Finish(db, model['id'], 'failed', str(e))
+		nmodels += 1
+
+	return nmodels
+#
+#
+
+def S4O_Queue_Start(db, simla_home):
+
+	#	Start working through the queue db in the background execution engine, unless it is running already.
+	#	Return True if started.
+	job = S4O_Engine_Job(S4O_Run_Queue, (db, simla_home), 'the job queue')
+
+	return S4O_Engine_Submit(S4O_QUEUE_ENGINE_KEY, job)
+#
+#
+
+def S4O_Queue(argv=None):
+
+	#	S4O_Batch is imported here, as it imports S4O_Execution, which imports this module
+	from S4O_Batch import S4O_Batch_Report
+
+	#	Parse the command line arguments
+	parser = argparse.ArgumentParser(prog='S4O_Queue', description='Queue SIMLA4OBS models (.s4o) and run them one after the other.')
+	parser.add_argument('command', choices=['add', 'run', 'list'], help='add models to the queue, run the queue or list it')
+	parser.add_argument('models', nargs='*', help='SIMLA4OBS model files (.s4o) to add')
+	parser.add_argument('--db', default=S4O_QUEUE_DB, help='queue database (default: ' + S4O_QUEUE_DB + ')')
+	parser.add_argument('--simla-home', default=os.environ.get('SIMLA_HOME', 'C:/SINTEFOcean/SIMLA/SIMLA-3.25.0-win64'),
+						help='SIMLA installation directory (default: $SIMLA_HOME)')
+	parser.add_argument('--max-concurrent', type=int, default=0,
+						help='maximum number of concurrent runs of the added models (default: the value in the model file)')
+	parser.add_argument('--simulate', action='store_true', help='simulate the SIMLA runs of the added models with the sleep command')
+	args = parser.parse_args(argv)
+
+	if args.command == 'add':
+		options = {'SimulateRuns': args.simulate}
+		if args.max_concurrent > 0: options['maxRunsPB'] = args.max_concurrent
+		for model in args.models:
+			if not os.path.exists(model):
+				print('ERROR : Model file does not exist : ' + model, file=sys.stderr)
+				return 2
+			print('Queued model ' + str(S4O_Queue_Add(args.db, os.path.abspath(model), options)) + ' : ' + os.path.abspath(model))
+
+	elif args.command == 'list':
+		for model in S4O_Queue_Models(args.db):
+			print('%4i  %-10s %4i/%-4i %4i failed  %s  %s' % (model['id'], model['state'], model['ndone'], model['nruns'],
+															  model['nfailed'], model['path'], model['message']))
+
+	else:
+		#	Run the queue in a separate thread, so it can be interrupted with Ctrl+C. The model in progress is
+		#	then stopped and continued when the queue is run again.
+		S4O_Set_SIMLA_Environment(args.simla_home)
+		cancel = threading.Event()
+		runner = threading.Thread(target=S4O_Run_Queue, args=(args.db, args.simla_home, S4O_Batch_Report, cancel), daemon=True)
+		runner.start()
+		try:
+			while runner.is_alive(): runner.join(1.0)
+		except KeyboardInterrupt:
+			print('Stopping the queue ...', flush=True)
+			cancel.set()
+			runner.join()
+
+	return 0
+#
+#
+
+if __name__ == '__main__':
+	sys.exit(S4O_Queue())
@@ -6,11 +6,18 @@ Revisions:
 2025-09-19: S4O_ReadTSArrays, S4O_ReadTSMaxMin; Cleaned up wording and code related to "Assign index to the last non-zero time value".
 2025-09-23: S4O_ReadTSArrays, S4O_ReadTSMaxMin; Added "ndxstart" as input parameter to be able to remove the "static configuration + wave load ramping time" from the time series if specified by the user.
 2025-09-23: S4O_Show_TS_Plot; Added checkbox "Include wave load ramping time". Default = True.
+2026-10-18: S4O_Generate_Results; Moved the statistics into S4O_Calculate_Statistics and S4O_Check_StdDev_Tolerance so they can be evaluated while the runs are executing.
+2026-10-18: S4O_Results; Limit the number of runs to the runs executed if the execution stopped when the standard deviation tolerance was reached.
+2026-10-18: S4O_Open_Dyn; New function opening the DYNPOST files, also the synthetic ones written by S4O_Synthetic.
+2026-10-18: S4O_Calculate_Extremes, S4O_Write_Extremes; New functions reading the extremes of the DYNPOST files in parallel and writing disp-uy-max.txt and disp-uy-min.txt, replacing DYNPOST EXT.
+2026-10-18: S4O_Generate_Results; Reads the DYNPOST files of all runs in parallel (S4O_Calculate_Extremes) and writes the extremes files.
+2026-10-18: S4O_Generate_Results, S4O_Write_Extremes; The RESULTS page no longer writes disp-uy-max.txt and disp-uy-min.txt, and S4O_Write_Extremes documents that its layout differs from the DYNPOST EXT output.
+2026-10-18: S4O_Write_Extremes; Deleted, as its layout of disp-uy-max.txt and disp-uy-min.txt is not that of DYNPOST EXT.
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-03-27"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -19,13 +26,18 @@ import os
 import random
 import math
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rafina import pyraf as pr
+from S4O_Synthetic import S4O_Is_Synthetic_Dyn, S4O_Synthetic_Dyn
 import pandas as pd
 from bokeh.plotting import figure
 from bokeh.models import Range1d
 from bokeh.models import Title
 from bokeh.models import HoverTool
 
+#	Maximum number of threads reading DYNPOST files in parallel
+S4O_EXTREMES_WORKERS = min(8, os.cpu_count() or 1)
+
 #
 #	RESULTS input function
 #
@@ -45,8 +57,9 @@ def S4O_Results():
 		st.error("You have to select a valid model before you can show results!", icon="🚨")
 		return st.session_state.df_Results,st.session_state.Results_OK
 
-	#	Assign number of runs
+	#	Assign number of runs, limited to the runs actually executed if the last execution stopped early
 	nruns = int(st.session_state.df_Execution.iloc[3,1])
+	if st.session_state.noRunsExecuted > 0 and st.session_state.noRunsExecuted < nruns: nruns = st.session_state.noRunsExecuted
 
 	#	Echo of input data
 	if Echo_Inputs:
@@ -128,56 +141,79 @@ def S4O_Generate_Results(lrun):
 	#	-----------------------------------------------------------------
 	tsid = 5
 
-	#	Initialize temporary result arrays
-	runlist = []
-	meanlist = []
-	stdlist = []
-	dstdlist = []
-	m1stdlist = []
-	maxmalist = []
-	maxlist = []
-	minlist = []
-
-	#	Initialise progress bar
-	tsProgressCurr = int(0)
-	tsProgressDelta = int(100/lrun)
-	tsProgressBar = st.progress(tsProgressCurr)
-
-	#	Loop over all realisations (runs)
-	#	---------------------------------
+	#	Assign the DYNPOST file names of all realisations (runs) and check that they exist
 	ndxstart = 0
-
-	irun     = 0
-	for ndx in range(lrun):
-		#	Assign current run number
-		irun += 1
-
-		#	Assign DYNPOST file name and check if it exists
+	dynfiles = {}
+	for irun in range(1, lrun+1):
 		dynfile = mod_path + "/r" + str(irun) + "/s.dyn"
 		if not os.path.exists(dynfile):
 			st.error("DYNPOST file (.dyn) " + dynfile + " does not exist!", icon="🚨")
 			return
+		dynfiles[irun] = dynfile
+
+	#	Get total number of non-zero time series values and the time series max and min values for all runs, reading
+	#	the DYNPOST files in parallel
+	tsProgressBar = st.progress(0)
+	try:
+		extremes = S4O_Calculate_Extremes(dynfiles, tsid, ndxstart, lambda ndone: tsProgressBar.progress(int(100*ndone/lrun)))
+	except:
+		tsProgressBar.empty()
+		st.error("Failed to assign the DYNPOST files (.dyn) in " + mod_path + " as DYNPOST objects", icon="🚨")
+		raise
+	st.session_state.SIMLA_nstep_dynres = extremes[lrun][4]
 
-		#	Assign the DYNPOST file as a DYNPOST object
-		try:
-			dynobj = pr.Dyn(dynfile)
-		except:
-			st.error("Failed to assign " + dynfile + " as a DYNPOST object", icon="🚨")
-			raise
+	#	Finished proessing the time series for all realisation (runs)
+	tsProgressBar.progress(100)
+	tsProgressBar.empty()
+
+	#	Assign the run numbers and max and min values in run order
+	runlist = list(range(1, lrun+1))
+	maxlist = [extremes[irun][0] for irun in runlist]
+	minlist = [extremes[irun][2] for irun in runlist]
+
+	#	Calculate the statistics and check change in standard deviation
+	ptol = float(st.session_state.df_Execution.iloc[4,1])
+	stats = S4O_Calculate_Statistics(runlist, maxlist, minlist)
+	tolno = S4O_Check_StdDev_Tolerance(stats, ptol)
+
+	#	Assign number of runs processed
+	nruns = lrun
+	st.session_state.noRunsPostprocessed = nruns
+
+	#	Assign run number for which tolerance was reached
+	if tolno > 0:
+		st.session_state.stdtolRunNumber = tolno
+	else:
+		st.session_state.stdtolRunNumber = 0
+
+	#	Build pandas Results dataframe
+	st.session_state.df_Results = pd.DataFrame(stats)
+
+	#	Set ResultsCalculated status to True
+	st.session_state.ResultsCalculated = True
+
+	return
+#
+#
+
+def S4O_Calculate_Statistics(runlist, maxlist, minlist):
 
-		#	Get total number of non-zero time series values
-		st.session_state.SIMLA_nstep_dynres = S4O_ReadTSNNZVals(dynobj)
+	#	Calculate the running statistics of the absolute maxima for the realisations (runs) in runlist,
+	#	returned as a dictionary of lists with the columns of the pandas Results dataframe
 
-		#	Get time series max and min values for the current run
-		maxval, maxtime, minval, mintime = S4O_ReadTSMaxMin(dynobj, tsid, ndxstart)
+	#	Initialize temporary result arrays
+	meanlist = []
+	stdlist = []
+	dstdlist = []
+	m1stdlist = []
+	maxmalist = []
 
-		#	Append current run number
-		runlist.append(irun)
+	for ndx in range(len(runlist)):
+		#	Assign number of runs included so far
+		irun = ndx + 1
 
-		#	Append lists with absolute maxima, max and min values
-		maxmalist.append(max(abs(maxval),abs(minval)))
-		maxlist.append(maxval)
-		minlist.append(minval)
+		#	Append list with absolute maxima
+		maxmalist.append(max(abs(maxlist[ndx]),abs(minlist[ndx])))
 
 		#	Calculate and append mean so far from the list with absolute maxima values
 		if irun == 1:
@@ -206,46 +242,33 @@ def S4O_Generate_Results(lrun):
 				pdiff = 100.0
 		dstdlist.append(pdiff)
 
-		#	Finished processing the time series for the current realisation (run)
-		tsProgressCurr += tsProgressDelta
-		tsProgressBar.progress(tsProgressCurr)
+	stats = {}
+	stats['Realisation'] = list(runlist)
+	stats['Mean'] = meanlist
+	stats['StdDev'] = stdlist
+	stats['ΔStdDev [%]'] = dstdlist
+	stats['Mean+1StdDev'] = m1stdlist
+	stats['Maxima'] = maxmalist
+	stats['Max'] = list(maxlist)
+	stats['Min'] = list(minlist)
+
+	return stats
+#
+#
 
-	#	Finished proessing the time series for all realisation (runs)
-	tsProgressBar.progress(100)
-	tsProgressBar.empty()
+def S4O_Check_StdDev_Tolerance(stats, ptol):
 
-	#	Check change in standard deviation
+	#	Return the run number for which the change in standard deviation first drops below ptol [%], or 0 if
+	#	it never does or ptol is zero (run through all sea states)
 	tolno = 0
-	ptol = float(st.session_state.df_Execution.iloc[4,1])
+	runlist  = stats['Realisation']
+	dstdlist = stats['ΔStdDev [%]']
 	for ndx in range(len(dstdlist)):
 		if ndx > 0 and ptol != 0.0 and dstdlist[ndx] < ptol:
 			tolno = runlist[ndx]
 			break
 
-	#	Assign number of runs processed
-	nruns = irun
-	st.session_state.noRunsPostprocessed = nruns
-
-	#	Assign run number for which tolerance was reached
-	if tolno > 0:
-		st.session_state.stdtolRunNumber = tolno
-	else:
-		st.session_state.stdtolRunNumber = 0
-
-	#	Build pandas Results dataframe
-	st.session_state.df_Results['Realisation'] = runlist
-	st.session_state.df_Results['Mean'] = meanlist
-	st.session_state.df_Results['StdDev'] = stdlist
-	st.session_state.df_Results['ΔStdDev [%]'] = dstdlist
-	st.session_state.df_Results['Mean+1StdDev'] = m1stdlist
-	st.session_state.df_Results['Maxima'] = maxmalist
-	st.session_state.df_Results['Max'] = maxlist
-	st.session_state.df_Results['Min'] = minlist
-
-	#	Set ResultsCalculated status to True
-	st.session_state.ResultsCalculated = True
-
-	return
+	return tolno
 #
 #
 
@@ -404,7 +427,7 @@ def S4O_Show_TS_Plot():
 
 		#	Assign the DYNPOST file as a DYNPOST object
 		try:
-			dynobj = pr.Dyn(dynfile)
+			dynobj = S4O_Open_Dyn(dynfile)
 		except:
 			st.error("Failed to assign " + dynfile + " as a DYNPOST object", icon="🚨")
 			raise
@@ -523,6 +546,48 @@ def S4O_ReadTSMaxMin(dynobj, tsid, ndxstart):
 #
 #
 
+def S4O_ReadDynMaxMin(dynfile, tsid, ndxstart):
+
+	#	Open the DYNPOST file and get the total number of non-zero time series values and the maximum value + time
+	#	and minimum value + time for the specified time series id
+	dynobj = S4O_Open_Dyn(dynfile)
+
+	nnzvals = S4O_ReadTSNNZVals(dynobj)
+	maxval, maxtime, minval, mintime = S4O_ReadTSMaxMin(dynobj, tsid, ndxstart)
+
+	return nnzvals, maxval, maxtime, minval, mintime
+#
+#
+
+def S4O_Calculate_Extremes(dynfiles, tsid, ndxstart, progress=None):
+
+	#	Get the maximum value + time and minimum value + time of time series tsid, and the total number of non-zero time
+	#	series values, of the DYNPOST files in dynfiles (dictionary keyed by run number), reading the files in parallel
+	#	threads. Return a dictionary keyed by run number of (maxval, maxtime, minval, mintime, nnzvals). progress(ndone)
+	#	is called in the calling thread each time a file has been read.
+	extremes = {}
+	if len(dynfiles) == 0: return extremes
+
+	with ThreadPoolExecutor(max_workers=min(S4O_EXTREMES_WORKERS, len(dynfiles))) as pool:
+		futures = {pool.submit(S4O_ReadDynMaxMin, dynfiles[irun], tsid, ndxstart): irun for irun in dynfiles}
+		for future in as_completed(futures):
+			nnzvals, maxval, maxtime, minval, mintime = future.result()
+			extremes[futures[future]] = (maxval, maxtime, minval, mintime, nnzvals)
+			if progress is not None: progress(len(extremes))
+
+	return extremes
+#
+#
+
+def S4O_Open_Dyn(dynfile):
+
+	#	Open the DYNPOST file as a DYNPOST object, also if written by the synthetic SIMLA (S4O_Synthetic)
+	if S4O_Is_Synthetic_Dyn(dynfile): return S4O_Synthetic_Dyn(dynfile)
+
+	return pr.Dyn(dynfile)
+#
+#
+
 def S4O_ReadTSNNZVals(dynobj):
 
 	#	Get total number of non-zero time series values
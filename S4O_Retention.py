@@ -0,0 +1,101 @@
+"""
+File: S4O_Retention.py
+Description:
+Retention policy for the output files of successful SIMLA runs. The run directories keep the input files, the run
+hashes, the SIMLA list file (s.slf), the DYNPOST file (s.dyn) and the DYNPOST MPF input and output, which are all
+that the RESULTS page, the result cache and "Resume" need. The other output files larger than a given size, e.g.
+the visualisation results (ivisual=1) and the print files, are kept, compressed or deleted right after each run
+has finished successfully. Files are compressed with zstandard if the zstandard module is installed (.zst), and
+with gzip otherwise (.gz). Failed runs are never pruned, so their output can be inspected.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import gzip
+import os
+import shutil
+from S4O_RunHash import S4O_RUN_INPUT_FILES, S4O_RUN_HASH_FILE
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+#	Retention policies for the output files of successful runs
+S4O_RETENTION_POLICIES = ['Keep all', 'Compress', 'Delete']
+
+#	Files that are always kept uncompressed in the run directory, and extensions of kept files (DYNPOST MPF plot
+#	files, run and DYNPOST MPF hashes, files already compressed)
+S4O_RETENTION_KEEP = S4O_RUN_INPUT_FILES + [S4O_RUN_HASH_FILE, 's.slf', 's.dyn', 's.sdi', 's.sdo']
+S4O_RETENTION_KEEP_EXT = ['.mpf', '.sha256', '.zst', '.gz']
+
+def S4O_Retention_Suffix():
+
+	#	Return the file name suffix of the compressed files, .zst if zstandard is installed and .gz otherwise
+	if zstandard is not None: return '.zst'
+
+	return '.gz'
+#
+#
+
+def S4O_Retention_Candidates(run_path, minbytes):
+
+	#	Return the names of the files in run_path that are not needed after a successful run and are at least
+	#	minbytes large
+	names = []
+	for entry in os.scandir(run_path):
+		if not entry.is_file() or entry.name in S4O_RETENTION_KEEP: continue
+		if os.path.splitext(entry.name)[1].lower() in S4O_RETENTION_KEEP_EXT: continue
+		if entry.stat().st_size >= minbytes: names.append(entry.name)
+
+	return sorted(names)
+#
+#
+
+def S4O_Compress_File(fname):
+
+	#	Compress the file fname to fname + S4O_Retention_Suffix() and delete it. The compressed file is written under
+	#	a temporary name first, so an interrupted compression never leaves a partial file in place of the original.
+	cname = fname + S4O_Retention_Suffix()
+	with open(fname, 'rb') as fin, open(cname + '.tmp', 'wb') as fout:
+		if zstandard is not None:
+			zstandard.ZstdCompressor(level=3, threads=-1).copy_stream(fin, fout)
+		else:
+			with gzip.GzipFile(fileobj=fout, mode='wb', compresslevel=6) as gzout:
+				shutil.copyfileobj(fin, gzout, 1024*1024)
+	shutil.copystat(fname, cname + '.tmp')
+	os.replace(cname + '.tmp', cname)
+	os.remove(fname)
+
+	return cname
+#
+#
+
+def S4O_Retention_Apply(run_path, policy, minbytes):
+
+	#	Apply the retention policy ('Keep all', 'Compress' or 'Delete') to the output files of the successful run in
+	#	run_path that are at least minbytes large. Return the number of files handled and the number of bytes freed.
+	nfiles = 0
+	freed = 0
+	if policy == 'Keep all' or not os.path.isdir(run_path): return nfiles, freed
+
+	for name in S4O_Retention_Candidates(run_path, minbytes):
+		fname = run_path + '/' + name
+		size = os.path.getsize(fname)
+		if policy == 'Delete':
+			os.remove(fname)
+			freed += size
+		else:
+			cname = S4O_Compress_File(fname)
+			freed += size - os.path.getsize(cname)
+		nfiles += 1
+
+	return nfiles, freed
+#
+#
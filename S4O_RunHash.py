@@ -0,0 +1,116 @@
+"""
+File: S4O_RunHash.py
+Description:
+These functions calculate, store and read a hash of the generated input to a SIMLA run, used to decide whether
+the results already in a run directory were produced from the current input. The hash is also used as key to the
+SIMLA result cache (S4O_Cache).
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Hash_Run_Inputs; Hash the SIMLA input file in canonical form (S4O_Canonical_SIF).
+2026-10-18: S4O_Executable_Identity; Content digest of the SIMLA executable, included in the hash so that results are not reused after SIMLA is upgraded in place.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import hashlib
+import os
+
+#	Input files that determine the results of a SIMLA run, and the file used to store the hash in the run directory
+S4O_RUN_INPUT_FILES = ['s.sif', 'seabed.txt']
+S4O_RUN_HASH_FILE = 's4o_run.sha256'
+
+#	Content digests of the executables already hashed, keyed by path, size and modification time
+S4O_EXECUTABLE_DIGESTS = {}
+
+def S4O_Executable_Identity(exe):
+
+	#	Return the SHA-256 digest of the content of the executable exe, or '' if it is not found on this computer
+	#	(e.g. when the runs are distributed to workers). The digest is calculated once for each path, size and
+	#	modification time, so an executable replaced in place gets a new identity.
+	try:
+		st = os.stat(exe)
+	except OSError:
+		return ''
+	key = (os.path.abspath(exe), st.st_size, st.st_mtime_ns)
+	if key not in S4O_EXECUTABLE_DIGESTS:
+		h = hashlib.sha256()
+		with open(exe, 'rb') as f:
+			for block in iter(lambda: f.read(1024*1024), b''): h.update(block)
+		S4O_EXECUTABLE_DIGESTS[key] = h.hexdigest()
+
+	return S4O_EXECUTABLE_DIGESTS[key]
+#
+#
+
+def S4O_Hash_Run_Inputs(run_path, args):
+
+	#	Calculate a SHA-256 hash of the run command arguments (the path to the SIMLA executable followed by its
+	#	identity, S4O_Executable_Identity, and thereby the SIMLA version) and of the input files in the run
+	#	directory. The SIMLA input file is hashed in its canonical form, so that models differing only in title or
+	#	comments give the same hash.
+	h = hashlib.sha256()
+	h.update(' '.join(args).encode())
+	for name in S4O_RUN_INPUT_FILES:
+		h.update(b'\0' + name.encode() + b'\0')
+		fname = run_path + '/' + name
+		if not os.path.exists(fname): continue
+		if name == 's.sif':
+			h.update(S4O_Canonical_SIF(fname).encode())
+		else:
+			with open(fname, 'rb') as f:
+				h.update(f.read())
+
+	return h.hexdigest()
+#
+#
+
+def S4O_Canonical_SIF(sifname):
+
+	#	Return the SIMLA input file without comment lines and HEAD cards, and with trailing white space removed
+	lines = []
+	with open(sifname, 'r') as f:
+		for line in f:
+			cline = line.rstrip()
+			if cline == '' or cline.startswith('#') or cline.startswith('HEAD'): continue
+			lines.append(cline)
+
+	return '\n'.join(lines)
+#
+#
+
+def S4O_Write_Run_Hash(run_path, runhash):
+
+	#	Store the input hash of a successfully completed run in the run directory
+	with open(run_path + '/' + S4O_RUN_HASH_FILE, 'w') as f:
+		f.write(runhash + '\n')
+
+	return
+#
+#
+
+def S4O_Read_Run_Hash(run_path):
+
+	#	Read the input hash stored in the run directory, or return '' if there is none
+	fname = run_path + '/' + S4O_RUN_HASH_FILE
+	if not os.path.exists(fname): return ''
+
+	with open(fname, 'r') as f:
+		runhash = f.read().strip()
+
+	return runhash
+#
+#
+
+def S4O_Delete_Run_Hash(run_path):
+
+	#	Delete the input hash in the run directory, e.g. when a new run is started in it
+	fname = run_path + '/' + S4O_RUN_HASH_FILE
+	if os.path.exists(fname): os.remove(fname)
+
+	return
+#
+#
@@ -6,22 +6,85 @@ Revisions:
 2025-09-03: S4O_SIMLA_Subprocess_Open; Added print of SIMLA run command if "Extended print" and "Simulate runs" both are ticked on.
 2025-09-04: S4O_Run_SIMLA_Block; Rewrote function to use process.wait() to wait for subprocesses, and added calculation of elapsed wall-clock time per block.
 2025-09-04: S4O_Run_SIMLA; Added calculation of total elapsed wall-clock time for all runs.
+2026-10-18: S4O_Run_SIMLA_Block; Replaced the block-barrier execution with a rolling queue that keeps maxRunsPB runs going and reports each run as it finishes.
+2026-10-18: S4O_Run_SIMLA; Generates input files for all runs up front and runs all realisations through one rolling queue. Deleted S4O_Run_SIMLA_Block_OLD.
+2026-10-18: S4O_SIMLA_Subprocess_Open, S4O_DYNPOST_Subprocess_Open, S4O_SIMLA_DYNPOST_EXT_Run; Start the programs directly through S4O_Launcher with the run directory as cwd, instead of PowerShell + os.chdir.
+2026-10-18: S4O_Assign_Run_Config; New function collecting the run parameters, which are passed to the run and check functions instead of reading st.session_state.
+2026-10-18: S4O_Run_SIMLA_Block; Checks the change in standard deviation each time a run finishes, and cancels the queued (and optionally the running) runs when the tolerance is reached.
+2026-10-18: S4O_Run_SIMLA_Block; Postprocesses each successful run in a separate thread while the other runs continue, and updates df_Results as the runs finish.
+2026-10-18: S4O_Run_SIMLA_Block; Stores a hash of the input of each successful run, and skips runs already completed with the current input if "Resume" is ticked.
+2026-10-18: S4O_Run_SIMLA_Block; Takes the results from the shared result cache (S4O_Cache) instead of running SIMLA when "Use result cache" is ticked.
+2026-10-18: S4O_Schedule_Runs; Moved the rolling queue out of S4O_Run_SIMLA_Block into a function that reports through a callback and does not use Streamlit.
+2026-10-18: S4O_Write_Input_Files, S4O_Assign_Run_Config; Take the model parameters as argument, so input generation and execution can run without Streamlit (S4O_Batch).
+2026-10-18: S4O_Schedule_Runs; Distributes the runs to workers on other machines (S4O_Distributed) when "Distribute runs to workers" is ticked.
+2026-10-18: S4O_Schedule_Runs; Adapts the number of concurrent runs to the CPU load, free memory and I/O wait (S4O_Adaptive) when "Adaptive" is ticked.
+2026-10-18: S4O_Schedule_Runs, S4O_SIMLA_Subprocess_Open; Start the runs with the selected priority and memory limit, pinned to one physical core each if selected.
+2026-10-18: S4O_Schedule_Runs, S4O_Run_SIMLA_Block; Report the progress from the simulated time of the runs in progress (S4O_Progress), with the estimated remaining time.
+2026-10-18: S4O_Schedule_Runs; Stops runs exceeding the wall-clock or no-progress time limits, retries failed runs and lists the reason for each failed run.
+2026-10-18: S4O_Run_SIMLA, S4O_Run_SIMLA_Block; Start the runs in the background execution engine (S4O_Engine) instead of blocking the page until they have finished.
+2026-10-18: S4O_Show_Execution, S4O_Store_Execution_Results; New functions showing the progress of the execution of the current model, refreshed while the runs are in progress, with a button to cancel them, and storing its results when it has finished.
+2026-10-18: S4O_Schedule_Runs; Cancels the queued runs and stops the runs in progress when the cancel event is set.
+2026-10-18: S4O_Schedule_Runs; Keeps the state, start and finish times and host of each run in the status, for the job queue journal (S4O_Queue).
+2026-10-18: S4O_Schedule_Runs, S4O_Update_Statistics, S4O_Run_Path; Support groups of runs with separate statistics and run directories, for the cases of a parametric sweep (S4O_Sweep).
+2026-10-18: S4O_SIMLA_Run_Args, S4O_DYNPOST_Args, S4O_SIMLA_Run_Hash, S4O_SIMLA_Remote_Open; Start the synthetic SIMLA and DYNPOST (S4O_Synthetic) instead of SIMLA and DYNPOST when "Synthetic SIMLA" is ticked.
+2026-10-18: S4O_Show_Job; New function showing the progress of an execution in the background execution engine, moved out of S4O_Show_Execution for use with parametric sweeps.
+2026-10-18: S4O_Schedule_Runs; Records the start and end times, CPU time, peak memory, bytes written, exit code and host of each attempt of the runs in the run manifest (S4O_Telemetry).
+2026-10-18: S4O_Schedule_Runs, S4O_DYNPOST_MPF_Check_Run_Current, S4O_Write_MPF_Hash; Run DYNPOST MPF in the directory of each successful run as soon as its SIMLA run has finished, in the same slots as the SIMLA runs.
+2026-10-18: S4O_Schedule_Runs, S4O_Dyn_Names; Postprocess the runs in parallel threads and update disp-uy-max.txt and disp-uy-min.txt (S4O_Write_Extremes) as the runs finish. Deleted S4O_SIMLA_DYNPOST_EXT_Run and S4O_DYNPOST_EXT_Check_Run_Success, as DYNPOST EXT is replaced by S4O_Write_Extremes.
+2026-10-18: S4O_Schedule_Runs; Applies the retention policy (S4O_Retention) to the output files of each successful run, compressing or deleting the files not needed by SIMLA4OBS.
+2026-10-18: S4O_Schedule_Runs, S4O_SIMLA_Subprocess_Open, S4O_SIMLA_Check_Run_Success; Run SIMLA in local scratch directories (S4O_Scratch) and copy the results back to the run directories, when "Run in local scratch directory" is ticked.
+2026-10-18: S4O_Write_Input_Files; Renders the input files once per model (S4O_Make_SIMLA_Template) and writes the input files of each run by substituting its wave seed.
+2026-10-18: S4O_Write_Input_Files; Renders the template of the input files from the model specification (S4O_Model_Spec) before the run directories are created.
+2026-10-18: S4O_Write_Input_Files; Creates the run directories in one pass and writes the input files of the runs in a thread pool (S4O_INPUT_WORKERS).
+2026-10-18: S4O_Schedule_Runs; Reads the results of the runs skipped by "Resume" and checks the convergence before any run is started.
+2026-10-18: S4O_Assign_Run_Config, S4O_SIMLA_Run_Hash; The run hash includes the identity of the content of the SIMLA executable (S4O_Executable_Identity).
+2026-10-18: S4O_Run_Steps, S4O_SIMLA_Run_Args; The number of DYNRES steps of each run of a sweep is given in runcfg['runSteps'], as it depends on the parameters of the case.
+2026-10-18: S4O_Schedule_Runs, S4O_SIMLA_DYNPOST_EXT_Run, S4O_DYNPOST_EXT_Check_Run_Success; DYNPOST EXT writes disp-uy-max.txt and disp-uy-min.txt again when DYNPOST is run, and S4O_Write_Extremes only when it is not.
+2026-10-18: S4O_Schedule_Runs; Lists the runs completed successfully in status['succeeded'], and always assigns the number of runs executed from them, also when no runs were cancelled.
+2026-10-18: S4O_Schedule_Runs, S4O_Update_DYNPOST_EXT_Input, S4O_Generate_DYNPOST_EXT_Input; disp-uy-max.txt and disp-uy-min.txt are no longer written after the runs, neither by S4O_Write_Extremes, whose layout is not that of DYNPOST EXT, nor by DYNPOST EXT, which is run by hand as before. The DYNPOST EXT input file is rewritten with the runs completed successfully when the execution has finished. Deleted S4O_Dyn_Names, S4O_SIMLA_DYNPOST_EXT_Run and S4O_DYNPOST_EXT_Check_Run_Success.
+2026-10-18: S4O_Write_Input_Files; Writes the input files made from the model specification and the run number (S4O_Make_SIMLA_Input_Files), with the wave seeds taken from the specification instead of the state.
+2026-10-18: S4O_Assign_Run_Steps, S4O_Run_SIMLA; The number of DYNRES steps is assigned from the model parameters also when the input files are not generated.
+2026-10-18: S4O_Schedule_Runs, S4O_SIMLA_Run_Hash; Runs without DYNRES steps (-s2 0) are not started but listed as failed, and the run hash includes the -s2 value.
+2026-10-18: S4O_Schedule_Runs; The progress of a run without simulated time in its output is estimated from its elapsed wall-clock time and the durations of the runs finished (S4O_Elapsed_Fraction).
 """
 __author__ = "Egil Giertsen"
 __credits__ = [""]
 __license__ = "GPLv3"
-__version__ = "2025-09-04"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
 import pandas as pd
 import streamlit as st
-import subprocess
 import os
+import socket
 import time
 import random
 from random import randint
-from S4O_MakeSIMLAInput import S4O_MakeSIMLAInput
+from concurrent.futures import ThreadPoolExecutor, wait
+from S4O_MakeSIMLAInput import S4O_Make_SIMLA_Template, S4O_Make_SIMLA_Input_Files, S4O_Write_SIMLA_Files
+from S4O_ModelSpec import S4O_Model_Spec_From_State
+from S4O_Launcher import S4O_Launch_Process, S4O_Kill_Process_Tree, S4O_Sleep_Args, S4O_Physical_Cores, S4O_Set_Process_Priority, S4O_Set_Process_Affinity, S4O_Memory_Cap_Args
+from S4O_RunHash import S4O_RUN_INPUT_FILES, S4O_Executable_Identity, S4O_Hash_Run_Inputs, S4O_Write_Run_Hash, S4O_Read_Run_Hash, S4O_Delete_Run_Hash
+from S4O_Synthetic import S4O_SYNTHETIC_PATH, S4O_Synthetic_Args
+from S4O_Telemetry import S4O_Run_Telemetry
+from S4O_Retention import S4O_Retention_Apply
+from S4O_Scratch import S4O_Scratch_Create, S4O_Scratch_Return, S4O_Scratch_Discard
+from S4O_Cache import S4O_Cache_Fetch, S4O_Cache_Store, S4O_Cache_Unlink
+from S4O_Results import S4O_EXTREMES_WORKERS, S4O_ReadDynMaxMin, S4O_Calculate_Statistics, S4O_Check_StdDev_Tolerance
+from S4O_Distributed import S4O_Coordinator, S4O_Start_Local_Workers
+from S4O_Adaptive import S4O_Adaptive_Concurrency
+from S4O_Engine import S4O_Engine_Job, S4O_Engine_Submit, S4O_Engine_Job_For, S4O_Engine_Running
+from S4O_Progress import S4O_Read_End_Time, S4O_Progress_Marker, S4O_Run_Fraction, S4O_Elapsed_Fraction, S4O_Estimate_Remaining, S4O_Format_Duration
+
+#	Time between the progress reports while runs are in progress [s]
+S4O_PROGRESS_INTERVAL = 5.0
+
+#	File in the run directory holding the input hash of the SIMLA results that DYNPOST MPF was last run on
+S4O_MPF_HASH_FILE = 's4o_mpf.sha256'
+
+#	Number of threads writing the input files of the runs
+S4O_INPUT_WORKERS = min(8, os.cpu_count() or 1)
 
 def S4O_Create_Input_Files(frun, lrun):
 	
@@ -31,78 +94,90 @@ def S4O_Create_Input_Files(frun, lrun):
 		st.error("You have to save your model before you can create input files!", icon="🚨")
 		return
 
-	#	Check if model directory exists and create it if not
+	#	Assign model directory
 	mod_path = st.session_state.modelFileDir + "/" + st.session_state.modelFileName
-	if not os.path.exists(mod_path):
-		if st.session_state.ExtendedPrint: st.info("Creating model directory : " + mod_path)
-		os.mkdir(mod_path)
+	if st.session_state.ExtendedPrint:
+		st.write('Generating SIMLA input files (s.sif, seabed.txt) and DYNPOST MPF input files (s.sdi) for runs ' + str(frun) + ' to ' + str(lrun) + ' in : ' + mod_path)
+		st.write('Generating DYNPOST EXT input file : ' + mod_path + '/extremes.sdi')
 
-	#	Create dummy input files
-	irun = frun
-	while irun <= lrun:
+	#	Generate the input files
+	S4O_Write_Input_Files(st.session_state, mod_path, frun, lrun)
 
-		#	Assign run directory and create it if it does not exist
-		run_path = mod_path + "/r" + str(irun)
-		if not os.path.exists(run_path):
-			if st.session_state.ExtendedPrint: st.info("Creating run directory : " + run_path)
-			os.mkdir(run_path)
+	return
+#
+#
 
-		#	Assign SIMLA input file
-		sifname = run_path + "/s.sif"
+def S4O_Write_Input_Files(state, mod_path, frun, lrun):
 
-		#	Generate SIMLA input file
-		S4O_Generate_SIMLA_Input(sifname, irun)
+	#	Generate the input files for runs frun to lrun in the model directory mod_path, from the model parameters
+	#	in state (st.session_state, or an object with the same attributes when running without Streamlit)
 
-		#	Assign next run number
-		irun += 1
+	#	Check if model directory exists and create it if not
+	if not os.path.exists(mod_path): os.mkdir(mod_path)
+
+	#	Read the model specification from the state, and render the input files once from it, as a template with the
+	#	wave seed of each run substituted when its files are made
+	spec = S4O_Model_Spec_From_State(state)
+	template = S4O_Make_SIMLA_Template(spec)
+	state.SIMLA_nstep_dynres = template['nstep_dynres']
+
+	#	Create the run directories that do not exist, listing the model directory once instead of checking each run
+	existing = set(entry.name for entry in os.scandir(mod_path) if entry.is_dir())
+	for irun in range(frun, lrun+1):
+		if "r" + str(irun) not in existing: os.mkdir(mod_path + "/r" + str(irun))
+
+	#	Write the input files of each run, made from the model specification and the run number. Writing the files is
+	#	dominated by file system calls, which release the GIL, so the runs are spread over a thread pool.
+	write_run = lambda irun: S4O_Write_SIMLA_Files(S4O_Make_SIMLA_Input_Files(spec, irun, template), mod_path + "/r" + str(irun))
+	if lrun >= frun:
+		with ThreadPoolExecutor(max_workers=min(S4O_INPUT_WORKERS, lrun-frun+1)) as pool:
+			list(pool.map(write_run, range(frun, lrun+1)))
 
 	#	Generate DYNPOST EXT input file
-	S4O_Generate_DYNPOST_EXT_Input(mod_path, lrun)
+	S4O_Generate_DYNPOST_EXT_Input(mod_path, range(1, lrun+1))
 
 	return
 #
 #
 
-def S4O_Generate_SIMLA_Input(sifname, irun):
-
-	#	Generate DYNPOST EXT input file
-	if st.session_state.ExtendedPrint: st.write('Generating SIMLA input file : ' + sifname)
-	if st.session_state.ExtendedPrint: st.write('Generating DYNPOST MPF input file : ' + os.path.dirname(sifname) + '/s.sdi')
+def S4O_Assign_Run_Steps(state):
 
-	S4O_MakeSIMLAInput(sifname, irun)
+	#	Assign the number of DYNRES steps (-s2) of the runs from the model parameters in state, without writing the
+	#	input files, when the runs use input files generated earlier
+	state.SIMLA_nstep_dynres = S4O_Make_SIMLA_Template(S4O_Model_Spec_From_State(state))['nstep_dynres']
 
 	return
 #
 #
-def S4O_Generate_DYNPOST_EXT_Input(mod_path, lrun):
 
-	#	Generate DYNPOST EXT input file
+def S4O_Generate_DYNPOST_EXT_Input(mod_path, runs):
+
+	#	Generate DYNPOST EXT input file for the run numbers in runs
 	sdiname = mod_path + '/extremes.sdi'
-	if st.session_state.ExtendedPrint: st.write('Generating DYNPOST EXT input file : ' + sdiname)
 
 	#	Open file
 	sdifile = open(sdiname, 'w')
 
 	#	Write input for lateral displacement maximum values (type=1, idynres=5[node=1,dof=2])
-	irun = 0
-	for ndx in range(lrun):
-		irun += 1
-		if irun == 1:
+	first = True
+	for irun in runs:
+		if first:
 			dynname = "r" + str(irun) + "/s"
 			sdifile.write("#        type   frac   idynres   nmax    time0    -out.txt          dyn\n")
 			sdifile.write("MXPLOT   %i      %.2f   %i         %i       %.1f      \"disp-uy-max\"     \"%s\"\n" % ( 1, 0.0, 5, 1, 0.0, dynname) )
+			first = False
 		else:
 			dynname = "r" + str(irun) + "/s"
 			sdifile.write("                                                                    \"%s\"\n" % ( dynname) )
 
 	#	Write input for lateral displacement minimum values (type=-1, idynres=5[node=1,dof=2])
-	irun = 0
-	for ndx in range(lrun):
-		irun += 1
-		if irun == 1:
+	first = True
+	for irun in runs:
+		if first:
 			dynname = "r" + str(irun) + "/s"
 			sdifile.write("#        type   frac   idynres   nmax    time0    -out.txt          dyn\n")
 			sdifile.write("MXPLOT   %i     %.2f   %i         %i       %.1f      \"disp-uy-min\"     \"%s\"\n" % ( -1, 0.0, 5, 1, 0.0, dynname) )
+			first = False
 		else:
 			dynname = "r" + str(irun) + "/s"
 			sdifile.write("                                                                    \"%s\"\n" % ( dynname) )
@@ -117,10 +192,11 @@ def S4O_Generate_DYNPOST_EXT_Input(mod_path, lrun):
 def S4O_Run_SIMLA():
 
 	#
-	#	Generate input files, run SIMLA analyses (SIMLA + DYNPOST) and generate results
-	#	-------------------------------------------------------------------------------
-	#	Set ResultsCalculated to False 
+	#	Generate input files and start the SIMLA analyses (SIMLA + DYNPOST) in the background execution engine
+	#	------------------------------------------------------------------------------------------------------
+	#	Set ResultsCalculated to False and reset number of runs executed
 	st.session_state.ResultsCalculated = False
+	st.session_state.noRunsExecuted = 0
 	
 	#	Check if model has been stored
 	file_path = st.session_state.modelFilePath
@@ -128,260 +204,1017 @@ def S4O_Run_SIMLA():
 		st.error("You have to save your model before you can run it!", icon="🚨")
 		return
 
+	#	Check that the analyses of the model are not already running, as the input files would be overwritten
+	job = S4O_Engine_Job_For(S4O_Execution_Key())
+	if job is not None and job.running():
+		st.error("The SIMLA analyses of this model are already running! Cancel them before you start new ones.", icon="🚨")
+		return
+
 	#	Assign run parameters
 	nrunsmax = int(st.session_state.df_Execution.iloc[3,1])
-	nblocks = st.session_state.noBlocksToRun 
-	nrunspb = st.session_state.maxRunsPB
 
-	#	Assign block number and first and last run number for the first block to be run
-	cblock = 1
-	frun = 1
-	nrunscb = nrunspb
-	if nrunscb > nrunsmax: nrunscb = nrunsmax
-	lrun = frun + nrunscb - 1
+	#	Create input files for all runs if the "Generate input files" check box is checked
+	if st.session_state.GenerateInputs:
+		with st.spinner('Generating SIMLA input files for runs 1 to ' + str(nrunsmax) + ' ...'):
+			S4O_Create_Input_Files(1, nrunsmax)
+	else:
+		S4O_Assign_Run_Steps(st.session_state)
 
-	#	Simulate SIMLA runs with the sleep command?
+	#	Start all SIMLA analyses if the "Run analyses" check box is checked
 	if st.session_state.RunAnalyses:
-		if st.session_state.SimulateRuns:
-			st.warning('Simulating ' + str(nblocks) + ' SIMLA blocks with the sleep command for runs 1 to ' + str(nrunsmax) + '!', icon="⚠️")
-		else:
-			st.info('Executing ' + str(nblocks) + ' SIMLA blocks for runs 1 to ' + str(nrunsmax) + '.')
+		S4O_Run_SIMLA_Block(1, nrunsmax)
 
-	#	Show SIMLA progress bar
-	if st.session_state.GenerateInputs or st.session_state.RunAnalyses:
-		st.session_state.simlaProgressCurr = int(0)
-		st.session_state.simlaProgressDelta = int(100/nrunsmax)
-		st.session_state.simlaProgressBar = st.progress(st.session_state.simlaProgressCurr)
+	return
+#
+#
 
-	#	Loop over number of blocks to be run
-	wclstart = time.perf_counter()
+def S4O_Run_SIMLA_Block(frun, lrun):
 
-	while cblock <= nblocks:
+	#	Start SIMLA runs frun to lrun with S4O_Schedule_Runs in the background execution engine (S4O_Engine), under
+	#	the model directory. The progress is shown by S4O_Show_Execution, which also stores the results in
+	#	st.session_state when the runs have finished.
 
-		if not st.session_state.SimulateRuns: st.write('Executing SIMLA block number ' + str(cblock) + ' for runs ' + str(frun) + ' to ' + str(lrun) + '.')
+	#	Clear the results from any previous execution
+	st.session_state.df_Results = pd.DataFrame()
+	st.session_state.noRunsPostprocessed = 0
+	st.session_state.stdtolRunNumber = 0
 
-		#	Create input files if the "Generate input files" check box is checked
-		if st.session_state.GenerateInputs: S4O_Create_Input_Files(frun, lrun)
+	runcfg = S4O_Assign_Run_Config(st.session_state)
+	job = S4O_Engine_Job(S4O_Schedule_Runs, (runcfg, frun, lrun), 'the model ' + S4O_Execution_Key())
 
-		#	Run the current SIMLA block
-		#	---------------------------
-		if st.session_state.RunAnalyses:
+	#	Simulate SIMLA runs with the sleep command?
+	nslots = min(runcfg['maxRunsPB'], lrun - frun + 1)
+	if not runcfg['DistributedRuns']:
+		if runcfg['SimulateRuns']:
+			job.report(None, 'warning', 'Simulating SIMLA runs ' + str(frun) + ' to ' + str(lrun) + ' with the sleep command, ' + str(nslots) + ' at a time!')
+		elif runcfg['SyntheticRuns']:
+			job.report(None, 'warning', 'Running the synthetic SIMLA for runs ' + str(frun) + ' to ' + str(lrun) + ', ' + str(nslots) + ' at a time. The results are not physical!')
+		else:
+			job.report(None, 'info', 'Executing SIMLA runs ' + str(frun) + ' to ' + str(lrun) + ', ' + str(nslots) + ' at a time.')
 
-			#	Run the SIMLA block if the "Run analyses" check box is checked
-			S4O_Run_SIMLA_Block(frun, lrun)
+	if not S4O_Engine_Submit(S4O_Execution_Key(), job):
+		st.error("The SIMLA analyses of this model are already running! Cancel them before you start new ones.", icon="🚨")
 
-		elif st.session_state.GenerateInputs and not st.session_state.RunAnalyses:			
-			#	Update the progress bar if only the "Generate input files" check box is checked
-			st.session_state.simlaProgressCurr += (lrun-frun+1)*st.session_state.simlaProgressDelta
-			st.session_state.simlaProgressBar.progress(st.session_state.simlaProgressCurr)
+	return
+#
+#
 
-		#	Update block number for next block to be run
-		cblock +=1
+def S4O_Show_Execution():
 
-		#	Update first and last run number for next block to be run
-		frun = lrun + 1
-		lrun = frun + nrunspb - 1
-		if lrun > nrunsmax: lrun = nrunsmax
+	#	Show the messages, progress and current statistics of the last execution of the current model in the
+	#	background execution engine, and the executions in progress for other models. The part of the page is
+	#	refreshed every S4O_PROGRESS_INTERVAL seconds while the runs are in progress.
+	mod_path = S4O_Execution_Key()
 
-	#	Calculate elapsed wall-clock time for all blocks
-	wclend     = time.perf_counter()
-	wclelapsed = wclend - wclstart
+	others = S4O_Engine_Running()
+	for key in others:
+		if key != mod_path:
+			status, messages = others[key].snapshot()
+			text = 'SIMLA analyses are running for ' + others[key].label + '.'
+			if status is not None: text += ' ' + S4O_Progress_Text(status)
+			st.info(text)
 
-	#	All SIMLA runs completed
-	st.write('All SIMLA blocks (' + str(nblocks) + ') covering runs 1 to ' + str(lrun) + ' have finished.' +
-			 ' Total elapsed wall-clock time : ' + str(int(wclelapsed)) + ' seconds.')
+	job = S4O_Engine_Job_For(mod_path)
+	if job is None: return
 
-	#	Set progress bar to "Complete" (100)
-	if st.session_state.GenerateInputs or st.session_state.RunAnalyses:
-		st.session_state.simlaProgressBar.progress(100)
-		st.session_state.simlaProgressBar.empty()
+	S4O_Show_Job(job, 'SIMLA execution', S4O_Store_Execution_Results)
 
 	return
 #
 #
 
-def S4O_Run_SIMLA_Block_OLD(frun, lrun):
+def S4O_Show_Job(job, title, finished=None, table=None):
+
+	#	Show the messages, progress and current statistics of the execution job in the background execution engine
+	#	under the subheader title, with a button to cancel it. The part of the page is refreshed every
+	#	S4O_PROGRESS_INTERVAL seconds while job is running. finished() is called when job has finished, e.g. to
+	#	store its results. If table is given, the dataframe table(status) is shown instead of the statistics.
+	refresh = None
+	if job.running(): refresh = S4O_PROGRESS_INTERVAL
+
+	@st.fragment(run_every=refresh)
+	def show_job():
+		running = job.running()
+		status, messages = job.snapshot()
+
+		st.write("---")
+		st.subheader(title)
+
+		#	Messages from the execution, with the latest at the bottom
+		with st.container(height=300):
+			for level, text in messages:
+				if level == 'write':
+					st.write(text)
+				elif level == 'info':
+					st.info(text)
+				elif level == 'warning':
+					st.warning(text, icon="⚠️")
+				elif level == 'error':
+					st.error(text, icon="🚨")
+
+		#	Progress bar, estimated remaining time and current statistics
+		if status is not None:
+			st.session_state.simlaProgressCurr = int(100*status['progress'])
+			st.progress(min(st.session_state.simlaProgressCurr, 100))
+			st.write(S4O_Progress_Text(status))
+			if running and len(status['running']) > 0:
+				st.write('Runs in progress : ' + ', '.join(str(irun) for irun in status['running']))
+			if running and len(status.get('mpfrunning', [])) > 0:
+				st.write('DYNPOST MPF in progress for runs : ' + ', '.join(str(irun) for irun in status['mpfrunning']))
+			nstats = len(status['stats'].get('Realisation', []))
+			if table is not None:
+				st.dataframe(table(status), hide_index=True)
+			elif nstats > 1:
+				st.write('Mean+1StdDev after ' + str(nstats) + ' runs : ' + '%.4f' % status['stats']['Mean+1StdDev'][-1] + ' m.')
+
+		if running:
+			if st.button('Cancel execution', help='Cancel the queued runs and stop the runs in progress.'):
+				job.cancel()
+				st.warning('Cancelling the SIMLA runs ...', icon="⚠️")
+			return
+
+		#	The execution has finished. Store its results, and refresh the whole page to stop the refreshing.
+		if job.result is not None:
+			st.write('All SIMLA runs have finished. Total elapsed wall-clock time : ' + str(int(job.result['elapsed'])) + ' seconds.')
+		if finished is not None: finished()
+		if refresh is not None: st.rerun()
+		return
 
-	#	------------------------------------
-	#	Start all SIMLA runs as subprocesses
-	#	------------------------------------
-	irun = frun
-	ndx = 0
-	plist = []
-	rlist = []
-	while irun <= lrun:
-		p = S4O_SIMLA_Subprocess_Open(irun)
-		plist.append(p)
-		rlist.append(True)
-		irun += 1
-		ndx += 1
-
-	#	Check if any of the SIMLA subprocesses are still running
-	stillrunning = True
-	while stillrunning:
-
-		#	Check status for all runs in current block
-		irun = frun
-		ndx = 0
-		nprunning = 0
-		while irun <= lrun:
-			if plist[ndx].poll() is not None:
-				if rlist[ndx]:
-					if st.session_state.ExtendedPrint: st.write('SIMLA run number ' + str(irun) + ' has finished.')
-					st.session_state.simlaProgressCurr += st.session_state.simlaProgressDelta
-					st.session_state.simlaProgressBar.progress(st.session_state.simlaProgressCurr)
-					rlist[ndx] = False
-					if not S4O_SIMLA_Check_Run_Success(irun):
-						st.error('SIMLA run number ' + str(irun) + ' failed!', icon="🚨")
-						break
-			else:
-				nprunning += 1
+	show_job()
+
+	return
+#
+#
+
+def S4O_Execution_Key():
+
+	#	Return the key of the executions of the current model in the background execution engine, i.e. the
+	#	model directory ('' if the model has not been stored)
+	if st.session_state.modelFilePath == '': return ''
 
-			irun += 1
-			ndx += 1
+	return st.session_state.modelFileDir + "/" + st.session_state.modelFileName
+#
+#
 
-		if nprunning == 0: stillrunning = False
+def S4O_Store_Execution_Results():
 
-		if stillrunning:
-			st.session_state.simlaProgressBar.progress(st.session_state.simlaProgressCurr)
-			time.sleep(1)
+	#	Store the results of the last execution of the current model in st.session_state, once, when it has
+	#	finished. Called on every page, so the RESULTS page is updated also when the execution finished while
+	#	another page (or no page) was shown.
+	job = S4O_Engine_Job_For(S4O_Execution_Key())
+	if job is None or job.running() or job.result is None: return
+	if st.session_state.get('EngineJobStored', 0) == job.jobid: return
 
-	if not st.session_state.SimulateRuns and st.session_state.ExtendedPrint: st.write('All SIMLA runs ' + str(frun) + ' to ' + str(lrun) + ' have finished.')
+	S4O_Store_Run_Status(st.session_state, job.result)
+	st.session_state.EngineJobStored = job.jobid
 
 	return
 #
 #
 
-def S4O_Run_SIMLA_Block(frun, lrun):
+def S4O_Progress_Text(status):
+
+	#	Return a line with the number of finished runs, the percentage of the work done and the estimated remaining
+	#	wall-clock time, with the time of day when the execution is expected to finish
+	text = str(status['ndone']) + ' of ' + str(status['nruns']) + ' runs finished, ' + '%.1f' % (100.0*status['progress']) + ' % done.'
+	if status['remaining'] > 0.0:
+		text += (' Estimated remaining time : ' + S4O_Format_Duration(status['remaining']) +
+				 ' (finished ' + time.strftime('%a %H:%M', time.localtime(time.time() + status['remaining'])) + ').')
+
+	return text
+#
+#
+
+def S4O_Store_Run_Status(state, status):
+
+	#	Store the statistics and run counts from the status returned by S4O_Schedule_Runs in state
+	#	(st.session_state, or an object with the same attributes when running without Streamlit)
+	state.df_Results = pd.DataFrame(status['stats'])
+	state.noRunsPostprocessed = len(status['stats'].get('Realisation', []))
+	state.stdtolRunNumber = status['tolno']
+	if status['nnzvals'] > 0: state.SIMLA_nstep_dynres = status['nnzvals']
+	state.noRunsExecuted = status['executed']
+	state.ResultsCalculated = status['complete']
+
+	return
+#
+#
 
-	#	-----------------------------------------------------------
-	#	Execute all SIMLA runs in the current block as subprocesses
-	#	-----------------------------------------------------------
+def S4O_Schedule_Runs(runcfg, frun, lrun, report, cancel=None):
+
+	#	----------------------------------------------------------------------
+	#	Execute SIMLA runs frun to lrun as a rolling queue of subprocesses,
+	#	keeping at most maxRunsPB subprocesses running at any time and starting
+	#	the next run in the queue as soon as a running one has finished.
+	#	Each successful run is postprocessed in a pool of threads while the
+	#	other runs continue, and the statistics are updated.
+	#
+	#	When all runs have finished, the DYNPOST EXT input files (extremes.sdi)
+	#	are rewritten with the runs completed successfully in this execution
+	#	(S4O_Update_DYNPOST_EXT_Input).
+	#
+	#	The function does not use Streamlit. Messages and status changes are
+	#	passed to report(status, level, text), with level 'write', 'info',
+	#	'warning', 'error' or 'status' (text is then ''). The status dictionary
+	#	is returned when all runs have finished.
+	#
+	#	If cancel (threading.Event) is given and set, the queued runs are
+	#	cancelled and the runs in progress are stopped.
+	#
+	#	The runs may be divided into groups with separate statistics, e.g. the
+	#	cases of a parametric sweep (S4O_Sweep), given in runcfg['runGroups']
+	#	as lists of run numbers in the order of the realisations, with names in
+	#	runcfg['runGroupNames']. The realisations of each group are then
+	#	numbered from 1, and the queued runs of a group are cancelled when its
+	#	statistics have converged. By default, all runs form one group.
+	#
+	#	If runcfg['ScratchRuns'] is True, the runs on this computer are run in
+	#	scratch directories under runcfg['ScratchDir'] (S4O_Scratch), and the
+	#	results are copied back to the run directories when they have finished.
+	#
+	#	If runcfg['DYNPOST_MPF'] is True, DYNPOST MPF is run in the directory
+	#	of each successful run as soon as its SIMLA run has finished, sharing
+	#	the maxRunsPB slots with the SIMLA runs. The MPF runs waiting for a
+	#	slot are started before the next queued SIMLA run.
+	#	----------------------------------------------------------------------
 	wclstart = time.perf_counter()
 
-	#	Start subprocesses
-	irun  = frun
-	plist = []
-	while irun <= lrun:
-		p = S4O_SIMLA_Subprocess_Open(irun)
-		plist.append(p)
-		irun += 1
+	#	Assign maximum number of concurrent subprocesses and the maximum change in standard deviation used to
+	#	stop the execution when the statistics have converged
+	nslots = runcfg['maxRunsPB']
+	ptol = runcfg['stdTolerance']
+
+	#	Assign the queue of runs waiting to be started
+	queue = list(range(frun, lrun+1))
+
+	#	Assign the groups of runs with separate statistics, and the realisation number of the first run in each group
+	groups = [list(range(frun, lrun+1))]
+	groupnames = ['']
+	firstrel = frun
+	if 'runGroups' in runcfg:
+		groups = runcfg['runGroups']
+		groupnames = runcfg['runGroupNames']
+		firstrel = 1
+
+	#	Dictionaries of running subprocesses, their start times and input hashes, keyed by run number, and the
+	#	wall-clock durations of the successful runs
+	running = {}
+	started = {}
+	runhashes = {}
+	durations = []
+
+	#	Postprocessing threads and dictionary of pending postprocessing tasks, keyed by run number
+	postpool = ThreadPoolExecutor(max_workers=S4O_EXTREMES_WORKERS)
+	postproc = {}
+
+	#	List of pending tasks storing results in the result cache, and of pending tasks applying the retention policy
+	#	to the output files of the successful runs
+	cachestores = []
+	prunes = []
+
+	#	Scratch directories of the runs in progress in local scratch directories, pending tasks copying the results of
+	#	the successful runs back from them, and the runs that have been run in a scratch directory, keyed by run number
+	workpaths = {}
+	stageback = {}
+	staged = set()
+
+	#	Runs waiting for DYNPOST MPF, and the DYNPOST MPF subprocesses running, keyed by run number
+	mpfqueue = []
+	mpfrunning = {}
+
+	#	Status of the execution. The runs that completed successfully in this execution (run, taken from the result
+	#	cache or skipped by "Resume") are listed in 'succeeded', the max and min values (with times) of the
+	#	postprocessed runs are stored in 'maxmin', keyed by run number, and 'stats' holds the statistics for the
+	#	unbroken sequence of them.
+	status = {}
+	status['nruns'] = lrun - frun + 1
+	status['ndone'] = 0
+	status['failed'] = []
+	status['failures'] = {}
+	status['cancelled'] = []
+	status['succeeded'] = []
+	status['maxmin'] = {}
+	status['stats'] = {}
+	status['tolno'] = 0
+	status['groupstats'] = [{} for group in groups]
+	status['grouptolno'] = [0 for group in groups]
+	status['nnzvals'] = 0
+	status['executed'] = 0
+	status['complete'] = False
+	status['elapsed'] = 0.0
+	status['progress'] = 0.0
+	status['remaining'] = -1.0
+	status['running'] = []
+	status['mpfrunning'] = []
+	status['mpffailed'] = []
+
+	#	State of each run ('queued', 'running', 'done', 'failed' or 'cancelled'), with the wall-clock times it was
+	#	started and finished, the host it ran on, the number of failed attempts and the reason for the last failure.
+	#	The state of its DYNPOST MPF run ('', 'queued', 'running', 'done', 'failed' or 'cancelled') is kept in 'mpf'.
+	status['runs'] = {}
+	for irun in queue:
+		status['runs'][irun] = {'state': 'queued', 'started': 0.0, 'finished': 0.0, 'host': '', 'attempts': 0, 'message': '', 'mpf': ''}
+	localhost = socket.gethostname()
+
+	#	Refuse to start runs without DYNRES steps (-s2 0), e.g. when the input files have not been generated and the
+	#	number of steps has not been assigned (S4O_Assign_Run_Steps). They are listed as failed.
+	if not runcfg['SimulateRuns']:
+		for irun in [irun for irun in queue if S4O_Run_Steps(runcfg, irun) <= 0]:
+			queue.remove(irun)
+			reason = 'no DYNRES steps, the input files have not been generated'
+			status['failed'].append(irun)
+			status['failures'][irun] = reason
+			status['runs'][irun].update(state='failed', message=reason)
+			status['ndone'] += 1
+
+	#	End time of the analysis of each run in progress on this computer, used to calculate its progress
+	runends = {}
+
+	#	Number of failed attempts of each run, and the reason for stopping the runs that exceeded a time limit.
+	#	The output file sizes of each run and the time they last changed are used to detect runs without progress.
+	attempts = {}
+	timedout = {}
+	markers = {}
+	lastchange = {}
+	lastprogress = wclstart
+
+	#	Resource telemetry of each attempt of the runs, recorded in the run manifest of the model
+	telemetry = S4O_Run_Telemetry(runcfg['modelPath'])
+
+	def work_path(irun):
+		#	Return the directory run irun is running in, its scratch directory or its run directory
+		return workpaths.get(irun, S4O_Run_Path(runcfg, irun))
+
+	def record_run(irun, state, exitcode):
+		#	Record the telemetry of the attempt of run irun that has finished with state, and return the record
+		run_path = S4O_Run_Path(runcfg, irun)
+		return telemetry.finish(irun, work_path(irun), state, exitcode, status['runs'][irun]['host'], S4O_Read_End_Time(run_path + '/s.sif'), attempts.get(irun, 0) + 1)
+
+	def report_status():
+		#	Report the status, with the fraction of the work done, including the simulated time of the runs in
+		#	progress, and the estimated remaining wall-clock time. The fraction of a run in progress without simulated
+		#	time in its output is estimated from its elapsed wall-clock time.
+		nonlocal lastprogress
+		lastprogress = time.perf_counter()
+		status['running'] = sorted(running)
+		status['mpfrunning'] = sorted(mpfrunning)
+		fraction = float(status['ndone'])
+		for irun in running:
+			runfraction = S4O_Run_Fraction(work_path(irun), runends[irun]) if irun in runends else 0.0
+			if runfraction <= 0.0: runfraction = S4O_Elapsed_Fraction(lastprogress - started[irun], durations)
+			fraction += runfraction
+		status['progress'] = min(fraction/status['nruns'], 1.0)
+		status['remaining'] = S4O_Estimate_Remaining(status['progress'], lastprogress - wclstart)
+		report(status, 'status', '')
+		return
 
-	#	Make all subprocesses wait until they have finished
-	for p in plist:
-		p.wait()
+	def cancel_runs(runs, stoprunning):
+		#	Cancel the queued runs in runs (all if None), and stop the runs in progress among them if stoprunning is True
+		nonlocal queue
+		cancelled = [irun for irun in queue if runs is None or irun in runs]
+		for irun in cancelled: status['runs'][irun]['state'] = 'cancelled'
+		status['cancelled'].extend(cancelled)
+		status['ndone'] += len(cancelled)
+		queue = [irun for irun in queue if irun not in cancelled]
+		if stoprunning:
+			for irun in [irun for irun in running if runs is None or irun in runs]:
+				S4O_Kill_Process_Tree(running.pop(irun))
+				if runcores.get(irun, -1) >= 0: freecores.insert(0, runcores[irun])
+				status['runs'][irun]['state'] = 'cancelled'
+				status['runs'][irun]['finished'] = time.time()
+				record_run(irun, 'cancelled', None)
+				if irun in workpaths: S4O_Scratch_Discard(workpaths.pop(irun), S4O_Run_Path(runcfg, irun))
+				status['cancelled'].append(irun)
+				status['ndone'] += 1
+		return
 
-	#	All subprocesses have finished, update progress bar and check for errors
-	irun = frun
-	while irun <= lrun:
-		if st.session_state.ExtendedPrint: st.write('SIMLA run number ' + str(irun) + ' has finished.')
+	def cancel_mpf():
+		#	Cancel the runs waiting for DYNPOST MPF and stop the DYNPOST MPF runs in progress
+		for irun in mpfqueue + list(mpfrunning):
+			if irun in mpfrunning: S4O_Kill_Process_Tree(mpfrunning.pop(irun))
+			status['runs'][irun]['mpf'] = 'cancelled'
+		mpfqueue.clear()
+		return
+
+	def queue_mpf(irun):
+		#	Queue DYNPOST MPF for the successful run irun, unless it has already been run with the current results.
+		#	Return True if queued.
+		if not runcfg['DYNPOST_MPF']: return False
+		if S4O_DYNPOST_MPF_Check_Run_Current(irun, runcfg):
+			status['runs'][irun]['mpf'] = 'done'
+			return False
+		mpfqueue.append(irun)
+		status['runs'][irun]['mpf'] = 'queued'
+		return True
+
+	def prune_run(irun):
+		#	Apply the retention policy to the output files of the successful run irun, when SIMLA and DYNPOST MPF have
+		#	finished writing to the run directory. It has already been applied to runs run in a scratch directory.
+		if runcfg['RetentionPolicy'] != 'Keep all' and not runcfg['SimulateRuns'] and irun not in staged:
+			prunes.append(postpool.submit(S4O_Retention_Apply, S4O_Run_Path(runcfg, irun), runcfg['RetentionPolicy'], runcfg['RetentionMinBytes']))
+		return
 
-		#	Update progress bar
-		st.session_state.simlaProgressCurr += st.session_state.simlaProgressDelta
-		st.session_state.simlaProgressBar.progress(st.session_state.simlaProgressCurr)
+	def run_succeeded(irun):
+		#	Store the input hash of the successful run irun with its results in the run directory, and start the
+		#	postprocessing, the storing in the result cache and DYNPOST MPF of the run
+		S4O_Write_Run_Hash(S4O_Run_Path(runcfg, irun), runhashes[irun])
+		status['succeeded'].append(irun)
+		postproc[irun] = postpool.submit(S4O_Read_Run_MaxMin, irun, runcfg)
+		if runcfg['UseCache']:
+			cachestores.append(postpool.submit(S4O_Cache_Store, runcfg['CacheDir'], runhashes[irun], S4O_Run_Path(runcfg, irun), runcfg['CacheMaxBytes']))
+		if not queue_mpf(irun): prune_run(irun)
+		return
 
-		#	Check for errors
-		if not S4O_SIMLA_Check_Run_Success(irun):
-			st.error('SIMLA run number ' + str(irun) + ' failed!', icon="🚨")
-			break
-	
-		irun += 1
+	def collect_postprocessed(postprocessed):
+		#	Store the max and min values of the postprocessed runs, update the statistics, and cancel the queued runs of
+		#	the groups where the change in standard deviation has dropped below the tolerance
+		for irun in postprocessed:
+			try:
+				runmaxmin = postproc[irun].result()
+				if runmaxmin is not None: status['maxmin'][irun] = runmaxmin
+			except:
+				report(status, 'error', 'Failed to postprocess SIMLA run number ' + str(irun) + '!')
+			del postproc[irun]
+
+		for igroup in range(len(groups)):
+			stolno = S4O_Update_Statistics(status, igroup, groups[igroup], firstrel, ptol)
+
+			if stolno > 0 and status['grouptolno'][igroup] == 0:
+				status['grouptolno'][igroup] = stolno
+				status['tolno'] = status['grouptolno'][0]
+				nqueued = len([irun for irun in queue if irun in groups[igroup]])
+				groupname = ''
+				if groupnames[igroup] != '': groupname = ' for ' + groupnames[igroup]
+				report(status, 'info', 'Specified maximum change in standard deviation (' + str(ptol) + '%) reached' + groupname + ' after ' + str(stolno) + ' runs.' +
+						' Cancelling ' + str(nqueued) + ' queued runs.')
+				cancel_runs(groups[igroup], runcfg['KillOnConvergence'])
+		report_status()
+		return
+
+	#	Start the coordinator handing out the runs to the workers connecting to it, and the local worker
+	#	processes, if the runs are to be distributed. The number of slots is then the number of workers connected.
+	coordinator = None
+	localworkers = None
+	if runcfg['DistributedRuns']:
+		try:
+			coordinator = S4O_Coordinator(runcfg['DistributedPort'], runcfg['DistributedKey'])
+		except OSError as e:
+			report(status, 'error', 'Failed to start the coordinator on port ' + str(runcfg['DistributedPort']) + ' : ' + str(e))
+			postpool.shutdown()
+			status['failed'] = queue
+			for irun in queue: status['runs'][irun]['state'] = 'failed'
+			return status
+		localworkers = S4O_Start_Local_Workers(runcfg['DistributedPort'], runcfg['DistributedKey'], runcfg['SIMLA_HOME'], runcfg['LocalWorkers'])
+		report(status, 'info', 'Distributing SIMLA runs to the workers connecting to port ' + str(runcfg['DistributedPort']) +
+				', including ' + str(runcfg['LocalWorkers']) + ' local worker slots.')
+
+	#	Start the adaptive control of the number of concurrent runs on this computer, if selected
+	adaptive = None
+	if runcfg['AdaptiveRuns'] and coordinator is None:
+		adaptive = S4O_Adaptive_Concurrency(runcfg['minRunsPB'], nslots)
+		nslots = adaptive.nslots
+		report(status, 'info', 'Adapting the number of concurrent runs between ' + str(adaptive.minruns) + ' and ' + str(adaptive.maxruns) + ' to the load on the computer.')
+
+	#	Physical cores that are free for pinning the runs to, one run per core, and the core of each run in progress
+	freecores = []
+	runcores = {}
+	if runcfg['PinRuns'] and coordinator is None: freecores = S4O_Physical_Cores()
+
+	#	Check that the memory limit per run can be applied
+	if runcfg['RunMemoryMaxGB'] > 0 and coordinator is None and not runcfg['SimulateRuns'] and len(S4O_Memory_Cap_Args(runcfg['RunMemoryMaxGB'])) == 0:
+		report(status, 'warning', 'The memory limit per run is not applied, as it requires Linux with systemd (systemd-run --user --scope).')
+
+	#	Skip the runs already completed with the current input if "Resume" is selected
+	if runcfg['ResumeRuns']:
+		skipped = []
+		for irun in queue:
+			if S4O_SIMLA_Check_Run_Complete(irun, runcfg): skipped.append(irun)
+		for irun in skipped:
+			queue.remove(irun)
+			status['runs'][irun].update(state='done', message='completed earlier with the current input')
+			status['succeeded'].append(irun)
+			postproc[irun] = postpool.submit(S4O_Read_Run_MaxMin, irun, runcfg)
+			queue_mpf(irun)
+			status['ndone'] += 1
+		if len(skipped) > 0:
+			report(status, 'info', 'Skipping ' + str(len(skipped)) + ' SIMLA runs already completed with the current input : ' + ', '.join(str(irun) for irun in skipped))
+
+			#	Wait for the results of the skipped runs and update the statistics before any run is started, so that
+			#	no runs are started if the statistics have already converged
+			wait([postproc[irun] for irun in skipped])
+			collect_postprocessed(skipped)
+
+	while len(queue) > 0 or len(running) > 0 or len(postproc) > 0 or len(stageback) > 0 or len(mpfqueue) > 0 or len(mpfrunning) > 0:
+
+		#	Stop the execution if it has been cancelled
+		if cancel is not None and cancel.is_set() and (len(queue) > 0 or len(running) > 0 or len(mpfqueue) > 0 or len(mpfrunning) > 0):
+			report(status, 'warning', 'Execution cancelled. Stopping ' + str(len(running)) + ' runs in progress and cancelling ' + str(len(queue)) + ' queued runs.')
+			cancel_runs(None, True)
+			cancel_mpf()
+			report_status()
+
+		#	Start queued runs until all slots are occupied
+		if coordinator is not None: nslots = coordinator.slots()
+		if adaptive is not None:
+			nslotsnew = adaptive.update([running[irun].pid for irun in running] + [mpfrunning[irun].pid for irun in mpfrunning], len(queue) > 0)
+			if nslotsnew != nslots and runcfg['ExtendedPrint']: report(status, 'write', 'Number of concurrent runs changed to ' + str(nslotsnew) + '.')
+			nslots = nslotsnew
+
+		#	Start DYNPOST MPF for the finished runs first, as DYNPOST always runs on this computer. With distributed
+		#	runs the slots are those of the workers, and at most maxRunsPB DYNPOST MPF runs are started here.
+		nlocal = len(mpfrunning)
+		if coordinator is None: nlocal += len(running)
+		while len(mpfqueue) > 0 and nlocal < (nslots if coordinator is None else runcfg['maxRunsPB']):
+			irun = mpfqueue.pop(0)
+			mpfrunning[irun] = S4O_DYNPOST_Subprocess_Open(irun, runcfg)
+			status['runs'][irun]['mpf'] = 'running'
+			nlocal += 1
+			if runcfg['ExtendedPrint']:
+				report(status, 'write', 'DYNPOST MPF for SIMLA run number ' + str(irun) + ' has started : ' + ' '.join(mpfrunning[irun].args))
+
+		while len(queue) > 0 and len(running) + (len(mpfrunning) if coordinator is None else 0) < nslots:
+			irun = queue.pop(0)
+			run_path = S4O_Run_Path(runcfg, irun)
+			runhashes[irun] = S4O_SIMLA_Run_Hash(irun, runcfg)
+			S4O_Delete_Run_Hash(run_path)
+
+			#	Take the results from the result cache instead of running SIMLA if they are found there
+			if runcfg['UseCache'] and S4O_Cache_Fetch(runcfg['CacheDir'], runhashes[irun], run_path):
+				report(status, 'write', 'SIMLA run number ' + str(irun) + ' was taken from the result cache.')
+				status['runs'][irun].update(state='done', started=time.time(), finished=time.time(), host=localhost, message='taken from the result cache')
+				S4O_Write_Run_Hash(run_path, runhashes[irun])
+				telemetry.start(irun, None)
+				record_run(irun, 'cached', 0)
+				status['succeeded'].append(irun)
+				postproc[irun] = postpool.submit(S4O_Read_Run_MaxMin, irun, runcfg)
+				queue_mpf(irun)
+				status['ndone'] += 1
+				report_status()
+				continue
+
+			if not runcfg['SimulateRuns']: S4O_Cache_Unlink(run_path)
+			if os.path.exists(run_path + '/' + S4O_MPF_HASH_FILE): os.remove(run_path + '/' + S4O_MPF_HASH_FILE)
+			if coordinator is not None:
+				running[irun] = S4O_SIMLA_Remote_Open(irun, runcfg, coordinator)
+			else:
+				runcores[irun] = -1
+				if len(freecores) > 0: runcores[irun] = freecores.pop(0)
+				if runcfg['ScratchRuns'] and not runcfg['SimulateRuns']:
+					workpaths[irun] = S4O_Scratch_Create(runcfg['ScratchDir'], run_path, irun)
+					staged.add(irun)
+				running[irun] = S4O_SIMLA_Subprocess_Open(irun, runcfg, runcores[irun], work_path(irun))
+				runends[irun] = S4O_Read_End_Time(run_path + '/s.sif')
+			started[irun] = time.perf_counter()
+			telemetry.start(irun, getattr(running[irun], 'pid', None))
+			status['runs'][irun].update(state='running', started=time.time(), finished=0.0, host=localhost)
+			markers[irun] = None
+			lastchange[irun] = started[irun]
+			if runcfg['ExtendedPrint']:
+				report(status, 'write', 'SIMLA run number ' + str(irun) + ' has started in ' + work_path(irun) + ' : ' + ' '.join(running[irun].args))
+
+		#	Collect the runs that have finished since the last check, sampling the resource use of the runs first
+		finished = []
+		for irun in running:
+			telemetry.sample(irun)
+			if running[irun].poll() is not None: finished.append(irun)
+
+		#	Report the finished runs, check for errors and start postprocessing
+		for irun in finished:
+			p = running.pop(irun)
+			if runcores.get(irun, -1) >= 0: freecores.insert(0, runcores[irun])
+			runelapsed = time.perf_counter() - started[irun]
+			status['runs'][irun]['finished'] = time.time()
+			if coordinator is not None: status['runs'][irun]['host'] = p.host()
+
+			if irun not in timedout and S4O_SIMLA_Check_Run_Success(irun, runcfg, work_path(irun)):
+				record = record_run(irun, 'done', p.returncode)
+				text = 'SIMLA run number ' + str(irun) + ' has finished. Elapsed wall-clock time : ' + '%.1f' % runelapsed + ' seconds'
+				if record['cpu_user'] is not None:
+					text += ', CPU time : ' + '%.1f' % (record['cpu_user'] + record['cpu_system']) + ' seconds, peak memory : ' + '%.0f' % (record['peak_rss']/1.0e6) + ' MB'
+				report(status, 'write', text + '.')
+				status['runs'][irun]['state'] = 'done'
+				durations.append(runelapsed)
+
+				#	Copy the results back from the scratch directory before the run is postprocessed
+				if irun in workpaths:
+					stageback[irun] = postpool.submit(S4O_Scratch_Return, workpaths.pop(irun), S4O_Run_Path(runcfg, irun), runcfg['RetentionPolicy'], runcfg['RetentionMinBytes'])
+				else:
+					run_succeeded(irun)
+			else:
+				reason = timedout.pop(irun, 'SIMLA did not complete, return code ' + str(p.returncode))
+				record_run(irun, 'retried' if attempts.get(irun, 0) < runcfg['RunRetries'] else 'failed', p.returncode)
+				if irun in workpaths: S4O_Scratch_Discard(workpaths.pop(irun), S4O_Run_Path(runcfg, irun))
+				attempts[irun] = attempts.get(irun, 0) + 1
+				status['runs'][irun].update(attempts=attempts[irun], message=reason)
+
+				#	Retry the run first in the queue, unless it has been retried the maximum number of times
+				if attempts[irun] <= runcfg['RunRetries']:
+					report(status, 'warning', 'SIMLA run number ' + str(irun) + ' failed (' + reason + '). Retrying, retry ' +
+							str(attempts[irun]) + ' of ' + str(runcfg['RunRetries']) + '.')
+					queue.insert(0, irun)
+					status['runs'][irun]['state'] = 'queued'
+					continue
+
+				report(status, 'error', 'SIMLA run number ' + str(irun) + ' failed (' + reason + ')!')
+				status['failed'].append(irun)
+				status['failures'][irun] = reason
+				status['runs'][irun]['state'] = 'failed'
+
+			status['ndone'] += 1
+			report_status()
+
+		#	Collect the runs whose results have been copied back from their scratch directories, and postprocess them
+		returned = [irun for irun in stageback if stageback[irun].done()]
+		for irun in returned:
+			stagetask = stageback.pop(irun)
+			if stagetask.exception() is not None:
+				reason = 'the results were not copied back from the scratch directory : ' + str(stagetask.exception())
+				report(status, 'error', 'SIMLA run number ' + str(irun) + ' failed (' + reason + ')!')
+				status['failed'].append(irun)
+				status['failures'][irun] = reason
+				status['runs'][irun].update(state='failed', message=reason)
+				continue
+			prunes.append(stagetask)
+			run_succeeded(irun)
+
+		#	Collect the DYNPOST MPF runs that have finished. A failed DYNPOST MPF run does not fail the SIMLA run.
+		mpffinished = [irun for irun in mpfrunning if mpfrunning[irun].poll() is not None]
+		for irun in mpffinished:
+			p = mpfrunning.pop(irun)
+			if S4O_DYNPOST_MPF_Check_Run_Success(irun, runcfg):
+				S4O_Write_MPF_Hash(irun, runcfg)
+				status['runs'][irun]['mpf'] = 'done'
+				if runcfg['ExtendedPrint']: report(status, 'write', 'DYNPOST MPF for SIMLA run number ' + str(irun) + ' has finished.')
+			else:
+				status['runs'][irun]['mpf'] = 'failed'
+				status['mpffailed'].append(irun)
+				report(status, 'warning', 'DYNPOST MPF for SIMLA run number ' + str(irun) + ' failed, return code ' + str(p.returncode) + '. See dympf_print.out in the run directory.')
+			prune_run(irun)
+		if len(mpffinished) > 0: report_status()
+
+		#	Collect the runs that have been postprocessed since the last check
+		postprocessed = []
+		for irun in postproc:
+			if postproc[irun].done(): postprocessed.append(irun)
+		if len(postprocessed) > 0: collect_postprocessed(postprocessed)
+
+		#	Report the progress of the runs in progress regularly, and stop the runs that exceed the wall-clock
+		#	time limit or have not progressed within the no-progress time limit. They are reported as failed
+		#	when they are collected as finished runs.
+		if time.perf_counter() - lastprogress >= S4O_PROGRESS_INTERVAL:
+			report_status()
+			now = time.perf_counter()
+			for irun in running:
+				if runcfg['RunTimeout'] > 0 and now - started[irun] > runcfg['RunTimeout']:
+					timedout[irun] = 'exceeded the wall-clock time limit of ' + S4O_Format_Duration(runcfg['RunTimeout'])
+				elif runcfg['StallTimeout'] > 0 and irun in runends and not runcfg['SimulateRuns']:
+					marker = S4O_Progress_Marker(work_path(irun))
+					if marker != markers[irun]:
+						markers[irun] = marker
+						lastchange[irun] = now
+					elif now - lastchange[irun] > runcfg['StallTimeout']:
+						timedout[irun] = 'no progress for ' + S4O_Format_Duration(now - lastchange[irun])
+				if irun in timedout: S4O_Kill_Process_Tree(running[irun])
+
+		#	Wait a little before checking the running subprocesses again
+		if len(finished) == 0 and len(postprocessed) == 0 and len(returned) == 0 and len(mpffinished) == 0: time.sleep(0.5)
+
+	postpool.shutdown()
+
+	#	List only the runs completed successfully in this execution in the DYNPOST EXT input files
+	S4O_Update_DYNPOST_EXT_Input(runcfg, [irun for group in groups for irun in group], status['succeeded'])
+
+	if coordinator is not None:
+		coordinator.close()
+		if localworkers is not None: localworkers.wait()
+	for cachestore in cachestores:
+		if cachestore.exception() is not None: report(status, 'warning', 'Failed to store results in the result cache : ' + str(cachestore.exception()))
+
+	#	Report the output files compressed or deleted by the retention policy
+	nfiles = 0
+	freed = 0
+	for prune in prunes:
+		if prune.exception() is not None:
+			report(status, 'warning', 'Failed to apply the retention policy to the output files : ' + str(prune.exception()))
+		else:
+			nfiles += prune.result()[0]
+			freed += prune.result()[1]
+	if nfiles > 0:
+		report(status, 'write', ('Compressed ' if runcfg['RetentionPolicy'] == 'Compress' else 'Deleted ') + str(nfiles) + ' output files of ' + str(len(prunes)) +
+			   ' successful runs, freeing ' + '%.2f' % (freed/1.0e9) + ' GB.')
 
-	#	Calculate elapsed wall-clock time for the current block
+	#	Calculate elapsed wall-clock time for all runs in the queue
 	wclend     = time.perf_counter()
-	wclelapsed = wclend - wclstart
+	status['elapsed'] = wclend - wclstart
+
+	#	Assign the number of runs executed as the unbroken sequence of successful runs, so that only the results of
+	#	runs completed in this execution are used, also when runs have been cancelled or have failed
+	irun = frun
+	while irun in status['succeeded']: irun += 1
+	status['executed'] = irun - 1
+	if len(status['cancelled']) > 0:
+		report(status, 'write', 'Cancelled SIMLA runs : ' + ', '.join(str(irun) for irun in sorted(status['cancelled'])))
+
+	#	The statistics are complete if all runs to be reported on the RESULTS page have been postprocessed
+	if frun == 1 and status['executed'] > 0 and len(status['stats'].get('Realisation', [])) == status['executed']: status['complete'] = True
+
+	if len(status['mpffailed']) > 0:
+		report(status, 'warning', 'DYNPOST MPF failed for SIMLA runs : ' + ', '.join(str(irun) for irun in sorted(status['mpffailed'])))
+
+	if len(status['failed']) > 0:
+		report(status, 'error', 'SIMLA runs failed : ' + ', '.join(str(irun) + ' (' + status['failures'][irun] + ')' for irun in sorted(status['failed'])))
+
+	if not runcfg['SimulateRuns'] and runcfg['ExtendedPrint']: report(status, 'write', 'All SIMLA runs ' + str(frun) + ' to ' + str(lrun) + ' have finished.' +
+																		' Elapsed wall-clock time : ' + str(int(status['elapsed'])) + ' seconds.')
+
+	return status
+#
+#
+
+def S4O_Read_Run_MaxMin(irun, runcfg):
 
-	if not st.session_state.SimulateRuns: st.write('All SIMLA runs ' + str(frun) + ' to ' + str(lrun) + ' have finished.' +
-												   ' Elapsed wall-clock time : ' + str(int(wclelapsed)) + ' seconds.')
+	#	Read the max and min lateral displacement (tsid=5) with times of a finished run, and the total number of
+	#	non-zero time series values. Return None if the DYNPOST file (.dyn) does not exist (simulated runs).
+	dynfile = S4O_Run_Path(runcfg, irun) + '/s.dyn'
+	if not os.path.exists(dynfile): return None
+
+	nnzvals, maxval, maxtime, minval, mintime = S4O_ReadDynMaxMin(dynfile, 5, 0)
+
+	return (maxval, maxtime, minval, mintime, nnzvals)
+#
+#
+
+def S4O_Update_DYNPOST_EXT_Input(runcfg, runs, succeeded):
+
+	#	Rewrite the DYNPOST EXT input files (extremes.sdi) in the directories of the runs in runs, the model directory
+	#	or the case directories of a parametric sweep, listing only the runs in succeeded. The runs that were
+	#	cancelled or failed are left out, as their DYNPOST files are missing or left from an earlier execution. An
+	#	input file without any successful runs is deleted.
+	extruns = {}
+	for irun in runs:
+		run_path = S4O_Run_Path(runcfg, irun)
+		ext_path = os.path.dirname(run_path)
+		if ext_path not in extruns: extruns[ext_path] = []
+		if irun in succeeded: extruns[ext_path].append(int(os.path.basename(run_path)[1:]))
+
+	for ext_path in extruns:
+		if not os.path.exists(ext_path + '/extremes.sdi'): continue
+		if len(extruns[ext_path]) > 0:
+			S4O_Generate_DYNPOST_EXT_Input(ext_path, sorted(extruns[ext_path]))
+		else:
+			os.remove(ext_path + '/extremes.sdi')
 
 	return
 #
 #
 
-def S4O_SIMLA_Subprocess_Open(irun):
+def S4O_Update_Statistics(status, igroup, runs, firstrel, ptol):
+
+	#	Update the statistics of group igroup in status for the unbroken sequence of postprocessed runs at the start
+	#	of runs, numbered as realisations from firstrel, and return the realisation number for which the change in
+	#	standard deviation drops below ptol (0 if not reached yet). The statistics of the first group are also
+	#	stored as status['stats'].
+	maxmin = status['maxmin']
+	runlist = []
+	maxlist = []
+	minlist = []
+	for irun in runs:
+		if irun not in maxmin: break
+		runlist.append(firstrel + len(runlist))
+		maxlist.append(maxmin[irun][0])
+		minlist.append(maxmin[irun][2])
+
+	if len(runlist) == 0: return 0
+
+	status['groupstats'][igroup] = S4O_Calculate_Statistics(runlist, maxlist, minlist)
+	if igroup == 0:
+		status['stats'] = status['groupstats'][0]
+		status['nnzvals'] = maxmin[runs[0]][4]
+	tolno = S4O_Check_StdDev_Tolerance(status['groupstats'][igroup], ptol)
+
+	return tolno
+#
+#
+
+def S4O_Assign_Run_Config(state):
+
+	#	Collect the parameters needed to start and check SIMLA and DYNPOST runs in a plain dictionary, so
+	#	that the run functions below neither depend on st.session_state nor on the current working directory.
+	#	state is st.session_state, or an object with the same attributes when running without Streamlit.
+	runcfg = {}
+	runcfg['modelPath'] = os.path.abspath(state.modelFileDir + "/" + state.modelFileName)
+	runcfg['SIMLA_HOME'] = state.SIMLA_HOME
+	runcfg['SIMLA_EXE'] = state.SIMLA_EXE
+	runcfg['SIMLA_Identity'] = S4O_Executable_Identity(S4O_SYNTHETIC_PATH if state.SyntheticRuns else state.SIMLA_EXE)
+	runcfg['DYNPOST_EXE'] = state.DYNPOST_EXE
+	runcfg['DYNPOST_MPF'] = state.RunDYNPOSTMPF
+	runcfg['SIMLA_nstep_dynres'] = state.SIMLA_nstep_dynres
+	runcfg['SimulateRuns'] = state.SimulateRuns
+	runcfg['SyntheticRuns'] = state.SyntheticRuns
+	runcfg['SyntheticRunTime'] = state.SyntheticRunTime
+	runcfg['SyntheticLoad'] = state.SyntheticLoad
+	runcfg['ExtendedPrint'] = state.ExtendedPrint
+	runcfg['maxRunsPB'] = state.maxRunsPB
+	runcfg['AdaptiveRuns'] = state.AdaptiveRuns
+	runcfg['minRunsPB'] = state.minRunsPB
+	runcfg['PinRuns'] = state.PinRuns
+	runcfg['RunNice'] = state.RunNice
+	runcfg['RunIONice'] = state.RunIONice
+	runcfg['RunMemoryMaxGB'] = state.RunMemoryMaxGB
+	runcfg['stdTolerance'] = float(state.df_Execution.iloc[4,1])
+	runcfg['KillOnConvergence'] = state.KillOnConvergence
+	runcfg['RunTimeout'] = state.RunTimeoutMin*60.0
+	runcfg['StallTimeout'] = state.StallTimeoutMin*60.0
+	runcfg['RunRetries'] = state.RunRetries
+	runcfg['ResumeRuns'] = state.ResumeRuns
+	runcfg['UseCache'] = state.UseResultCache and not state.SimulateRuns
+	runcfg['CacheDir'] = state.ResultCacheDir
+	runcfg['CacheMaxBytes'] = int(state.ResultCacheMaxGB*1.0e9)
+	runcfg['RetentionPolicy'] = state.RetentionPolicy
+	runcfg['ScratchRuns'] = state.ScratchRuns
+	runcfg['ScratchDir'] = state.ScratchDir
+	runcfg['RetentionMinBytes'] = int(state.RetentionMinMB*1.0e6)
+	runcfg['DistributedRuns'] = state.DistributedRuns
+	runcfg['DistributedPort'] = state.DistributedPort
+	runcfg['DistributedKey'] = state.DistributedKey
+	runcfg['LocalWorkers'] = state.LocalWorkers
+
+	return runcfg
+#
+#
+
+def S4O_Run_Path(runcfg, irun):
+
+	#	Assign the run directory for SIMLA run number irun, given in runcfg['runPaths'] for the runs of a
+	#	parametric sweep (S4O_Sweep)
+	if 'runPaths' in runcfg: return runcfg['runPaths'][irun]
+	run_path = runcfg['modelPath'] + '/r' + str(irun)
+
+	return run_path
+#
+#
+
+def S4O_Run_Steps(runcfg, irun):
+
+	#	Assign the number of DYNRES steps (-s2) of SIMLA run number irun, given in runcfg['runSteps'] for the runs of
+	#	a parametric sweep (S4O_Sweep), as it depends on the parameters of each case
+	if 'runSteps' in runcfg: return runcfg['runSteps'][irun]
+
+	return runcfg['SIMLA_nstep_dynres']
+#
+#
+
+def S4O_SIMLA_Subprocess_Open(irun, runcfg, core, cwd=None):
 
-	#	Change working directory to the current SIMLA run directory
-	cwd = st.session_state.modelFileDir + "/" + st.session_state.modelFileName + '/r' + str(irun)
-	os.chdir(cwd)
+	#	Assign the current SIMLA run directory as working directory for the subprocess, unless another directory is
+	#	given in cwd (a scratch directory, S4O_Scratch)
+	if cwd is None: cwd = S4O_Run_Path(runcfg, irun)
 
 	#	Run SIMLA or simulate a SIMLA run with the sleep command?
-	if st.session_state.SimulateRuns:
-		#	Assign a sleep command to simulate a SIMLA run
+	if runcfg['SimulateRuns']:
+		#	Simulate a SIMLA run by sleeping for a random number of seconds
 		s2w = random.randint(15,30)
-		runcmd = 'sleep(' + str(s2w) + ')'
-		if st.session_state.ExtendedPrint:
-			sruncmd = st.session_state.SIMLA_EXE + ' -n s' + ' -s2 ' + str(st.session_state.SIMLA_nstep_dynres) + ' > simla_print.out'
-			st.write('SIMLA run command : '+ sruncmd)
-			st.write('SIMLA run number ' + str(irun) + ' waits for ' + str(s2w) + ' seconds.')
+		p = S4O_Launch_Process(S4O_Sleep_Args(s2w), cwd, '')
 	else:
-		#	Assign the SIMLA run command
-		runcmd = st.session_state.SIMLA_EXE + ' -n s' + ' -s2 ' + str(st.session_state.SIMLA_nstep_dynres) + ' > simla_print.out'
+		#	Start SIMLA with the print output redirected to simla_print.out, in a memory limited scope if selected
+		p = S4O_Launch_Process(S4O_Memory_Cap_Args(runcfg['RunMemoryMaxGB']) + S4O_SIMLA_Run_Args(irun, runcfg), cwd, 'simla_print.out')
 
-	#	Open the SIMLA subprocess
-	p = subprocess.Popen(["powershell", runcmd])
+	#	Set the priority of the run and pin it to a physical core (if core >= 0)
+	S4O_Set_Process_Priority(p.pid, runcfg['RunNice'], runcfg['RunIONice'])
+	if core >= 0: S4O_Set_Process_Affinity(p.pid, [core])
 
 	return p
 #
 #
 
-def S4O_DYNPOST_Subprocess_Open(irun):
+def S4O_SIMLA_Remote_Open(irun, runcfg, coordinator):
 
-	#	Change working directory to the current SIMLA run directory
-	cwd = st.session_state.modelFileDir + "/" + st.session_state.modelFileName + '/r' + str(irun)
-	os.chdir(cwd)
+	#	Submit SIMLA run number irun to the workers connected to the coordinator. The worker runs SIMLA from its
+	#	own SIMLA installation with the same arguments as a local run, sleeps if the run is simulated, or runs the
+	#	synthetic SIMLA (S4O_Synthetic) if selected.
+	spec = {}
+	spec['SimulateRuns'] = runcfg['SimulateRuns']
+	spec['sleep'] = 0
+	if runcfg['SimulateRuns']: spec['sleep'] = random.randint(15,30)
+	spec['synthetic'] = None
+	if runcfg['SyntheticRuns']: spec['synthetic'] = (runcfg['SyntheticRunTime'], runcfg['SyntheticLoad'])
+	spec['args'] = S4O_SIMLA_Run_Args(irun, runcfg)[-4:]
 
-	#	Run DYNPOST or simulate a DYNPOST run with the sleep command?
-	if st.session_state.SimulateRuns:
-		#	Assign a sleep command to simulate a DYNPOST MPF run
-		s2w = random.randint(1,5)
-		runcmd = 'sleep(' + str(s2w) + ')'
-		if st.session_state.ExtendedPrint: st.write('DYNPOST MPF run number ' + str(irun) + ' waits for ' + str(s2w) + ' seconds.')
+	p = coordinator.submit(S4O_Run_Path(runcfg, irun), S4O_RUN_INPUT_FILES, spec, ['(worker)'] + spec['args'])
+
+	return p
+#
+#
+
+def S4O_SIMLA_Run_Args(irun, runcfg):
+
+	#	Assign the command of SIMLA run number irun as an argument list, starting the synthetic SIMLA (S4O_Synthetic)
+	#	if selected
+	if runcfg['SyntheticRuns']:
+		args = S4O_Synthetic_Args('simla', runcfg['SyntheticRunTime'], runcfg['SyntheticLoad'])
 	else:
-		#	Assign the DYNPOST run command
-		runcmd = st.session_state.DYNPOST_EXE + ' -n s > dympf_print.out'
+		args = [runcfg['SIMLA_EXE']]
+	args += ['-n', 's', '-s2', str(S4O_Run_Steps(runcfg, irun))]
 
-	#	Open the DYNPOST subprocess
-	p = subprocess.Popen(["powershell", runcmd])
+	return args
+#
+#
 
-	return p
+def S4O_SIMLA_Run_Hash(irun, runcfg):
+
+	#	Calculate the hash of the SIMLA executable (its path and the identity of its content, calculated once per
+	#	execution in S4O_Assign_Run_Config), the number of DYNRES steps (-s2) and the input files of SIMLA run
+	#	number irun. The -s2 value is included, as the input files may have been generated earlier than the number of
+	#	steps was assigned.
+	if runcfg['SyntheticRuns']:
+		args = [S4O_SYNTHETIC_PATH, runcfg['SIMLA_Identity']]
+	else:
+		args = [runcfg['SIMLA_EXE'], runcfg['SIMLA_Identity']]
+	runhash = S4O_Hash_Run_Inputs(S4O_Run_Path(runcfg, irun), args + ['-s2', str(S4O_Run_Steps(runcfg, irun))])
+
+	return runhash
+#
+#
+
+def S4O_SIMLA_Check_Run_Complete(irun, runcfg):
+
+	#	Return True if SIMLA run number irun has already completed successfully with the current input, i.e. if the
+	#	hash stored when the run finished matches the current input and the SIMLA list file reports success
+	runhash = S4O_Read_Run_Hash(S4O_Run_Path(runcfg, irun))
+	if runhash == '' or runhash != S4O_SIMLA_Run_Hash(irun, runcfg): return False
+
+	return S4O_SIMLA_Check_Run_Success(irun, runcfg)
+#
+#
+
+def S4O_DYNPOST_Args(runcfg):
+
+	#	Assign the DYNPOST program as an argument list, the synthetic DYNPOST (S4O_Synthetic) if selected, which
+	#	runs for a tenth of the time of the synthetic SIMLA runs
+	if runcfg['SyntheticRuns']: return S4O_Synthetic_Args('dynpost', 0.1*runcfg['SyntheticRunTime'], runcfg['SyntheticLoad'])
+
+	return [runcfg['DYNPOST_EXE']]
 #
 #
 
-def S4O_SIMLA_DYNPOST_EXT_Run(lrun):
+def S4O_DYNPOST_Subprocess_Open(irun, runcfg):
 
-	#	Change working directory to current model directory
-	cwd = st.session_state.modelFileDir + "/" + st.session_state.modelFileName
-	os.chdir(cwd)
+	#	Assign the current SIMLA run directory as working directory for the subprocess
+	cwd = S4O_Run_Path(runcfg, irun)
 
 	#	Run DYNPOST or simulate a DYNPOST run with the sleep command?
-	if st.session_state.SimulateRuns:
-		#	Assign a sleep command to simulate a DYNPOST EXT run
-		s2w = random.randint(5,10)
-		runcmd = 'sleep(' + str(s2w) + ')'
-		if st.session_state.ExtendedPrint: st.write('DYNPOST EXT run waits for ' + str(s2w) + ' seconds.')
+	if runcfg['SimulateRuns']:
+		#	Simulate a DYNPOST MPF run by sleeping for a random number of seconds
+		s2w = random.randint(1,5)
+		p = S4O_Launch_Process(S4O_Sleep_Args(s2w), cwd, '')
 	else:
-		#	Assign the DYNPOST run command
-		runcmd = st.session_state.DYNPOST_EXE + ' -n extremes > dyext_print.out'
+		#	Start DYNPOST with the print output redirected to dympf_print.out
+		args = S4O_DYNPOST_Args(runcfg) + ['-n', 's']
+		p = S4O_Launch_Process(args, cwd, 'dympf_print.out')
+
+	return p
+#
+#
+
+def S4O_DYNPOST_MPF_Check_Run_Current(irun, runcfg):
+
+	#	Return True if DYNPOST MPF has already been run successfully on the current results of SIMLA run number irun,
+	#	i.e. if the input hash stored by S4O_Write_MPF_Hash matches the hash of the SIMLA run
+	if runcfg['SimulateRuns']: return False
+	run_path = S4O_Run_Path(runcfg, irun)
+	if not os.path.exists(run_path + '/' + S4O_MPF_HASH_FILE): return False
+	with open(run_path + '/' + S4O_MPF_HASH_FILE, 'r') as f:
+		mpfhash = f.read().strip()
+	if mpfhash == '' or mpfhash != S4O_Read_Run_Hash(run_path): return False
+
+	return S4O_DYNPOST_MPF_Check_Run_Success(irun, runcfg)
+#
+#
 
-	#	Execute DYNPOST to generate EXT values
-	rext = subprocess.run(["powershell", runcmd])
+def S4O_Write_MPF_Hash(irun, runcfg):
 
-	if rext.returncode != 0: st.error('DYNPOST EXT run failed!', icon="🚨")
+	#	Store the input hash of SIMLA run number irun with its DYNPOST MPF results, after a successful DYNPOST MPF run
+	run_path = S4O_Run_Path(runcfg, irun)
+	with open(run_path + '/' + S4O_MPF_HASH_FILE, 'w') as f:
+		f.write(S4O_Read_Run_Hash(run_path))
 
 	return
 #
 #
 
-def S4O_SIMLA_Check_Run_Success(irun):
+def S4O_SIMLA_Check_Run_Success(irun, runcfg, run_path=None):
 
 	#	Return True if simulated run
-	if st.session_state.SimulateRuns: return True
+	if runcfg['SimulateRuns']: return True
 
 	#	Set default return value
 	success = False
 
-	#	Assign SIMLA list file name
-	slfname = st.session_state.modelFileDir + "/" + st.session_state.modelFileName + '/r' + str(irun) + '/s.slf'
+	#	Assign SIMLA list file name, in run_path if given (a scratch directory, S4O_Scratch), and return False if it
+	#	does not exist
+	if run_path is None: run_path = S4O_Run_Path(runcfg, irun)
+	slfname = run_path + '/s.slf'
+	if not os.path.exists(slfname): return success
 
 	#	Open the SIMLA list file in read mode and extract the last 16 lines
 	with open(slfname, "r") as slf:
@@ -401,16 +1234,17 @@ def S4O_SIMLA_Check_Run_Success(irun):
 #
 #
 
-def S4O_DYNPOST_MPF_Check_Run_Success(irun):
+def S4O_DYNPOST_MPF_Check_Run_Success(irun, runcfg):
 
 	#	Return True if simulated run
-	if st.session_state.SimulateRuns: return True
+	if runcfg['SimulateRuns']: return True
 
 	#	Set default return value
 	success = False
 
-	#	Assign DYNPOST list file name
-	sdoname = st.session_state.modelFileDir + "/" + st.session_state.modelFileName + '/r' + str(irun) + '/s.sdo'
+	#	Assign DYNPOST list file name and return False if it does not exist
+	sdoname = S4O_Run_Path(runcfg, irun) + '/s.sdo'
+	if not os.path.exists(sdoname): return success
 
 	#	Open the DYNPOST list file in read mode and extract the last 17 lines
 	with open(sdoname, "r") as sdo:
@@ -430,31 +1264,3 @@ def S4O_DYNPOST_MPF_Check_Run_Success(irun):
 #
 #
 
-def S4O_DYNPOST_EXT_Check_Run_Success():
-
-	#	Return True if simulated run
-	if st.session_state.SimulateRuns: return True
-
-	#	Set default return value
-	success = False
-
-	#	Assign DYNPOST list file name
-	sdoname = st.session_state.modelFileDir + "/" + st.session_state.modelFileName + '/extremes.sdo'
-
-	#	Open the DYNPOST list file in read mode and extract the last 17 lines
-	with open(sdoname, "r") as sdo:
-		#	Read all lines in the file
-		all_lines = sdo.readlines()
-		#	Extract the last 17 lines
-		last_17_lines = all_lines[-17:]
-	
-	#	Search for the string "DYNPOST successfully completed" in the last 17 lines
-	strsuccess = 'DYNPOST successfully completed'
-	for ndx in range(len(last_17_lines)):
-		if strsuccess in last_17_lines[ndx]:
-			success = True
-			break
-
-	return success
-#
-#
@@ -0,0 +1,84 @@
+"""
+File: S4O_Scratch.py
+Description:
+Local scratch staging of the SIMLA runs. When the model directory is on a network share, SIMLA can be run in a
+directory on a local disk (or tmpfs) of the computer instead, so that the step-by-step output of the concurrent runs
+does not go over the network. The input files are generated in the run directory as usual and copied to a scratch
+directory when the run is started. When the run has finished successfully, the retention policy (S4O_Retention) is
+applied in the scratch directory and the remaining output files are copied back to the run directory. Only the list
+and print files are copied back from failed runs. The scratch directory is deleted in both cases.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import shutil
+import tempfile
+from S4O_RunHash import S4O_RUN_INPUT_FILES
+from S4O_Retention import S4O_Retention_Apply
+
+#	Default parent directory of the scratch directories
+S4O_SCRATCH_DIR = tempfile.gettempdir() + '/simla4obs'
+
+#	Files copied back from the scratch directory of a failed run, to find the reason for the failure
+S4O_SCRATCH_FAILURE_FILES = ['s.slf', 'simla_print.out']
+
+def S4O_Scratch_Create(scratch_dir, run_path, irun):
+
+	#	Create a new scratch directory for run number irun under scratch_dir, copy the input files of the run from
+	#	run_path into it and return its path
+	os.makedirs(scratch_dir, exist_ok=True)
+	work_path = tempfile.mkdtemp(prefix='r' + str(irun) + '-', dir=scratch_dir)
+	for name in S4O_RUN_INPUT_FILES:
+		if os.path.exists(run_path + '/' + name): shutil.copy2(run_path + '/' + name, work_path + '/' + name)
+
+	return work_path
+#
+#
+
+def S4O_Scratch_Copy_Back(work_path, run_path, names):
+
+	#	Copy the files names from the scratch directory work_path to run_path. Each file is copied under a temporary
+	#	name first, so that a partly copied file is never seen in the run directory.
+	for name in names:
+		if not os.path.exists(work_path + '/' + name): continue
+		shutil.copy2(work_path + '/' + name, run_path + '/' + name + '.tmp')
+		os.replace(run_path + '/' + name + '.tmp', run_path + '/' + name)
+
+	return
+#
+#
+
+def S4O_Scratch_Return(work_path, run_path, policy, minbytes):
+
+	#	Apply the retention policy to the output files of the successful run in the scratch directory work_path, copy
+	#	the remaining output files back to run_path and delete the scratch directory. Return the number of files
+	#	handled and the number of bytes freed by the retention policy (S4O_Retention_Apply).
+	nfiles, freed = S4O_Retention_Apply(work_path, policy, minbytes)
+	names = [name for name in sorted(os.listdir(work_path)) if name not in S4O_RUN_INPUT_FILES]
+	S4O_Scratch_Copy_Back(work_path, run_path, names)
+	shutil.rmtree(work_path, ignore_errors=True)
+
+	return nfiles, freed
+#
+#
+
+def S4O_Scratch_Discard(work_path, run_path):
+
+	#	Copy the list and print files of a failed or stopped run back from the scratch directory work_path to
+	#	run_path, and delete the scratch directory
+	try:
+		S4O_Scratch_Copy_Back(work_path, run_path, S4O_SCRATCH_FAILURE_FILES)
+	except OSError:
+		pass
+	shutil.rmtree(work_path, ignore_errors=True)
+
+	return
+#
+#
@@ -3,12 +3,12 @@ File: S4O_Seabed.py
 Description:
 These functions initiates and updates the df_Seabed pandas dataframe.
 Revisions:
-YYYY-MM-DD:
+2026-10-18: S4O_Seabed_Defaults; Takes the state to assign the defaults in as argument (st.session_state by default), for use without Streamlit.
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-03-14"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -156,10 +156,10 @@ def S4O_Seabed():
 #	SEABED set defaults function
 #
 
-def S4O_Seabed_Defaults():
+def S4O_Seabed_Defaults(state=st.session_state):
 
 	#	Assign default seabed parameters
-	if 'df_Seabed' not in st.session_state:
+	if 'df_Seabed' not in state:
 		#	Y direction
 		cmnx_y = 0
 		Ssuw_y = 11800.0
@@ -198,11 +198,11 @@ def S4O_Seabed_Defaults():
 	         ['Elastic stiffness z-dir [N/m2] :', Elas_z],
 	         ['Selected penetration mode index [-] :', cpnx], ['Penetration [m] :', IPpv], ['Lay tension [N] :', IPtn],
 	         ['Submerged mass during lay [kg/m] :', Smly], ['Bending stiffness [Nm2] :', Bstf]]	
-	st.session_state.df_Seabed = pd.DataFrame(Sdata, columns=['Seabed parameter','Value'])
+	state.df_Seabed = pd.DataFrame(Sdata, columns=['Seabed parameter','Value'])
 
-	st.session_state.Seabed_OK = True
+	state.Seabed_OK = True
 
-	return st.session_state.df_Seabed,st.session_state.Seabed_OK
+	return state.df_Seabed,state.Seabed_OK
 #
 #
 def custom_selectbox(label, options, disabled_options, cmnx):
@@ -0,0 +1,193 @@
+"""
+File: S4O_Sweep.py
+Description:
+Parametric sweep campaigns. A sweep varies Product, Seabed and Environment parameters of a model, either as a grid
+(all combinations of the values) or as a list (the n-th value of each parameter together). Each combination is a
+case with its own input files in the directory sweep/caseNNN of the model. The realisations of all cases are run in
+one rolling queue (S4O_Schedule_Runs), interleaved so that realisation 1 of all cases is run first, then
+realisation 2 and so on, and the statistics of each case are calculated separately. The result is a table with the
+parameter values and Mean+1StdDev of each case, written to sweep/sweep.csv.
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Sweep_Case_State, S4O_Write_Sweep_Input_Files, S4O_Run_Sweep; The number of DYNRES steps is kept per case and passed per run.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import itertools
+import os
+import numpy as np
+import pandas as pd
+from S4O_SIMLA import S4O_Write_Input_Files, S4O_Schedule_Runs
+
+#	Parameter tables that can be varied in a sweep, with the attribute holding the table in the model state
+S4O_SWEEP_TABLES = [('Product', 'df_Product'), ('Seabed', 'df_Seabed'), ('Environment', 'df_Environment')]
+
+#	Sweep modes
+S4O_SWEEP_MODES = ['Grid', 'List']
+
+class S4O_Sweep_Case_State:
+
+	#	Model parameters of one case of a sweep: copies of the parameter tables with the values of the case, and
+	#	all other attributes from the model state
+	def __init__(self, state, case):
+		self.__dict__['base'] = state
+		for table, attr in S4O_SWEEP_TABLES:
+			self.__dict__[attr] = getattr(state, attr).copy()
+		for key in case:
+			table, row = S4O_Sweep_Parameter(key)
+			self.__dict__[table].iloc[row,1] = case[key]
+
+	def __getattr__(self, name):
+		return getattr(self.base, name)
+
+	def __setattr__(self, name, value):
+		#	Values set during input generation (SIMLA_nstep_dynres) depend on the parameters of the case, and are
+		#	kept in the case, not in the model state
+		self.__dict__[name] = value
+
+	def __contains__(self, name):
+		return name in self.__dict__ or name in self.base
+#
+#
+
+def S4O_Sweep_Parameter(key):
+
+	#	Return the attribute of the parameter table and the row of the sweep parameter key, e.g. 'Environment:1'
+	name, row = key.split(':')
+	for table, attr in S4O_SWEEP_TABLES:
+		if table == name: return attr, int(row)
+
+	raise ValueError('Unknown sweep parameter : ' + key)
+#
+#
+
+def S4O_Sweep_Parameters(state):
+
+	#	Return a dictionary of the parameters that can be varied, keyed by 'Table:row', with the parameter names
+	parameters = {}
+	for table, attr in S4O_SWEEP_TABLES:
+		df = getattr(state, attr)
+		for row in range(df.shape[0]):
+			parameters[table + ':' + str(row)] = table + ' : ' + str(df.iloc[row,0]).rstrip(' :')
+
+	return parameters
+#
+#
+
+def S4O_Sweep_Cases(state, values, mode):
+
+	#	Expand the values of the sweep parameters (dictionary of lists, keyed by 'Table:row') into a list of cases,
+	#	each a dictionary of parameter values. mode is 'Grid' for all combinations of the values, or 'List' for the
+	#	n-th values of all parameters together, which requires the same number of values for all parameters.
+	#	The values are converted to the type (integer or float) of the parameter in state.
+	keys = list(values.keys())
+	converted = []
+	for key in keys:
+		attr, row = S4O_Sweep_Parameter(key)
+		if isinstance(getattr(state, attr).iloc[row,1], (int, np.integer)):
+			converted.append([int(value) for value in values[key]])
+		else:
+			converted.append([float(value) for value in values[key]])
+
+	if mode == 'Grid':
+		combinations = list(itertools.product(*converted))
+	else:
+		if len(set(len(column) for column in converted)) > 1:
+			raise ValueError('All sweep parameters must have the same number of values in a list sweep!')
+		combinations = list(zip(*converted))
+
+	return [dict(zip(keys, combination)) for combination in combinations]
+#
+#
+
+def S4O_Sweep_Case_Name(icase):
+
+	#	Return the name (and directory name) of case number icase (from 0)
+	return 'case' + '%03d' % (icase + 1)
+#
+#
+
+def S4O_Write_Sweep_Input_Files(state, sweep_path, cases):
+
+	#	Generate the input files for all realisations of the cases in the directories sweep_path/caseNNN. Return the
+	#	number of DYNRES steps of each case, which depends on the parameters of the case.
+	nrel = int(state.df_Execution.iloc[3,1])
+	if not os.path.exists(sweep_path): os.makedirs(sweep_path)
+	nsteps = []
+	for icase in range(len(cases)):
+		casestate = S4O_Sweep_Case_State(state, cases[icase])
+		S4O_Write_Input_Files(casestate, sweep_path + '/' + S4O_Sweep_Case_Name(icase), 1, nrel)
+		nsteps.append(casestate.SIMLA_nstep_dynres)
+
+	return nsteps
+#
+#
+
+def S4O_Sweep_Table(status, cases, parameters):
+
+	#	Return the consolidated results of the cases as a dataframe with the parameter values, the number of
+	#	realisations included in the statistics, and the Mean, StdDev and Mean+1StdDev of the absolute maximum
+	#	lateral displacement of each case. parameters holds the names of the parameters (S4O_Sweep_Parameters).
+	table = {'Case': [S4O_Sweep_Case_Name(icase) for icase in range(len(cases))]}
+	if len(cases) > 0:
+		for key in cases[0]:
+			table[parameters[key]] = [case[key] for case in cases]
+
+	table['Realisations'] = []
+	table['Mean [m]'] = []
+	table['StdDev [m]'] = []
+	table['Mean+1StdDev [m]'] = []
+	for icase in range(len(cases)):
+		stats = status['groupstats'][icase]
+		if len(stats.get('Realisation', [])) == 0:
+			table['Realisations'].append(0)
+			table['Mean [m]'].append(float('nan'))
+			table['StdDev [m]'].append(float('nan'))
+			table['Mean+1StdDev [m]'].append(float('nan'))
+		else:
+			table['Realisations'].append(len(stats['Realisation']))
+			table['Mean [m]'].append(stats['Mean'][-1])
+			table['StdDev [m]'].append(stats['StdDev'][-1])
+			table['Mean+1StdDev [m]'].append(stats['Mean+1StdDev'][-1])
+
+	return pd.DataFrame(table)
+#
+#
+
+def S4O_Run_Sweep(runcfg, sweep_path, cases, parameters, nrel, nsteps, report, cancel=None):
+
+	#	Run nrel realisations of each case in one rolling queue with S4O_Schedule_Runs, interleaving the cases, and
+	#	write the consolidated results (S4O_Sweep_Table) to sweep_path/sweep.csv. The input files must have been
+	#	generated (S4O_Write_Sweep_Input_Files), which gives the number of DYNRES steps of each case in nsteps.
+	#	report and cancel as for S4O_Schedule_Runs. Return the status, with the consolidated results in
+	#	status['sweep'].
+	runcfg = dict(runcfg)
+	runcfg['modelPath'] = sweep_path
+	runcfg['runPaths'] = {}
+	runcfg['runSteps'] = {}
+	runcfg['runGroups'] = [[] for case in cases]
+	runcfg['runGroupNames'] = [S4O_Sweep_Case_Name(icase) for icase in range(len(cases))]
+	irun = 0
+	for irel in range(1, nrel+1):
+		for icase in range(len(cases)):
+			irun += 1
+			runcfg['runPaths'][irun] = sweep_path + '/' + S4O_Sweep_Case_Name(icase) + '/r' + str(irel)
+			runcfg['runSteps'][irun] = nsteps[icase]
+			runcfg['runGroups'][icase].append(irun)
+
+	report(None, 'info', 'Running ' + str(nrel) + ' realisations of ' + str(len(cases)) + ' cases (' + str(irun) + ' SIMLA runs), ' +
+		   str(runcfg['maxRunsPB']) + ' at a time.')
+	status = S4O_Schedule_Runs(runcfg, 1, irun, report, cancel)
+
+	status['sweep'] = S4O_Sweep_Table(status, cases, parameters)
+	status['sweep'].to_csv(sweep_path + '/sweep.csv', index=False)
+	report(status, 'write', 'Sweep results written to : ' + sweep_path + '/sweep.csv')
+
+	return status
+#
+#
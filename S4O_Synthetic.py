@@ -0,0 +1,273 @@
+"""
+File: S4O_Synthetic.py
+Description:
+Synthetic stand-in for SIMLA and DYNPOST, for load testing and benchmarking the execution, postprocessing and plotting
+without a SIMLA installation or licence. It takes the same arguments as the programs and is started by SIMLA4OBS in
+their place when "Synthetic SIMLA" is ticked.
+
+The synthetic SIMLA reads the generated input file (s.sif), sleeps or keeps one CPU busy for the given run time while
+reporting the simulated time as SIMLA does, and writes the list file (s.slf) and a DYNPOST file (s.dyn) with
+nstep_dynres steps (-s2) of the six time series used by SIMLA4OBS (tsid 1-6, time in column 0). The time series are
+generated from a hash of the input file, so the same input always gives the same results and the realisations
+differ through their wave seeds. The s.dyn files are written in a synthetic layout (not RAF), read by
+S4O_Synthetic_Dyn with the same attributes as rafina Dyn objects.
+
+The synthetic DYNPOST writes the list files of DYNPOST MPF (s.sdo) and DYNPOST EXT (extremes.sdo). For MPF it writes
+the time series requested in s.sdi as plot files (.mpf, two columns of text), and for EXT the extreme values of the
+synthetic s.dyn files requested in extremes.sdi, one line per file (not in the layout of DYNPOST EXT). A DYNPOST file
+requested in extremes.sdi that does not exist is an error.
+
+Usage:
+python S4O_Synthetic.py {simla,dynpost} -n NAME [-s2 NSTEP] [--time SECONDS] [--load {Sleep,CPU}]
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Synthetic_DYNPOST; Writes the plot files of the DYNPLOT cards for DYNPOST MPF.
+2026-10-18: S4O_Synthetic_DYNPOST; Fails if a DYNPOST file requested in extremes.sdi does not exist, instead of skipping it.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import argparse
+import hashlib
+import os
+import shlex
+import sys
+import time
+import numpy as np
+from S4O_Progress import S4O_Read_End_Time
+
+#	Path of this module, started as the synthetic SIMLA and DYNPOST, and hashed instead of the SIMLA executable
+S4O_SYNTHETIC_PATH = os.path.abspath(__file__)
+
+#	Load options of the synthetic runs
+S4O_SYNTHETIC_LOADS = ['Sleep', 'CPU']
+
+#	First line of a synthetic DYNPOST file, followed by the DYNRES array in NumPy .npy format
+S4O_SYNTHETIC_MAGIC = b'S4O synthetic DYNPOST file\n'
+
+#	Names of the time series in the synthetic DYNPOST files (tsid 1-6)
+S4O_SYNTHETIC_SERIES = ['Seabed contact force y-dir', 'Seabed contact force z-dir', 'Hydrodynamic load y-dir',
+						'Hydrodynamic load z-dir', 'Displacement y-dir', 'Soil penetration z-dir']
+
+#	Number of simulated time reports during a synthetic run
+S4O_SYNTHETIC_REPORTS = 50
+
+class S4O_Synthetic_Dyn:
+
+	#	Synthetic DYNPOST file, with the attributes of rafina Dyn objects used by SIMLA4OBS
+	def __init__(self, dynfile):
+		with open(dynfile, 'rb') as f:
+			if f.read(len(S4O_SYNTHETIC_MAGIC)) != S4O_SYNTHETIC_MAGIC: raise TypeError(dynfile + ' is not a synthetic DYNPOST file')
+			self.dynres = np.load(f)
+		self.progname = 'DYNPOST/SIMLA'
+		self.timeseries_names = list(S4O_SYNTHETIC_SERIES)
+		self.nres = len(self.timeseries_names)
+		self.time = self.dynres[:,0]
+#
+#
+
+def S4O_Is_Synthetic_Dyn(dynfile):
+
+	#	Return True if dynfile is a DYNPOST file written by the synthetic SIMLA
+	with open(dynfile, 'rb') as f:
+		return f.read(len(S4O_SYNTHETIC_MAGIC)) == S4O_SYNTHETIC_MAGIC
+#
+#
+
+def S4O_Synthetic_Args(program, runtime, load):
+
+	#	Assign the argument list starting the synthetic program ('simla' or 'dynpost'), running for about runtime
+	#	seconds with the load 'Sleep' or 'CPU'. The program arguments are appended as for SIMLA and DYNPOST.
+	args = [sys.executable, S4O_SYNTHETIC_PATH, program, '--time', str(runtime), '--load', load]
+
+	return args
+#
+#
+
+def S4O_Synthetic_Seed(sifname):
+
+	#	Return a random seed calculated from the content of the input file
+	with open(sifname, 'rb') as f:
+		digest = hashlib.sha256(f.read()).hexdigest()
+
+	return int(digest[:16], 16)
+#
+#
+
+def S4O_Synthetic_Series(nstep, tend, seed):
+
+	#	Return the DYNRES array (nstep x 7, time in column 0) of the synthetic time series up to tend seconds: an
+	#	irregular sea of wave components ramped up over the first tenth of the time, and a lateral displacement
+	#	that drifts with an amplitude varying between the realisations
+	rng = np.random.default_rng(seed)
+	t = np.linspace(tend/nstep, tend, nstep)
+	ramp = np.clip(t/(0.1*tend), 0.0, 1.0)
+
+	ncomp = 30
+	omega = rng.uniform(2.0*np.pi/20.0, 2.0*np.pi/5.0, ncomp)
+	amp = rng.rayleigh(1.0, ncomp)
+	amp = amp/np.sqrt(np.sum(amp**2))
+	phase = rng.uniform(0.0, 2.0*np.pi, ncomp)
+	wave = np.zeros(nstep)
+	for icomp in range(ncomp): wave += amp[icomp]*np.sin(omega[icomp]*t + phase[icomp])
+	wave *= ramp
+
+	scale = rng.lognormal(np.log(0.5), 0.2)
+	drift = rng.normal(0.0, 1.0)
+	uy = scale*(0.2*wave + drift*t/tend)
+
+	dynres = np.empty((nstep, 7), dtype=np.float32)
+	dynres[:,0] = t
+	dynres[:,1] = -400.0*wave
+	dynres[:,2] = 350.0 + 50.0*wave
+	dynres[:,3] = 300.0*wave
+	dynres[:,4] = 100.0*wave
+	dynres[:,5] = uy
+	dynres[:,6] = 0.01 + 0.002*np.abs(wave)
+
+	return dynres
+#
+#
+
+def S4O_Synthetic_Work(seconds, load):
+
+	#	Sleep, or keep one CPU busy, for the given number of seconds
+	if load == 'CPU':
+		tend = time.time() + seconds
+		while time.time() < tend: np.sin(np.arange(100000.0))
+	else:
+		time.sleep(seconds)
+
+	return
+#
+#
+
+def S4O_Synthetic_Write_Dyn(dynfile, dynres):
+
+	#	Write the DYNRES array to a synthetic DYNPOST file
+	with open(dynfile, 'wb') as f:
+		f.write(S4O_SYNTHETIC_MAGIC)
+		np.save(f, dynres)
+
+	return
+#
+#
+
+def S4O_Synthetic_SIMLA(name, nstep, runtime, load):
+
+	#	Run the synthetic SIMLA analysis of the input file name.sif in the working directory. Return the exit status.
+	sifname = name + '.sif'
+	slfname = name + '.slf'
+	if not os.path.exists(sifname):
+		print('*** ERROR : Input file ' + sifname + ' does not exist!', flush=True)
+		with open(slfname, 'w') as slf: slf.write('SIMLA terminated with errors\n')
+		return 1
+
+	tend = S4O_Read_End_Time(sifname)
+	if tend <= 0.0: tend = 1.0
+	if nstep <= 0: nstep = 1000
+	seed = S4O_Synthetic_Seed(sifname)
+
+	#	The run time varies by +-25 % between the realisations
+	runtime = runtime*np.random.default_rng(seed).uniform(0.75, 1.25)
+
+	#	Report the simulated time in the print output and the list file as the analysis progresses
+	with open(slfname, 'w') as slf:
+		slf.write('SIMLA (synthetic stand-in) : ' + os.path.abspath(sifname) + '\n')
+		for ireport in range(1, S4O_SYNTHETIC_REPORTS+1):
+			S4O_Synthetic_Work(runtime/S4O_SYNTHETIC_REPORTS, load)
+			line = ' STEP %8i  TIME = %12.4E\n' % (int(nstep*ireport/S4O_SYNTHETIC_REPORTS), tend*ireport/S4O_SYNTHETIC_REPORTS)
+			print(line, end='', flush=True)
+			slf.write(line)
+			slf.flush()
+
+		S4O_Synthetic_Write_Dyn(name + '.dyn', S4O_Synthetic_Series(nstep, tend, seed))
+		slf.write('\n SIMLA successfully completed\n')
+
+	return 0
+#
+#
+
+def S4O_Synthetic_DYNPOST(name, runtime, load):
+
+	#	Run the synthetic DYNPOST with the input file name.sdi in the working directory. For plots (DYNPLOT cards) the
+	#	time series plotno of the DYNPOST file, scaled by yscale, is written to the plot file given on the card with
+	#	.mpf appended. For extreme values (MXPLOT cards) the maximum (type 1) or minimum (type -1) of time series
+	#	idynres of each DYNPOST file is written to the output file given on the card, with .txt appended, and the
+	#	run fails if one of the DYNPOST files does not exist. Return the exit status.
+	S4O_Synthetic_Work(runtime, load)
+
+	sdiname = name + '.sdi'
+	missing = []
+	if os.path.exists(sdiname):
+		plots = []
+		outputs = []
+		with open(sdiname, 'r') as sdi:
+			for line in sdi:
+				if line.startswith('#'): continue
+				columns = shlex.split(line)
+				if len(columns) >= 5 and columns[0] == 'DYNPLOT':
+					plots.append({'dyn': columns[1], 'mpf': columns[2], 'plotno': int(columns[3]), 'yscale': float(columns[4])})
+				elif len(columns) >= 8 and columns[0] == 'MXPLOT':
+					outputs.append({'type': int(columns[1]), 'idynres': int(columns[3]), 'out': columns[6], 'dyns': [columns[7]]})
+				elif len(columns) == 1 and len(outputs) > 0:
+					outputs[-1]['dyns'].append(columns[0])
+
+		for plot in plots:
+			#	File names are not case sensitive in DYNPOST (S for s.dyn)
+			dynfile = plot['dyn'] + '.dyn'
+			if not os.path.exists(dynfile): dynfile = plot['dyn'].lower() + '.dyn'
+			if not os.path.exists(dynfile) or not S4O_Is_Synthetic_Dyn(dynfile): continue
+			dyn = S4O_Synthetic_Dyn(dynfile)
+			np.savetxt(plot['mpf'] + '.mpf', np.column_stack((dyn.time, plot['yscale']*dyn.dynres[:,plot['plotno']])), fmt='%14.6E')
+
+		for output in outputs:
+			with open(output['out'] + '.txt', 'w') as out:
+				for dynname in output['dyns']:
+					dynfile = dynname + '.dyn'
+					if not os.path.exists(dynfile):
+						missing.append(dynfile)
+						continue
+					if not S4O_Is_Synthetic_Dyn(dynfile): continue
+					dyn = S4O_Synthetic_Dyn(dynfile)
+					series = dyn.dynres[:,output['idynres']]
+					ndx = np.argmax(series) if output['type'] > 0 else np.argmin(series)
+					out.write('%s %14.6E %14.6E\n' % (dynname, series[ndx], dyn.time[ndx]))
+
+	with open(name + '.sdo', 'w') as sdo:
+		sdo.write('DYNPOST (synthetic stand-in) : ' + os.path.abspath(sdiname) + '\n')
+		for dynfile in missing:
+			print('*** ERROR : DYNPOST file ' + dynfile + ' does not exist!', flush=True)
+			sdo.write(' *** ERROR : DYNPOST file ' + dynfile + ' does not exist!\n')
+		if len(missing) > 0:
+			sdo.write('\n DYNPOST terminated with errors\n')
+			return 1
+		sdo.write('\n DYNPOST successfully completed\n')
+
+	return 0
+#
+#
+
+def S4O_Synthetic(argv=None):
+
+	#	Parse the command line arguments
+	parser = argparse.ArgumentParser(prog='S4O_Synthetic', description='Synthetic stand-in for SIMLA and DYNPOST.')
+	parser.add_argument('program', choices=['simla', 'dynpost'], help='program to stand in for')
+	parser.add_argument('-n', dest='name', required=True, help='name of the input file, without extension')
+	parser.add_argument('-s2', dest='nstep', type=int, default=0, help='number of steps in the DYNPOST file (SIMLA)')
+	parser.add_argument('--time', type=float, default=20.0, help='run time [s] (default: 20)')
+	parser.add_argument('--load', default='Sleep', choices=S4O_SYNTHETIC_LOADS, help='sleep or keep one CPU busy (default: Sleep)')
+	args = parser.parse_args(argv)
+
+	if args.program == 'simla': return S4O_Synthetic_SIMLA(args.name, args.nstep, args.time, args.load)
+
+	return S4O_Synthetic_DYNPOST(args.name, args.time, args.load)
+#
+#
+
+if __name__ == '__main__':
+	sys.exit(S4O_Synthetic())
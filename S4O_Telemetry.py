@@ -0,0 +1,180 @@
+"""
+File: S4O_Telemetry.py
+Description:
+Resource telemetry of the SIMLA runs. For each attempt of a run, the start and end times, CPU user and system time,
+peak memory (resident set size), bytes written to the run directory, exit code, host and simulated time are recorded
+in the run manifest of the model (manifest.jsonl in the model directory, one JSON record per line). The CPU time and
+memory of local runs are sampled from the process tree of the run while it is running; they are not available for
+runs on distributed workers. The summary of an execution gives the data to size the hardware and choose the number
+of concurrent runs, including the throughput in simulated seconds per wall-clock second.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import json
+import os
+import time
+import pandas as pd
+import psutil
+
+#	Name of the run manifest in the model directory
+S4O_MANIFEST_FILE = 'manifest.jsonl'
+
+class S4O_Run_Telemetry:
+
+	#	Telemetry of the runs of one execution, appended to the manifest in the directory model_path
+	def __init__(self, model_path):
+		self.manifest = os.path.join(model_path, S4O_MANIFEST_FILE)
+		self.execution = time.time()
+		self.runs = {}
+
+	def start(self, irun, pid):
+		#	Start recording an attempt of run irun, running as process pid on this computer (None if remote)
+		self.runs[irun] = {'started': time.time(), 'pid': pid, 'cpu': {}, 'peak_rss': 0}
+
+	def sample(self, irun):
+		#	Sample the CPU times and memory of the process tree of run irun. The CPU times are kept per process, so
+		#	the times of child processes that have finished are included.
+		run = self.runs.get(irun)
+		if run is None or run['pid'] is None: return
+		try:
+			proc = psutil.Process(run['pid'])
+			procs = [proc] + proc.children(recursive=True)
+		except psutil.Error:
+			return
+		rss = 0
+		for proc in procs:
+			try:
+				with proc.oneshot():
+					cpu = proc.cpu_times()
+					mem = proc.memory_info()
+			except psutil.Error:
+				continue
+			run['cpu'][proc.pid] = (cpu.user, cpu.system)
+			rss += getattr(mem, 'peak_wset', mem.rss)
+		run['peak_rss'] = max(run['peak_rss'], rss)
+
+	def finish(self, irun, run_path, state, exitcode, host, simulated, attempt):
+		#	Record the attempt of run irun as finished with state ('done', 'retried', 'failed', 'cancelled' or
+		#	'cached') and append it to the manifest. Return the record.
+		run = self.runs.pop(irun, {'started': time.time(), 'pid': None, 'cpu': {}, 'peak_rss': 0})
+		finished = time.time()
+		record = {'execution': self.execution, 'run': irun, 'attempt': attempt, 'state': state, 'host': host,
+				  'started': run['started'], 'finished': finished, 'wall': finished - run['started'], 'exitcode': exitcode,
+				  'simulated': simulated, 'bytes_written': S4O_Bytes_Written(run_path, run['started'])}
+		if run['pid'] is not None:
+			record['cpu_user'] = sum(cpu[0] for cpu in run['cpu'].values())
+			record['cpu_system'] = sum(cpu[1] for cpu in run['cpu'].values())
+			record['peak_rss'] = run['peak_rss']
+		else:
+			record['cpu_user'] = None
+			record['cpu_system'] = None
+			record['peak_rss'] = None
+		try:
+			with open(self.manifest, 'a') as f:
+				f.write(json.dumps(record) + '\n')
+		except OSError:
+			pass
+
+		return record
+#
+#
+
+def S4O_Bytes_Written(run_path, started):
+
+	#	Return the total size of the files in run_path written since the time started
+	nbytes = 0
+	if not os.path.isdir(run_path): return nbytes
+	for entry in os.scandir(run_path):
+		try:
+			if entry.is_file() and entry.stat().st_mtime >= started - 1.0: nbytes += entry.stat().st_size
+		except OSError:
+			pass
+
+	return nbytes
+#
+#
+
+def S4O_Read_Manifest(model_path):
+
+	#	Return the records of the run manifest in model_path, for the last execution only
+	fname = os.path.join(model_path, S4O_MANIFEST_FILE)
+	if not os.path.exists(fname): return []
+
+	records = []
+	with open(fname, 'r') as f:
+		for line in f:
+			try:
+				records.append(json.loads(line))
+			except ValueError:
+				pass
+	if len(records) == 0: return records
+	execution = max(record['execution'] for record in records)
+
+	return [record for record in records if record['execution'] == execution]
+#
+#
+
+def S4O_Manifest_Summary(records):
+
+	#	Return the summary of the run records of an execution as a list of [description, value] rows
+	summary = []
+	if len(records) == 0: return summary
+
+	done = [record for record in records if record['state'] == 'done']
+	sampled = [record for record in done if record['cpu_user'] is not None]
+	started = min(record['started'] for record in records)
+	finished = max(record['finished'] for record in records)
+	elapsed = max(finished - started, 1.0e-6)
+	mean = lambda values: sum(values)/len(values) if len(values) > 0 else 0.0
+
+	summary.append(['Execution started :', time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started))])
+	summary.append(['Wall-clock time of the execution [s] :', '%.1f' % elapsed])
+	summary.append(['Runs finished / failed attempts / cancelled / from cache :', '%i / %i / %i / %i' %
+					(len(done), len([record for record in records if record['state'] in ['failed', 'retried']]),
+					 len([record for record in records if record['state'] == 'cancelled']), len([record for record in records if record['state'] == 'cached']))])
+	summary.append(['Hosts :', ', '.join(sorted(set(record['host'] for record in records if record['host'] != '')))])
+	if len(done) > 0:
+		summary.append(['Wall-clock time per run, mean / max [s] :', '%.1f / %.1f' % (mean([record['wall'] for record in done]), max(record['wall'] for record in done))])
+	if len(sampled) > 0:
+		cputimes = [record['cpu_user'] + record['cpu_system'] for record in sampled]
+		summary.append(['CPU time per run, user / system [s] :', '%.1f / %.1f' % (mean([record['cpu_user'] for record in sampled]), mean([record['cpu_system'] for record in sampled]))])
+		summary.append(['CPU utilisation per run [%] :', '%.0f' % (100.0*mean([cputimes[i]/max(sampled[i]['wall'], 1.0e-6) for i in range(len(sampled))]))])
+		summary.append(['Peak memory per run, mean / max [MB] :', '%.1f / %.1f' % (mean([record['peak_rss'] for record in sampled])/1.0e6, max(record['peak_rss'] for record in sampled)/1.0e6)])
+	if len(done) > 0:
+		summary.append(['Written per run, mean [MB] / total [GB] :', '%.1f / %.3f' % (mean([record['bytes_written'] for record in done])/1.0e6, sum(record['bytes_written'] for record in records)/1.0e9)])
+		simulated = sum(record['simulated'] for record in done)
+		summary.append(['Throughput [simulated s per wall-clock s] :', '%.2f' % (simulated/elapsed)])
+		summary.append(['Speed per run [simulated s per wall-clock s] :', '%.2f' % mean([record['simulated']/max(record['wall'], 1.0e-6) for record in done])])
+		summary.append(['Runs per hour :', '%.1f' % (3600.0*len(done)/elapsed)])
+
+	return summary
+#
+#
+
+def S4O_Manifest_Table(records):
+
+	#	Return the run records of an execution as a dataframe with one row per attempt
+	megabytes = lambda nbytes: None if nbytes is None else nbytes/1.0e6
+	table = pd.DataFrame({'Run': [record['run'] for record in records],
+						  'Attempt': [record['attempt'] for record in records],
+						  'State': [record['state'] for record in records],
+						  'Host': [record['host'] for record in records],
+						  'Started': [time.strftime('%H:%M:%S', time.localtime(record['started'])) for record in records],
+						  'Wall-clock [s]': [record['wall'] for record in records],
+						  'CPU user [s]': [record['cpu_user'] for record in records],
+						  'CPU system [s]': [record['cpu_system'] for record in records],
+						  'Peak memory [MB]': [megabytes(record['peak_rss']) for record in records],
+						  'Written [MB]': [megabytes(record['bytes_written']) for record in records],
+						  'Exit code': [record['exitcode'] for record in records],
+						  'Simulated [s]': [record['simulated'] for record in records]})
+
+	return table
+#
+#
@@ -7,11 +7,25 @@ Revisions:
 2025-09-05: Updated SIMLA4OBS version number to "1.1 / 2025".
 2025-09-22: Made the "Static configuration + Wave load ramping time" part of the time series optional.
 2025-09-23: Updated SIMLA4OBS version number to "1.2 / 2025".
+2026-10-18: Assign SIMLA_EXE and DYNPOST_EXE through S4O_Executable_Path to support Linux servers.
+2026-10-18: Added defaults for distributing the runs to workers (DistributedRuns, DistributedPort, DistributedKey, LocalWorkers).
+2026-10-18: Added defaults for the adaptive number of concurrent runs (AdaptiveRuns, minRunsPB).
+2026-10-18: Added defaults for the placement, priority and memory limit of the runs (PinRuns, RunNice, RunIONice, RunMemoryMaxGB).
+2026-10-18: Removed simlaProgressDelta, as the progress is calculated from the simulated time of the runs.
+2026-10-18: Added defaults for the time limits and retries of the runs (RunTimeoutMin, StallTimeoutMin, RunRetries).
+2026-10-18: Stores the results of the analyses run in the background (S4O_Engine) when finished. Removed simlaProgressBar.
+2026-10-18: Added the job queue database default (QueueDB), and continues the job queue left with queued or running models.
+2026-10-18: Added defaults for the parametric sweep (SweepParameters, SweepValues, SweepMode).
+2026-10-18: Added defaults for the synthetic SIMLA runs (SyntheticRuns, SyntheticRunTime, SyntheticLoad).
+2026-10-18: Added defaults for the minimum stable submerged mass search (MassSearchMin, MassSearchMax, MassSearchTol, MassSearchCandidates).
+2026-10-18: Added default for running DYNPOST MPF after each SIMLA run (RunDYNPOSTMPF).
+2026-10-18: Added defaults for the retention policy of the output files (RetentionPolicy, RetentionMinMB).
+2026-10-18: Added defaults for running in local scratch directories (ScratchRuns, ScratchDir).
 """
 __author__ = "Egil Giertsen"
 __credits__ = ["Terje Rølvåg"]
 __license__ = "GPLv3"
-__version__ = "2025-09-23"
+__version__ = "2026-10-18"
 __maintainer__ = "Egil Giertsen"
 __email__ = "Egil.Giertsen@sintef.no"
 
@@ -19,6 +33,7 @@ import sys
 import streamlit as st
 import multiprocessing as mp
 import os
+import secrets
 from rafina import pyraf as pr
 import pandas as pd
 from PIL import Image
@@ -28,6 +43,9 @@ from S4O_Seabed import *
 from S4O_Environment import *
 from S4O_Execution import *
 from S4O_Results import *
+from S4O_Launcher import S4O_Executable_Path
+from S4O_Queue import S4O_QUEUE_DB, S4O_Queue_Pending, S4O_Queue_Start
+from S4O_Scratch import S4O_SCRATCH_DIR
 
 #
 #	SIMLA4OBS main dashboard
@@ -83,9 +101,9 @@ def main():
 		curpath = os.environ.get('PATH')
 		newdir = st.session_state.SIMLA_HOME + '/jre/jre/bin/server'
 		os.environ['PATH'] = newdir + os.pathsep + curpath
-		#	Assign paths to simla.exe and dynpost.exe
-		st.session_state.SIMLA_EXE = st.session_state.SIMLA_HOME + '/bin/simla.exe'		
-		st.session_state.DYNPOST_EXE = st.session_state.SIMLA_HOME + '/bin/dynpost.exe'
+		#	Assign paths to simla(.exe) and dynpost(.exe)
+		st.session_state.SIMLA_EXE = S4O_Executable_Path(st.session_state.SIMLA_HOME, 'simla')
+		st.session_state.DYNPOST_EXE = S4O_Executable_Path(st.session_state.SIMLA_HOME, 'dynpost')
 
 	#	Assign nstep_dynres as global parameter
 	if 'SIMLA_nstep_dynres' not in st.session_state:
@@ -100,28 +118,75 @@ def main():
 		st.session_state.CPU_count = mp.cpu_count()
 	if 'maxRunsPB' not in st.session_state:
 		st.session_state.maxRunsPB = int(st.session_state.CPU_count/2)
-	if 'noBlocksToRun' not in st.session_state:
-		st.session_state.noBlocksToRun = 0
+	if 'AdaptiveRuns' not in st.session_state:
+		st.session_state.AdaptiveRuns = False
+		st.session_state.minRunsPB = 1
+	if 'PinRuns' not in st.session_state:
+		st.session_state.PinRuns = False
+		st.session_state.RunNice = 0
+		st.session_state.RunIONice = 0
+		st.session_state.RunMemoryMaxGB = 0.0
 	if 'currentRunCount' not in st.session_state:
 		st.session_state.currentRunCount = 0
+	if 'noRunsExecuted' not in st.session_state:
+		st.session_state.noRunsExecuted = 0
 	if 'noRunsPostprocessed' not in st.session_state:
 		st.session_state.noRunsPostprocessed = 0
 	if 'stdtolRunNumber' not in st.session_state:
 		st.session_state.stdtolRunNumber = 0
 	if 'listOfSeedNumbers' not in st.session_state:
 		st.session_state.listOfSeedNumbers = []
-	if 'simlaProgressBar' not in st.session_state:
-		st.session_state.simlaProgressBar = ''
 	if 'simlaProgressCurr' not in st.session_state:
 		st.session_state.simlaProgressCurr = 0
-	if 'simlaProgressDelta' not in st.session_state:
-		st.session_state.simlaProgressDelta = 0
 
 	#	Initialize run type and extended print switch
 	if 'SimulateRuns' not in st.session_state:
 		st.session_state.SimulateRuns = False
+	if 'SyntheticRuns' not in st.session_state:
+		st.session_state.SyntheticRuns = False
+		st.session_state.SyntheticRunTime = 20.0
+		st.session_state.SyntheticLoad = 'Sleep'
+	if 'RunDYNPOSTMPF' not in st.session_state:
+		st.session_state.RunDYNPOSTMPF = True
 	if 'ExtendedPrint' not in st.session_state:
 		st.session_state.ExtendedPrint = False
+	if 'ResumeRuns' not in st.session_state:
+		st.session_state.ResumeRuns = False
+	if 'UseResultCache' not in st.session_state:
+		st.session_state.UseResultCache = False
+		st.session_state.ResultCacheDir = os.path.expanduser('~') + '/.simla4obs/cache'
+		st.session_state.ResultCacheMaxGB = 20.0
+	if 'ScratchRuns' not in st.session_state:
+		st.session_state.ScratchRuns = False
+		st.session_state.ScratchDir = S4O_SCRATCH_DIR
+	if 'RetentionPolicy' not in st.session_state:
+		st.session_state.RetentionPolicy = 'Keep all'
+		st.session_state.RetentionMinMB = 1.0
+	if 'KillOnConvergence' not in st.session_state:
+		st.session_state.KillOnConvergence = False
+	if 'RunRetries' not in st.session_state:
+		st.session_state.RunTimeoutMin = 0.0
+		st.session_state.StallTimeoutMin = 0.0
+		st.session_state.RunRetries = 1
+	if 'QueueDB' not in st.session_state:
+		st.session_state.QueueDB = S4O_QUEUE_DB
+
+		#	Continue the job queue if models were left queued or running, e.g. after a crash
+		if S4O_Queue_Pending(st.session_state.QueueDB): S4O_Queue_Start(st.session_state.QueueDB, st.session_state.SIMLA_HOME)
+	if 'SweepParameters' not in st.session_state:
+		st.session_state.SweepParameters = []
+		st.session_state.SweepValues = {}
+		st.session_state.SweepMode = 'Grid'
+	if 'MassSearchMin' not in st.session_state:
+		st.session_state.MassSearchMin = 10.0
+		st.session_state.MassSearchMax = 200.0
+		st.session_state.MassSearchTol = 2.0
+		st.session_state.MassSearchCandidates = 3
+	if 'DistributedRuns' not in st.session_state:
+		st.session_state.DistributedRuns = False
+		st.session_state.DistributedPort = 50505
+		st.session_state.DistributedKey = secrets.token_hex(8)
+		st.session_state.LocalWorkers = 0
 
 	#	Initialize analysis and result check boxes
 	if 'GenerateInputs' not in st.session_state:
@@ -170,6 +235,9 @@ def main():
 	if 'df_Results' not in st.session_state:
 		st.session_state.df_Results = pd.DataFrame()
 
+	#	Store the results of the analyses of the model if they have finished in the background
+	S4O_Store_Execution_Results()
+
 	# Initiate the SIMLA4OBS dashboard layout
 	st.set_page_config(layout='wide')
 
@@ -0,0 +1,64 @@
+"""
+File: test_S4O_MakeSIMLAInput.py
+Description:
+Tests of the generation of the SIMLA input files from the model specification (S4O_MakeSIMLAInput, S4O_ModelSpec).
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_Batch import S4O_Batch_Initial_State
+from S4O_ModelSpec import S4O_Model_Spec_From_State
+from S4O_MakeSIMLAInput import S4O_SEED_PLACEHOLDER, S4O_Make_SIMLA_Template, S4O_Make_SIMLA_Input_Files
+
+def S4O_Test_Spec():
+
+	#	Return the model specification of a model with default parameters and three realisations
+	state = S4O_Batch_Initial_State('')
+	state.listOfSeedNumbers = [101, 202, 303]
+
+	return S4O_Model_Spec_From_State(state)
+#
+#
+
+def test_input_files_from_spec_and_realisation():
+
+	#	The input files of a realisation have the wave seed of the realisation in the specification, and the
+	#	realisations differ only in the wave seed
+	spec = S4O_Test_Spec()
+	files = [S4O_Make_SIMLA_Input_Files(spec, irun) for irun in [1, 2, 3]]
+
+	assert sorted(files[0]) == ['s.sdi', 's.sif', 'seabed.txt']
+	assert ' 202 ' in files[1]['s.sif']
+	assert str(S4O_SEED_PLACEHOLDER) not in files[1]['s.sif']
+	assert files[1]['s.sif'].replace(' 202 ', ' 303 ') == files[2]['s.sif']
+	assert files[1]['seabed.txt'] == files[2]['seabed.txt']
+	assert S4O_Make_SIMLA_Input_Files(spec, 2, S4O_Make_SIMLA_Template(spec)) == files[1]
+#
+#
+
+def test_input_files_in_worker_process():
+
+	#	The specification can be pickled, and the input files made in a worker process are the same as those made
+	#	in this process
+	spec = S4O_Test_Spec()
+	assert pickle.loads(pickle.dumps(spec)) == spec
+
+	with ProcessPoolExecutor(max_workers=1) as pool:
+		files = pool.submit(S4O_Make_SIMLA_Input_Files, spec, 3).result()
+
+	assert files == S4O_Make_SIMLA_Input_Files(spec, 3)
+#
+#
@@ -0,0 +1,118 @@
+"""
+File: test_S4O_Mass_Search.py
+Description:
+Tests of the minimum stable submerged mass search (S4O_Mass_Search), run with the synthetic SIMLA (S4O_Synthetic).
+Revisions:
+2026-10-18: First version.
+2026-10-18: Added a test of a search where the runs of the candidates fail.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import math
+import os
+import sys
+import threading
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_Batch import S4O_Batch_Initial_State
+from S4O_SIMLA import S4O_Assign_Run_Config
+import S4O_Mass_Search
+from S4O_Mass_Search import S4O_Run_Mass_Search
+
+def S4O_Test_State(model_dir, nrel, sdtol, odfac):
+
+	#	Return the state of a model with default parameters in model_dir, run with the synthetic SIMLA two runs at
+	#	a time, with nrel realisations, the maximum change in standard deviation sdtol [%] and the design value
+	#	odfac times the outer diameter
+	state = S4O_Batch_Initial_State('')
+	state.modelFileDir = str(model_dir)
+	state.modelFileName = 'm'
+	state.modelFilePath = str(model_dir) + '/m.s4o'
+	state.listOfSeedNumbers = [11*(irel + 1) for irel in range(nrel)]
+	state.df_Execution.iloc[1,1] = 0.01
+	state.df_Execution.iloc[3,1] = nrel
+	state.df_Execution.iloc[4,1] = sdtol
+	state.df_Execution.iloc[5,1] = odfac
+	state.maxRunsPB = 2
+	state.SyntheticRuns = True
+	state.SyntheticRunTime = 0.05
+	state.RunDYNPOSTMPF = False
+
+	return state
+#
+#
+
+def test_mass_search_with_convergence(tmp_path):
+
+	#	With a non-zero maximum change in standard deviation, the queued runs of the candidates are cancelled when
+	#	their statistics converge. The search must not take this as a user cancellation and stop without a result.
+	#	All candidates are stable with the large design value, so the search ends after the first round with the
+	#	lowest mass.
+	state = S4O_Test_State(tmp_path, 8, 5.0, 1000.0)
+	runcfg = S4O_Assign_Run_Config(state)
+	messages = []
+	report = lambda status, level, text: messages.append((level, text))
+
+	status = S4O_Run_Mass_Search(state, runcfg, str(tmp_path) + '/masssearch', 100.0, 200.0, 10.0, 2, 8, report, threading.Event())
+
+	assert len(status['cancelled']) > 0
+	assert status['mass'] == 100.0
+	assert len(status['search']) == 2
+	assert list(status['search']['Stable']) == ['Yes', 'Yes']
+	assert os.path.exists(str(tmp_path) + '/masssearch/search.csv')
+	assert any(text.startswith('Minimum stable submerged mass : 100.00') for level, text in messages)
+#
+#
+
+def test_mass_search_cancelled(tmp_path):
+
+	#	A search cancelled by the user stops without a result
+	state = S4O_Test_State(tmp_path, 4, 0.0, 1000.0)
+	runcfg = S4O_Assign_Run_Config(state)
+	cancel = threading.Event()
+	cancel.set()
+
+	status = S4O_Run_Mass_Search(state, runcfg, str(tmp_path) + '/masssearch', 100.0, 200.0, 10.0, 2, 4, lambda status, level, text: None, cancel)
+
+	assert status['mass'] is None
+	assert len(status['search']) == 0
+#
+#
+
+def test_mass_search_failed_runs(tmp_path, monkeypatch):
+
+	#	When all the runs of the candidates of a round fail, the bracket is not narrowed and the next round would run
+	#	the same candidates again. The search must stop with an error and without a result. The sweep returns a
+	#	stable highest and an unstable lowest mass in the first round, and no results in the following rounds.
+	state = S4O_Test_State(tmp_path, 2, 0.0, 1.0)
+	runcfg = S4O_Assign_Run_Config(state)
+	design = S4O_Mass_Search.S4O_Design_Value(state)
+	rounds = []
+	def sweep(runcfg, round_path, cases, parameters, nrel, nsteps, report, cancel):
+		rounds.append(round_path)
+		assert len(rounds) <= 3
+		masses = [case[S4O_Mass_Search.S4O_MASS_PARAMETER] for case in cases]
+		values = [2.0*design, 0.5*design] if len(rounds) == 1 else [math.nan]*len(cases)
+		return {'sweep': pd.DataFrame({'Submerged mass [kg/m]': masses, 'Realisations': [nrel]*len(cases), 'Mean+1StdDev [m]': values}),
+				'cancelled': []}
+	monkeypatch.setattr(S4O_Mass_Search, 'S4O_Run_Sweep', sweep)
+	messages = []
+	report = lambda status, level, text: messages.append((level, text))
+
+	status = S4O_Run_Mass_Search(state, runcfg, str(tmp_path) + '/masssearch', 100.0, 200.0, 10.0, 2, 2, report, threading.Event())
+
+	assert len(rounds) == 2
+	assert status['mass'] is None
+	assert len(status['search']) == 4
+	assert list(status['search']['Stable']) == ['No', 'Yes', '', '']
+	assert any(level == 'error' and text.startswith('Round 2 : No results') for level, text in messages)
+	assert not any(text.startswith('Minimum stable submerged mass :') for level, text in messages)
+#
+#
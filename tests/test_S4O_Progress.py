@@ -0,0 +1,71 @@
+"""
+File: test_S4O_Progress.py
+Description:
+Tests of the progress of the SIMLA runs (S4O_Progress), read from the output of the synthetic SIMLA (S4O_Synthetic).
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_Progress import S4O_ELAPSED_FRACTION_MAX, S4O_Read_End_Time, S4O_Read_Simulated_Time, S4O_Run_Fraction, S4O_Elapsed_Fraction
+from S4O_Synthetic import S4O_Synthetic_SIMLA
+
+def S4O_Test_Write(fname, text):
+
+	#	Write text to the file fname
+	with open(fname, 'w') as f:
+		f.write(text)
+
+	return
+#
+#
+
+def test_simulated_time_synthetic_output(tmp_path, monkeypatch):
+
+	#	The simulated time is read from the list file written by the synthetic SIMLA, and gives the whole run when
+	#	it has finished
+	S4O_Test_Write(str(tmp_path) + '/s.sif', 'HEAD Model\nTIMECO 10.0 0.1\nTIMECO 360.0 0.1\n')
+	monkeypatch.chdir(tmp_path)
+	assert S4O_Synthetic_SIMLA('s', 100, 0.0, 'Sleep') == 0
+
+	assert S4O_Read_End_Time(str(tmp_path) + '/s.sif') == 360.0
+	assert S4O_Read_Simulated_Time(str(tmp_path)) == 360.0
+	assert S4O_Run_Fraction(str(tmp_path), 360.0) == 1.0
+#
+#
+
+def test_simulated_time_partial_output(tmp_path):
+
+	#	The last simulated time of a run in progress is used, also with Fortran double precision exponents, and the
+	#	print output is searched before the list file
+	S4O_Test_Write(str(tmp_path) + '/s.slf', ' STEP        5  TIME =   1.0000E+01\n STEP       10  TIME =   2.0000E+01\n')
+	assert S4O_Read_Simulated_Time(str(tmp_path)) == 20.0
+	assert S4O_Run_Fraction(str(tmp_path), 80.0) == 0.25
+
+	S4O_Test_Write(str(tmp_path) + '/simla_print.out', ' Time: 0.3D+02\n')
+	assert S4O_Read_Simulated_Time(str(tmp_path)) == 30.0
+#
+#
+
+def test_elapsed_fraction(tmp_path):
+
+	#	Without simulated time in the output, the fraction of the run is 0.0, and the progress is estimated from the
+	#	elapsed wall-clock time relative to the runs finished, without reaching the end of the run
+	S4O_Test_Write(str(tmp_path) + '/simla_print.out', ' Reading input file s.sif\n')
+	assert S4O_Run_Fraction(str(tmp_path), 360.0) == 0.0
+
+	assert S4O_Elapsed_Fraction(10.0, []) == 0.0
+	assert S4O_Elapsed_Fraction(10.0, [30.0, 50.0]) == 0.25
+	assert S4O_Elapsed_Fraction(100.0, [30.0, 50.0]) == S4O_ELAPSED_FRACTION_MAX
+#
+#
@@ -0,0 +1,61 @@
+"""
+File: test_S4O_Queue.py
+Description:
+Tests of the durable job queue of models (S4O_Queue).
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import socket
+import sys
+from contextlib import closing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_Queue import S4O_Queue_Connect, S4O_Queue_Add, S4O_Queue_Claim, S4O_Queue_Finish, S4O_Queue_Journal, S4O_Queue_Models
+
+def test_claim_in_queue_order(tmp_path):
+
+	#	The models are claimed in the order they were queued, each only once, and a model running in a live process
+	#	is not claimed again
+	db = str(tmp_path) + '/queue.db'
+	first = S4O_Queue_Add(db, '/models/a.s4o', {})
+	second = S4O_Queue_Add(db, '/models/b.s4o', {})
+
+	assert S4O_Queue_Claim(db)['id'] == first
+	assert S4O_Queue_Claim(db)['id'] == second
+	assert S4O_Queue_Claim(db) is None
+
+	S4O_Queue_Finish(db, first, 'done', '')
+	assert [model['state'] for model in S4O_Queue_Models(db)] == ['done', 'running']
+#
+#
+
+def test_claim_recovers_crashed_model(tmp_path):
+
+	#	A model left running by a process that has stopped is claimed again before the queued models, with the
+	#	runs journaled before the crash kept
+	db = str(tmp_path) + '/queue.db'
+	crashed = S4O_Queue_Add(db, '/models/a.s4o', {})
+	S4O_Queue_Add(db, '/models/b.s4o', {})
+	S4O_Queue_Claim(db)
+	runs = {1: {'state': 'done', 'started': 1.0, 'finished': 2.0, 'host': 'h', 'attempts': 0, 'message': ''}}
+	S4O_Queue_Journal(db, crashed, runs, 1)
+
+	#	Owner process that does not exist
+	with closing(S4O_Queue_Connect(db)) as conn:
+		conn.execute('UPDATE models SET owner = ? WHERE id = ?', (socket.gethostname() + ':999999999', crashed))
+
+	model = S4O_Queue_Claim(db)
+	assert model['id'] == crashed
+	assert model['started'] > 0.0
+	assert S4O_Queue_Models(db)[0]['ndone'] == 1
+#
+#
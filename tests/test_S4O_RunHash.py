@@ -0,0 +1,63 @@
+"""
+File: test_S4O_RunHash.py
+Description:
+Tests of the input hashes of the SIMLA runs (S4O_RunHash), used by "Resume" and the result cache.
+Revisions:
+2026-10-18: First version.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_RunHash import S4O_Executable_Identity, S4O_Hash_Run_Inputs
+
+def S4O_Test_Write(fname, text):
+
+	#	Write text to the file fname
+	with open(fname, 'w') as f:
+		f.write(text)
+
+	return
+#
+#
+
+def test_executable_identity(tmp_path):
+
+	#	The identity of an executable follows its content, also when it is replaced in place, and is empty for an
+	#	executable that does not exist
+	exe = str(tmp_path) + '/simla'
+	S4O_Test_Write(exe, 'version 1')
+	identity = S4O_Executable_Identity(exe)
+	assert identity == S4O_Executable_Identity(exe)
+
+	S4O_Test_Write(exe, 'version 2 ')
+	assert S4O_Executable_Identity(exe) != identity
+	assert S4O_Executable_Identity(str(tmp_path) + '/missing') == ''
+#
+#
+
+def test_run_hash(tmp_path):
+
+	#	The run hash changes with the input files and the executable identity, but not with the title and comments
+	#	of the SIMLA input file
+	S4O_Test_Write(str(tmp_path) + '/s.sif', 'HEAD Model A\n# comment\nTIMECO 10.0\n')
+	S4O_Test_Write(str(tmp_path) + '/seabed.txt', '1 2 3\n')
+	runhash = S4O_Hash_Run_Inputs(str(tmp_path), ['simla', 'a'])
+
+	assert S4O_Hash_Run_Inputs(str(tmp_path), ['simla', 'b']) != runhash
+
+	S4O_Test_Write(str(tmp_path) + '/s.sif', 'HEAD Model B\n# other comment\nTIMECO 10.0\n')
+	assert S4O_Hash_Run_Inputs(str(tmp_path), ['simla', 'a']) == runhash
+
+	S4O_Test_Write(str(tmp_path) + '/seabed.txt', '1 2 4\n')
+	assert S4O_Hash_Run_Inputs(str(tmp_path), ['simla', 'a']) != runhash
+#
+#
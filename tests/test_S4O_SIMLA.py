@@ -0,0 +1,258 @@
+"""
+File: test_S4O_SIMLA.py
+Description:
+Tests of the execution of the SIMLA runs of a model (S4O_SIMLA), run with the synthetic SIMLA and DYNPOST (S4O_Synthetic).
+Revisions:
+2026-10-18: First version.
+2026-10-18: S4O_Test_Run; Added tests of the rolling queue, the cancelling of runs on convergence, "Resume", and the scratch directories with the retention policy.
+2026-10-18: Added tests of the number of DYNRES steps of runs with input files generated earlier.
+2026-10-18: Added a test of the progress of runs without simulated time in their output.
+"""
+__author__ = "Egil Giertsen"
+__credits__ = [""]
+__license__ = "GPLv3"
+__version__ = "2026-10-18"
+__maintainer__ = "Egil Giertsen"
+__email__ = "Egil.Giertsen@sintef.no"
+
+import os
+import glob
+import S4O_SIMLA
+import shlex
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from S4O_Batch import S4O_Batch_Initial_State
+from S4O_SIMLA import S4O_Write_Input_Files, S4O_Assign_Run_Steps, S4O_Assign_Run_Config, S4O_Schedule_Runs, S4O_SIMLA_Run_Hash
+from S4O_Synthetic import S4O_Synthetic_Write_Dyn, S4O_Synthetic_Series, S4O_Synthetic_DYNPOST
+
+def S4O_Test_Run(state, nrel):
+
+	#	Run realisations 1 to nrel of the model in state, and return the status and the largest number of runs in
+	#	progress at the same time
+	inprogress = [0]
+	def report(status, level, text):
+		if level == 'status': inprogress[0] = max(inprogress[0], len(status['running']))
+
+	status = S4O_Schedule_Runs(S4O_Assign_Run_Config(state), 1, nrel, report)
+
+	return status, inprogress[0]
+#
+#
+
+def S4O_Test_State(model_dir, nrel, sdtol):
+
+	#	Return the state of a model with default parameters in model_dir/m, run with the synthetic SIMLA two runs at
+	#	a time, with nrel realisations and the maximum change in standard deviation sdtol [%], and generate its input
+	#	files
+	state = S4O_Batch_Initial_State('')
+	state.modelFileDir = str(model_dir)
+	state.modelFileName = 'm'
+	state.modelFilePath = str(model_dir) + '/m.s4o'
+	state.listOfSeedNumbers = [11*(irel + 1) for irel in range(nrel)]
+	state.df_Execution.iloc[1,1] = 0.01
+	state.df_Execution.iloc[3,1] = nrel
+	state.df_Execution.iloc[4,1] = sdtol
+	state.maxRunsPB = 2
+	state.SyntheticRuns = True
+	state.SyntheticRunTime = 0.05
+	state.RunDYNPOSTMPF = False
+	S4O_Write_Input_Files(state, str(model_dir) + '/m', 1, nrel)
+
+	return state
+#
+#
+
+def S4O_Test_Ext_Runs(sdiname):
+
+	#	Return the run numbers of the DYNPOST files listed in the DYNPOST EXT input file, for each MXPLOT card
+	cards = []
+	with open(sdiname, 'r') as sdi:
+		for line in sdi:
+			if line.startswith('#'): continue
+			columns = shlex.split(line)
+			if columns[0] == 'MXPLOT': cards.append([])
+			cards[-1].append(int(columns[-1].split('/')[0][1:]))
+
+	return cards
+#
+#
+
+def test_extremes_input_lists_executed_runs(tmp_path, monkeypatch):
+
+	#	The queued runs are cancelled when the statistics have converged. The DYNPOST EXT input file must then only list
+	#	the runs completed in this execution, also when a cancelled run has a DYNPOST file left from an earlier
+	#	execution, and DYNPOST EXT must find all the DYNPOST files it lists.
+	state = S4O_Test_State(tmp_path, 12, 90.0)
+	mod_path = str(tmp_path) + '/m'
+	S4O_Synthetic_Write_Dyn(mod_path + '/r12/s.dyn', S4O_Synthetic_Series(100, 1.0, 1))
+
+	status = S4O_Schedule_Runs(S4O_Assign_Run_Config(state), 1, 12, lambda status, level, text: None)
+
+	assert len(status['cancelled']) > 0
+	assert S4O_Test_Ext_Runs(mod_path + '/extremes.sdi') == [sorted(status['succeeded']), sorted(status['succeeded'])]
+	assert 12 not in status['succeeded']
+	monkeypatch.chdir(mod_path)
+	assert S4O_Synthetic_DYNPOST('extremes', 0.0, 'Sleep') == 0
+#
+#
+
+def test_rolling_queue(tmp_path):
+
+	#	All runs are run through the rolling queue, never more than maxRunsPB at a time, and all slots are used
+	state = S4O_Test_State(tmp_path, 6, 0.0)
+
+	status, inprogress = S4O_Test_Run(state, 6)
+
+	assert inprogress == 2
+	assert sorted(status['succeeded']) == [1, 2, 3, 4, 5, 6]
+	assert status['failed'] == [] and status['cancelled'] == []
+	assert all(status['runs'][irun]['state'] == 'done' for irun in range(1, 7))
+	assert status['stats']['Realisation'] == [1, 2, 3, 4, 5, 6]
+	assert status['executed'] == 6
+	assert status['complete']
+#
+#
+
+def test_convergence_cancels_queued_runs(tmp_path):
+
+	#	When the change in standard deviation drops below the tolerance, the queued runs are cancelled without being
+	#	started, and only the runs completed are counted as executed
+	state = S4O_Test_State(tmp_path, 12, 90.0)
+	mod_path = str(tmp_path) + '/m'
+
+	status, inprogress = S4O_Test_Run(state, 12)
+
+	assert status['tolno'] > 0
+	assert len(status['cancelled']) > 0
+	assert sorted(status['succeeded'] + status['cancelled']) == list(range(1, 13))
+	for irun in status['cancelled']:
+		assert status['runs'][irun]['state'] == 'cancelled'
+		assert status['runs'][irun]['started'] == 0.0
+		assert not os.path.exists(mod_path + '/r' + str(irun) + '/s.dyn')
+	assert status['executed'] == len(status['succeeded'])
+	assert len(status['stats']['Realisation']) == status['executed']
+	assert status['complete']
+#
+#
+
+def test_resume_skips_completed_runs(tmp_path):
+
+	#	With "Resume", the runs completed earlier with the current input are not run again and give the same
+	#	statistics, and a run whose input has changed is run again
+	state = S4O_Test_State(tmp_path, 4, 0.0)
+	mod_path = str(tmp_path) + '/m'
+	first, inprogress = S4O_Test_Run(state, 4)
+
+	state.ResumeRuns = True
+	state.listOfSeedNumbers[2] = 1234
+	S4O_Write_Input_Files(state, mod_path, 1, 4)
+	status, inprogress = S4O_Test_Run(state, 4)
+
+	assert sorted(status['succeeded']) == [1, 2, 3, 4]
+	for irun in [1, 2, 4]:
+		assert status['runs'][irun]['message'] == 'completed earlier with the current input'
+		assert status['runs'][irun]['started'] == 0.0
+	assert status['runs'][3]['started'] > 0.0
+	assert status['stats']['Max'][0:2] == first['stats']['Max'][0:2]
+	assert status['stats']['Max'][2] != first['stats']['Max'][2]
+#
+#
+
+def test_resume_converged_starts_no_runs(tmp_path):
+
+	#	When the runs skipped by "Resume" already meet the tolerance, the remaining runs are cancelled before any run
+	#	is started
+	state = S4O_Test_State(tmp_path, 8, 0.0)
+	S4O_Test_Run(state, 8)
+
+	state = S4O_Test_State(tmp_path, 16, 90.0)
+	state.ResumeRuns = True
+	status, inprogress = S4O_Test_Run(state, 16)
+
+	assert inprogress == 0
+	assert sorted(status['succeeded']) == list(range(1, 9))
+	assert sorted(status['cancelled']) == list(range(9, 17))
+	assert all(status['runs'][irun]['started'] == 0.0 for irun in range(1, 17))
+	assert status['tolno'] > 0
+#
+#
+
+def test_scratch_and_retention(tmp_path):
+
+	#	Runs in local scratch directories are copied back to the run directories, and the retention policy deletes
+	#	the output files not needed by SIMLA4OBS
+	state = S4O_Test_State(tmp_path, 2, 0.0)
+	state.ScratchRuns = True
+	state.ScratchDir = str(tmp_path) + '/scratch'
+	state.RetentionPolicy = 'Delete'
+	state.RetentionMinMB = 0.0
+	mod_path = str(tmp_path) + '/m'
+
+	status, inprogress = S4O_Test_Run(state, 2)
+
+	assert sorted(status['succeeded']) == [1, 2]
+	for irun in [1, 2]:
+		run_path = mod_path + '/r' + str(irun)
+		assert os.path.exists(run_path + '/s.dyn')
+		assert os.path.exists(run_path + '/s.slf')
+		assert not os.path.exists(run_path + '/simla_print.out')
+	assert glob.glob(str(tmp_path) + '/scratch/*') == []
+#
+#
+
+def test_run_steps_without_generating_inputs(tmp_path):
+
+	#	When the input files were generated earlier, the number of DYNRES steps is assigned from the model without
+	#	writing the input files, and is part of the run hash
+	state = S4O_Test_State(tmp_path, 2, 0.0)
+	nsteps = state.SIMLA_nstep_dynres
+	runhash = S4O_SIMLA_Run_Hash(1, S4O_Assign_Run_Config(state))
+	sifname = str(tmp_path) + '/m/r1/s.sif'
+	modified = os.path.getmtime(sifname)
+
+	state.SIMLA_nstep_dynres = 0
+	assert S4O_SIMLA_Run_Hash(1, S4O_Assign_Run_Config(state)) != runhash
+	S4O_Assign_Run_Steps(state)
+
+	assert nsteps > 0
+	assert state.SIMLA_nstep_dynres == nsteps
+	assert S4O_SIMLA_Run_Hash(1, S4O_Assign_Run_Config(state)) == runhash
+	assert os.path.getmtime(sifname) == modified
+#
+#
+
+def test_runs_without_steps_not_started(tmp_path):
+
+	#	Runs without DYNRES steps (-s2 0) are not started, but listed as failed
+	state = S4O_Test_State(tmp_path, 2, 0.0)
+	state.SIMLA_nstep_dynres = 0
+
+	status, inprogress = S4O_Test_Run(state, 2)
+
+	assert inprogress == 0
+	assert sorted(status['failed']) == [1, 2]
+	assert all(status['runs'][irun]['started'] == 0.0 for irun in [1, 2])
+	assert status['succeeded'] == []
+	assert not os.path.exists(str(tmp_path) + '/m/r1/s.dyn')
+	assert not status['complete']
+#
+#
+
+def test_progress_without_simulated_time(tmp_path, monkeypatch):
+
+	#	When no simulated time is found in the output of the runs, the progress of the runs in progress is estimated
+	#	from their elapsed wall-clock time once a run has finished
+	state = S4O_Test_State(tmp_path, 4, 0.0)
+	monkeypatch.setattr(S4O_SIMLA, 'S4O_Run_Fraction', lambda run_path, tend: 0.0)
+	reports = []
+	def report(status, level, text):
+		if level == 'status' and len(status['running']) > 0: reports.append((status['ndone'], status['progress']))
+
+	S4O_Schedule_Runs(S4O_Assign_Run_Config(state), 1, 4, report)
+
+	assert any(progress > ndone/4.0 for ndone, progress in reports if ndone > 0)
+	assert all(progress < (ndone + 2)/4.0 for ndone, progress in reports)
+#
+#